@@ -1,105 +1,174 @@
 import datetime
-from fastapi import APIRouter, Depends
+from typing import Literal
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
-from api.sign_in_router import get_current_user
-from database.cruds import GoalsCRUD, CategoriesCRUD, TransactionsCRUD, WalletsCRUD, BudgetsCRUD
-from database.database import get_db
+from api.sign_in_router import get_current_principal
+from cache import analytics_cache
+from database.cruds import GoalsCRUD, CategoriesCRUD, BudgetsCRUD, AnalyticsCRUD, RollupsCRUD
+from database.database import get_read_db, DB_READ_YOUR_WRITES_TTL
+from database.models import Goals, Budgets
 from shchemas import UserLoginSchema
 
 analytics_router = APIRouter(prefix='/analytics')
 
 
+async def _cached_response(request: Request, user_id: int, compute, vary: str = '') -> Response:
+    """
+    Ответ с результатом аналитики из кэша пользователя.
+
+    Если ETag из заголовка If-None-Match совпадает с текущим, возвращается 304 Not Modified без вычислений.
+    ETag зависит только от версий данных и параметров запроса.
+    Результат хранится в кэше уже закодированным в JSON (pydantic_core.to_json), попадание отдается без повторного кодирования.
+    Результат, посчитанный на реплике в течение DB_READ_YOUR_WRITES_TTL после смены версии данных, может
+    не содержать последних изменений из-за отставания реплики, поэтому он не кэшируется и отдается без ETag.
+
+    Параметры:
+        request: Request - текущий запрос,
+        user_id: int - уникальный ключ текущего пользователя,
+        compute - асинхронная функция, вычисляющая результат,
+        vary: str - дополнительная часть ключа результата (например, текущая дата).
+
+    Возвращает:
+        Response - ответ с результатом или 304 Not Modified.
+    """
+    key = analytics_cache.key(user_id, f'{request.url.path}?{request.url.query}#{vary}')
+    etag = analytics_cache.etag(key)
+    headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+    if_none_match = request.headers.get('If-None-Match', '')
+    if etag in [tag.strip() for tag in if_none_match.split(',')]:
+        analytics_cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+    body = analytics_cache.get(key)
+    if body is None:
+        body = to_json(await compute())
+        if (getattr(request.state, 'read_replica', False)
+                and analytics_cache.changed_within(user_id, DB_READ_YOUR_WRITES_TTL)):
+            return Response(body, media_type='application/json', headers={'Cache-Control': 'private, no-cache'})
+        analytics_cache.set(key, body)
+    return Response(body, media_type='application/json', headers=headers)
+
+
+def _next_month(moment: datetime.datetime) -> datetime.date:
+    """
+    Получение месяца, до которого (не включительно) берутся помесячные итоги для конца периода.
+
+    Параметры:
+        moment: datetime - конец периода (не включительно).
+
+    Возвращает:
+        date - первый день месяца, следующего за последним месяцем периода.
+    """
+    month = RollupsCRUD.month_of(moment)
+    if moment == datetime.datetime(month.year, month.month, 1):
+        return month
+    return RollupsCRUD.month_of(month + datetime.timedelta(days=31))
+
+
 @analytics_router.get(
     '/goal_progress',
     summary='Отслеживание прогресса в целях.',
     description='Демонстрирует то, на сколько выполнены текущие цели и сколько необходимо копить.'
 )
 async def goal_progress(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        request: Request,
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> list[dict] | str:
     """
     Отслеживание прогресса в целях.
 
     Параметры:
+        request: Request - текущий запрос,
         db: AsyncSession - объект базы данных,
         current_user: UserLoginSchema - текущий авторизованный пользователь.
 
     Возвращает:
         user_goals: list[dict] - кошелек в формате WalletPostSchema.
     """
-    goals = await GoalsCRUD.get_all(db)
-    user_goals = [{'name': goal.name,
-                   'goal': goal.cost,
-                   'amount': goal.actual_amount,
-                   'deadline': goal.deadline
-                   }
-                  for goal in goals if goal.user_id == current_user['user_id']]
-
-    if user_goals:
-        date = datetime.date.today()
-
-        for user_goal in user_goals:
-            if user_goal['deadline'] < date:
-                user_goal['status'] = 'Дедлайн истек.'
-            else:
-                user_goal['status'] = 'Дедлайн не истек.'
-
-            if user_goal['goal'] == 0:
-                user_goal['goal_progress'] = 'Цель не указана.'
-            else:
-                user_goal['goal_progress'] = str(round(user_goal['amount'] / user_goal['goal'] * 100, 2)) + ' %'
-
-            user_goal['days_left'] = (user_goal['deadline'] - date).days if user_goal['deadline'] > date else 0
-            user_goal['money_need'] = user_goal['goal'] - user_goal['amount']
-            if user_goal['days_left'] != 0:
-                user_goal['money_per_day'] = (str(round(user_goal['money_need'] / user_goal['days_left'], 2))
-                                              + ' руб. в день нужно откладывать, чтобы достичь цели к сроку')
-    else:
-        return 'Целей пока нет.'
-    return user_goals
+    async def compute():
+        goals = await GoalsCRUD.get_by_user(db, current_user['user_id'],
+                                            columns=(Goals.name, Goals.cost, Goals.actual_amount, Goals.deadline))
+        user_goals = [{'name': goal.name,
+                       'goal': goal.cost,
+                       'amount': goal.actual_amount,
+                       'deadline': goal.deadline
+                       }
+                      for goal in goals]
+
+        if user_goals:
+            date = datetime.date.today()
+
+            for user_goal in user_goals:
+                if user_goal['deadline'] < date:
+                    user_goal['status'] = 'Дедлайн истек.'
+                else:
+                    user_goal['status'] = 'Дедлайн не истек.'
+
+                if user_goal['goal'] == 0:
+                    user_goal['goal_progress'] = 'Цель не указана.'
+                else:
+                    user_goal['goal_progress'] = str(round(user_goal['amount'] / user_goal['goal'] * 100, 2)) + ' %'
+
+                user_goal['days_left'] = (user_goal['deadline'] - date).days if user_goal['deadline'] > date else 0
+                user_goal['money_need'] = user_goal['goal'] - user_goal['amount']
+                if user_goal['days_left'] != 0:
+                    user_goal['money_per_day'] = (str(round(user_goal['money_need'] / user_goal['days_left'], 2))
+                                                  + ' руб. в день нужно откладывать, чтобы достичь цели к сроку')
+        else:
+            return 'Целей пока нет.'
+        return user_goals
+
+    return await _cached_response(request, current_user['user_id'], compute, vary=str(datetime.date.today()))
 
 
 @analytics_router.get(
     '/money_movement',
     summary='Аналитика движения денег.',
-    description='Демонстрирует сколько денег и на какие категории было потрачено/заработано.'
+    description='Демонстрирует сколько денег и на какие категории было потрачено/заработано. '
+                'В режиме source=rollup суммы берутся из помесячных итогов, период округляется до месяцев.'
 )
 async def money_movement(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        request: Request,
+        source: Literal['transactions', 'rollup'] = Query(default='transactions',
+                                                          description='Источник данных: транзакции или помесячные итоги.'),
+        created_from: datetime.datetime | None = Query(default=None, alias='from',
+                                                       description='Начало периода (включительно).'),
+        created_to: datetime.datetime | None = Query(default=None, alias='to',
+                                                     description='Конец периода (не включительно).'),
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> dict:
     """
-    Аналитика движения денег в определенных категориях.
+    Аналитика движения денег в определенных категориях за период.
 
     Параметры:
+        request: Request - текущий запрос,
+        source: str - источник данных (transactions - транзакции, rollup - помесячные итоги),
+        created_from: datetime | None - начало периода (включительно),
+        created_to: datetime | None - конец периода (не включительно),
         db: AsyncSession - объект базы данных,
         current_user: UserLoginSchema - текущий авторизованный пользователь.
 
     Возвращает:
         money_movement_dict: dict - словарь, содержащий количество потраченных/приобретенных денег в разных категориях.
     """
-    money_movement_dict = {}
-    categories = await CategoriesCRUD.get_all(db)
-    transactions = await TransactionsCRUD.get_all(db)
-    wallets = await WalletsCRUD.get_all(db)
-    user_ids_wallets = [wallet.id for wallet in wallets if wallet.user_id == current_user['user_id']]
-
-    user_transactions = [{'amount': transaction.amount,
-                          'category_id': transaction.category_id
-                          } for transaction in transactions if transaction.wallet_id in user_ids_wallets]
-    for category in categories:
-        summa = 0
-        if transactions:
-            for transaction in user_transactions:
-                if transaction['category_id'] == category.id:
-                    if category.type == 'Income':
-                        summa += transaction['amount']
-                    elif category.type == 'Expense':
-                        summa -= transaction['amount']
-
-            money_movement_dict[category.name] = summa
-    return money_movement_dict
+    async def compute():
+        money_movement_dict = {}
+        if source == 'rollup':
+            movement = await AnalyticsCRUD.money_movement_rollup(
+                db,
+                current_user['user_id'],
+                RollupsCRUD.month_of(created_from) if created_from else None,
+                _next_month(created_to) if created_to else None
+            )
+        else:
+            movement = await AnalyticsCRUD.money_movement(db, current_user['user_id'], created_from, created_to)
+        for category_name, summa in movement:
+            money_movement_dict[category_name] = summa
+        return money_movement_dict
+
+    return await _cached_response(request, current_user['user_id'], compute)
 
 
 @analytics_router.get(
@@ -108,41 +177,46 @@ async def money_movement(
     description='Демонстрирует, сколько денег было вложено в бюджет.'
 )
 async def budgets_state(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        request: Request,
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> dict:
     """
     Аналитика текущих бюджетов пользователя.
 
     Параметры:
+        request: Request - текущий запрос,
         db: AsyncSession - объект базы данных,
         current_user: UserLoginSchema - текущий авторизованный пользователь.
 
     Возвращает:
         budgets_state_dict: dict - словарь, содержащий в каких категориях и сколько средств было вложено в бюджеты пользователя.
     """
-    budgets_state_dict = {}
-    categories = await CategoriesCRUD.get_all(db)
-    budgets = await BudgetsCRUD.get_all(db)
-    user_budgets = [budget for budget in budgets if budget.user_id == current_user['user_id']]
-
-    for category in categories:
-        bud_state = {}
-        if user_budgets:
-            for budget in user_budgets:
-                if budget.category_id == category.id:
-                    if budget.name not in bud_state:
-                        if category.type == 'Income':
-                            bud_state[budget.name] = budget.amount
-                        elif category.type == 'Expense':
-                            bud_state[budget.name] = budget.amount
-                    else:
-                        if category.type == 'Income':
-                            bud_state[budget.name] += budget.amount
-                        elif category.type == 'Expense':
-                            bud_state[budget.name] += budget.amount
-        budgets_state_dict[category.name] = bud_state
-    if budgets_state_dict:
-        return budgets_state_dict
-    else:
-        return {'message': 'Бюджетов нет.'}
+    async def compute():
+        budgets_state_dict = {}
+        categories = (await CategoriesCRUD.get_catalogue(db)).categories
+        user_budgets = await BudgetsCRUD.get_by_user(db, current_user['user_id'],
+                                                     columns=(Budgets.name, Budgets.amount, Budgets.category_id))
+
+        for category in categories:
+            bud_state = {}
+            if user_budgets:
+                for budget in user_budgets:
+                    if budget.category_id == category.id:
+                        if budget.name not in bud_state:
+                            if category.type == 'Income':
+                                bud_state[budget.name] = budget.amount
+                            elif category.type == 'Expense':
+                                bud_state[budget.name] = budget.amount
+                        else:
+                            if category.type == 'Income':
+                                bud_state[budget.name] += budget.amount
+                            elif category.type == 'Expense':
+                                bud_state[budget.name] += budget.amount
+            budgets_state_dict[category.name] = bud_state
+        if budgets_state_dict:
+            return budgets_state_dict
+        else:
+            return {'message': 'Бюджетов нет.'}
+
+    return await _cached_response(request, current_user['user_id'], compute)
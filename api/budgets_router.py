@@ -3,14 +3,17 @@ from fastapi import APIRouter, HTTPException
 from fastapi.params import Depends
 from sqlalchemy.exc import IntegrityError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
-from api.sign_in_router import get_current_user
-from database.database import get_db
+from api.sign_in_router import get_current_user, get_current_principal
+from database.database import get_db, get_read_db
 from database.models import Budgets
 from database.cruds import BudgetsCRUD
+from database.cruds.projection import schema_columns
 from shchemas import BudgetGetSchema, BudgetPostSchema, BudgetSchema, UserLoginSchema
 
 budget_router = APIRouter(prefix='/budgets')
 
+BUDGET_COLUMNS = schema_columns(Budgets, BudgetGetSchema)
+
 
 @budget_router.get(
     '/all',
@@ -19,8 +22,8 @@ budget_router = APIRouter(prefix='/budgets')
     description='Выводит список всех бюджетов пользователя.'
 )
 async def get_all_budgets(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> List[BudgetGetSchema]:
     """
     Получение списка всех бюджетов.
@@ -32,15 +35,16 @@ async def get_all_budgets(
         List[BudgetGetSchema] - список бюджетов в формате BudgetGetSchema.
     """
     try:
-        budgets = await BudgetsCRUD.get_all(db)
-        if not current_user['is_admin']:
-            budgets = [budget for budget in budgets if budget.user_id == current_user['user_id']]
+        if current_user['is_admin']:
+            budgets = await BudgetsCRUD.get_all(db, columns=BUDGET_COLUMNS)
+        else:
+            budgets = await BudgetsCRUD.get_by_user(db, current_user['user_id'], columns=BUDGET_COLUMNS)
         if not budgets:
             raise HTTPException(
                 status_code=404,
                 detail='Бюджеты не найдены.'
             )
-        return [BudgetGetSchema.model_validate(budget.__dict__) for budget in budgets]
+        return [BudgetGetSchema.model_validate(budget) for budget in budgets]
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -61,8 +65,8 @@ async def get_all_budgets(
 )
 async def get_budget_by_id(
         budget_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> BudgetGetSchema:
     """
     Получение бюджета по уникальному ключу.
@@ -81,7 +85,7 @@ async def get_budget_by_id(
                 status_code=404,
                 detail=f'Бюджет с id={budget_id} не найден.'
             )
-        return BudgetGetSchema.model_validate(budget.__dict__)
+        return BudgetGetSchema.model_validate(budget)
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
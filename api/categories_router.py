@@ -4,13 +4,16 @@ from fastapi.params import Depends
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.sign_in_router import get_current_user
-from database.database import get_db
+from database.database import get_db, get_read_db
 from database.models import Categories
 from database.cruds import CategoriesCRUD
+from database.cruds.projection import schema_columns
 from shchemas import CategoryGetSchema, CategoryPostSchema, CategorySchema, UserLoginSchema
 
 category_router = APIRouter(prefix='/categories')
 
+CATEGORY_COLUMNS = schema_columns(Categories, CategoryGetSchema)
+
 
 @category_router.get(
     '/all',
@@ -19,7 +22,7 @@ category_router = APIRouter(prefix='/categories')
     description='Выводит список всех категорий.'
 )
 async def get_all_categories(
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
         current_user: UserLoginSchema = Depends(get_current_user)
 ) -> List[CategoryGetSchema]:
     """
@@ -33,13 +36,13 @@ async def get_all_categories(
     """
     try:
         if current_user['is_admin']:
-            categories = await CategoriesCRUD.get_all(db)
+            categories = await CategoriesCRUD.get_all(db, columns=CATEGORY_COLUMNS)
             if not categories:
                 raise HTTPException(
                     status_code=404,
                     detail='Категории не были найдены.'
                 )
-            return [CategoryGetSchema.model_validate(category.__dict__) for category in categories]
+            return [CategoryGetSchema.model_validate(category) for category in categories]
         else:
             raise HTTPException(
                 status_code=403,
@@ -65,7 +68,7 @@ async def get_all_categories(
 )
 async def get_category_by_id(
         category_id: int,
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
         current_user: UserLoginSchema = Depends(get_current_user)
 ) -> CategoryGetSchema:
     """
@@ -86,7 +89,7 @@ async def get_category_by_id(
                     status_code=404,
                     detail=f'Категория с id={category_id} не была найдена.'
                 )
-            return CategoryGetSchema.model_validate(category.__dict__)
+            return CategoryGetSchema.model_validate(category)
         else:
             raise HTTPException(
                 status_code=403,
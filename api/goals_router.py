@@ -3,14 +3,17 @@ from fastapi import APIRouter, HTTPException
 from fastapi.params import Depends
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from api.sign_in_router import get_current_user
-from database.database import get_db
+from api.sign_in_router import get_current_user, get_current_principal
+from database.database import get_db, get_read_db
 from database.models import Goals
 from database.cruds import GoalsCRUD
+from database.cruds.projection import schema_columns
 from shchemas import GoalSchema, GoalGetSchema, GoalPostSchema, UserLoginSchema
 
 goal_router = APIRouter(prefix='/goals')
 
+GOAL_COLUMNS = schema_columns(Goals, GoalGetSchema)
+
 
 @goal_router.get(
     '/all',
@@ -19,8 +22,8 @@ goal_router = APIRouter(prefix='/goals')
     description='Выводит список всех целей.'
 )
 async def get_all_goals(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> List[GoalGetSchema]:
     """
     Получение списка всех целей.
@@ -32,15 +35,16 @@ async def get_all_goals(
         List[GoalGetSchema] - список целей в формате GoalGetSchema.
     """
     try:
-        goals = await GoalsCRUD.get_all(db)
-        if not current_user['is_admin']:
-            goals = [goal for goal in goals if goal.user_id == current_user['user_id']]
+        if current_user['is_admin']:
+            goals = await GoalsCRUD.get_all(db, columns=GOAL_COLUMNS)
+        else:
+            goals = await GoalsCRUD.get_by_user(db, current_user['user_id'], columns=GOAL_COLUMNS)
         if not goals:
             raise HTTPException(
                 status_code=404,
                 detail='Цели не были найдены.'
             )
-        return [GoalGetSchema.model_validate(goal.__dict__) for goal in goals]
+        return [GoalGetSchema.model_validate(goal) for goal in goals]
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -61,8 +65,8 @@ async def get_all_goals(
 )
 async def get_goal_by_id(
         goal_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> GoalGetSchema:
     """
     Получение цели по уникальному ключу.
@@ -81,7 +85,7 @@ async def get_goal_by_id(
                 status_code=404,
                 detail=f'Цель с id={goal_id} не была найдена.'
             )
-        return GoalGetSchema.model_validate(goal.__dict__)
+        return GoalGetSchema.model_validate(goal)
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+from fastapi import Depends, Header, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from api.sign_in_router import get_current_user
+from database.cruds import IdempotencyKeysCRUD
+from database.database import get_db
+from database.models import IdempotencyKeys
+from shchemas import UserLoginSchema
+
+load_dotenv()
+IDEMPOTENCY_KEY_TTL = timedelta(seconds=int(os.getenv('IDEMPOTENCY_KEY_TTL', 24 * 60 * 60)))
+
+
+class Idempotency:
+    """
+    Защита денежной операции от повторного выполнения по заголовку Idempotency-Key.
+
+    Если заголовок не передан, операция выполняется как обычно.
+
+    Параметры:
+        db: AsyncSession - объект базы данных,
+        user_id: int - уникальный ключ текущего пользователя,
+        key: str | None - ключ идемпотентности,
+        request_hash: str - хэш запроса (метод, путь, параметры и тело).
+    """
+
+    def __init__(self, db: AsyncSession, user_id: int, key: str | None, request_hash: str):
+        self.db = db
+        self.user_id = user_id
+        self.key = key
+        self.request_hash = request_hash
+
+    async def replay(self):
+        """
+        Получение сохраненного результата ранее выполненного запроса с тем же ключом.
+
+        Возвращает:
+            response - сохраненный ответ или None, если запрос с таким ключом еще не выполнялся.
+        """
+        if self.key is None:
+            return None
+        record = await IdempotencyKeysCRUD.get(self.db, self.user_id, self.key)
+        if record is None:
+            return None
+        if record.created_at < datetime.now() - IDEMPOTENCY_KEY_TTL:
+            await IdempotencyKeysCRUD.delete(self.db, self.user_id, self.key)
+            return None
+        if record.request_hash != self.request_hash:
+            raise HTTPException(
+                status_code=422,
+                detail='Ключ идемпотентности уже использован для другого запроса.'
+            )
+        return json.loads(record.response)
+
+    async def save(self, response, status_code: int = 200):
+        """
+        Сохранение результата запроса в той же транзакции, что и сама операция.
+
+        Параметры:
+            response - ответ операции,
+            status_code: int - код ответа.
+
+        Возвращает:
+            response - тот же ответ.
+        """
+        if self.key is None:
+            return response
+        try:
+            await IdempotencyKeysCRUD.create(self.db, IdempotencyKeys(
+                user_id=self.user_id,
+                key=self.key,
+                request_hash=self.request_hash,
+                status_code=status_code,
+                response=json.dumps(jsonable_encoder(response))
+            ))
+        except IntegrityError:
+            raise HTTPException(
+                status_code=409,
+                detail='Запрос с таким ключом идемпотентности уже выполняется.'
+            )
+        return response
+
+
+async def get_idempotency(
+        request: Request,
+        idempotency_key: str | None = Header(default=None, alias='Idempotency-Key', min_length=1, max_length=255),
+        db: AsyncSession = Depends(get_db),
+        current_user: UserLoginSchema = Depends(get_current_user)
+) -> Idempotency:
+    """
+    Зависимость, создающая защиту от повторного выполнения для текущего запроса.
+
+    Параметры:
+        request: Request - текущий запрос,
+        idempotency_key: str | None - значение заголовка Idempotency-Key,
+        db: AsyncSession - объект базы данных,
+        current_user: UserLoginSchema - текущий авторизованный пользователь.
+
+    Возвращает:
+        Idempotency - объект защиты от повторного выполнения.
+    """
+    request_hash = hashlib.sha256()
+    request_hash.update(f'{request.method} {request.url.path}?{request.url.query}\n'.encode())
+    request_hash.update(await request.body())
+    return Idempotency(db, current_user['user_id'], idempotency_key, request_hash.hexdigest())
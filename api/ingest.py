@@ -0,0 +1,212 @@
+import os
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+from dotenv import load_dotenv
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from cache import TTLCache
+from database.cruds import CategoriesCRUD, TransactionsCRUD, WalletsCRUD
+from database.models.categories import CatTypes
+from shchemas import TransactionPostSchema, UserLoginSchema
+
+load_dotenv()
+IMPORT_ERRORS_LIMIT = 100
+# Состояние загрузок выписок в памяти процесса: не переживает перезапуск и не общее для нескольких процессов,
+# надежное возобновление - по offset, который передает клиент.
+import_progress = TTLCache(
+    maxsize=int(os.getenv('IMPORT_PROGRESS_SIZE', 1024)),
+    ttl=float(os.getenv('IMPORT_PROGRESS_TTL', 24 * 60 * 60))
+)
+
+
+async def ingest_transactions(
+        db: AsyncSession,
+        transactions: list[TransactionPostSchema],
+        current_user: UserLoginSchema,
+        start_index: int = 0
+) -> list[dict]:
+    """
+    Добавление пачки транзакций с изменением балансов кошельков.
+
+    Принадлежность кошельков и типы категорий проверяются одним запросом на пачку,
+    балансы меняются одним UPDATE на кошелек (на сумму всех его транзакций: доходы со знаком плюс,
+    расходы со знаком минус), транзакции добавляются одним INSERT.
+    Если баланс кошелька уходит в минус, все транзакции этого кошелька отклоняются.
+
+    Параметры:
+        db: AsyncSession - объект базы данных,
+        transactions: list[TransactionPostSchema] - транзакции в формате TransactionPostSchema,
+        current_user: UserLoginSchema - текущий авторизованный пользователь,
+        start_index: int - порядковый номер первой транзакции пачки.
+
+    Возвращает:
+        results: list[dict] - результат обработки каждой транзакции в формате TransactionBulkResultSchema.
+    """
+    results = [{'index': start_index + i, 'status': 'created', 'id': None, 'detail': None}
+               for i in range(len(transactions))]
+    if not transactions:
+        return results
+
+    user_id = None if current_user['is_admin'] else current_user['user_id']
+    wallet_ids = await WalletsCRUD.get_ids(db, {item.wallet_id for item in transactions}, user_id)
+    category_types = await CategoriesCRUD.get_types(db, {item.category_id for item in transactions})
+
+    deltas = defaultdict(Decimal)
+    for result, item in zip(results, transactions):
+        if item.wallet_id not in wallet_ids:
+            result.update(status='rejected', detail='Такой кошелек не найден у пользователя.')
+        elif item.category_id not in category_types:
+            result.update(status='rejected', detail='Такая категория не найдена.')
+        elif category_types[item.category_id] == CatTypes.Income:
+            deltas[item.wallet_id] += item.amount
+        else:
+            deltas[item.wallet_id] -= item.amount
+
+    rejected_wallets = set()
+    for wallet_id in sorted(deltas):
+        if deltas[wallet_id] and await WalletsCRUD.change_amount(db, wallet_id, deltas[wallet_id]) is None:
+            rejected_wallets.add(wallet_id)
+
+    accepted = []
+    for result, item in zip(results, transactions):
+        if result['status'] != 'created':
+            continue
+        if item.wallet_id in rejected_wallets:
+            result.update(status='rejected', detail='Баланс не может быть отрицательным.')
+            continue
+        accepted.append((result, item.model_dump()))
+
+    ids = await TransactionsCRUD.create_many(db, [row for _, row in accepted])
+    for (result, _), transaction_id in zip(accepted, ids):
+        result['id'] = transaction_id
+    return results
+
+
+class StatementMapping:
+    """
+    Правила сопоставления строк выписки с полями транзакций.
+
+    Категория берется из колонки категории (уникальный ключ или название). Если колонки нет,
+    по знаку суммы выбирается категория дохода или расхода. Сумма транзакции сохраняется по модулю.
+
+    Параметры:
+        amount_column: str - колонка с суммой,
+        wallet_column: str | None - колонка с уникальным ключом кошелька,
+        category_column: str | None - колонка с категорией,
+        wallet_id: int | None - кошелек для строк без кошелька,
+        income_category_id: int | None - категория для поступлений,
+        expense_category_id: int | None - категория для списаний,
+        category_ids: dict - словарь {название категории: уникальный ключ}.
+    """
+
+    def __init__(
+            self,
+            amount_column: str = 'amount',
+            wallet_column: str | None = 'wallet_id',
+            category_column: str | None = 'category',
+            wallet_id: int | None = None,
+            income_category_id: int | None = None,
+            expense_category_id: int | None = None,
+            category_ids: dict | None = None
+    ):
+        self.amount_column = amount_column
+        self.wallet_column = wallet_column
+        self.category_column = category_column
+        self.wallet_id = wallet_id
+        self.income_category_id = income_category_id
+        self.expense_category_id = expense_category_id
+        self.category_ids = category_ids or {}
+
+    def to_transaction(self, row: dict) -> TransactionPostSchema:
+        """
+        Преобразование строки выписки в транзакцию с проверками TransactionPostSchema.
+
+        Параметры:
+            row: dict - строка выписки.
+
+        Возвращает:
+            TransactionPostSchema - транзакция в формате TransactionPostSchema.
+        """
+        try:
+            amount = Decimal((row.get(self.amount_column) or '').strip().replace(' ', '').replace(',', '.'))
+        except InvalidOperation:
+            raise ValueError('Некорректная сумма.')
+        if not amount.is_finite():
+            raise ValueError('Некорректная сумма.')
+
+        wallet_id = (row.get(self.wallet_column) or '').strip() if self.wallet_column else ''
+        wallet_id = wallet_id or self.wallet_id
+        if not wallet_id:
+            raise ValueError('Не указан кошелек.')
+
+        category = (row.get(self.category_column) or '').strip() if self.category_column else ''
+        if category.isdigit():
+            category_id = int(category)
+        elif category:
+            category_id = self.category_ids.get(category)
+            if category_id is None:
+                raise ValueError('Такая категория не найдена.')
+        else:
+            category_id = self.income_category_id if amount > 0 else self.expense_category_id
+            if category_id is None:
+                raise ValueError('Не указана категория.')
+
+        try:
+            return TransactionPostSchema(amount=abs(amount), wallet_id=wallet_id, category_id=category_id)
+        except ValidationError as e:
+            raise ValueError(e.errors()[0]['msg'])
+
+
+async def import_statement(
+        db: AsyncSession,
+        rows,
+        mapping: StatementMapping,
+        current_user: UserLoginSchema,
+        progress: dict,
+        chunk_size: int = 1000
+) -> dict:
+    """
+    Загрузка строк выписки пачками с фиксацией транзакции БД после каждой пачки.
+
+    Строки до progress['offset'] пропускаются, что позволяет продолжить прерванную загрузку.
+    После фиксации пачки progress['offset'] указывает на первую необработанную строку.
+
+    Параметры:
+        db: AsyncSession - объект базы данных,
+        rows - асинхронный итератор строк выписки,
+        mapping: StatementMapping - правила сопоставления строк выписки с полями транзакций,
+        current_user: UserLoginSchema - текущий авторизованный пользователь,
+        progress: dict - состояние загрузки в формате StatementImportSchema,
+        chunk_size: int - количество строк в пачке.
+
+    Возвращает:
+        progress: dict - состояние загрузки после обработки всех строк.
+    """
+    async def flush(end: int):
+        results = await ingest_transactions(db, [item for _, item in items], current_user)
+        for (index, _), result in zip(items, results):
+            if result['status'] == 'rejected':
+                errors.append({'index': index, 'detail': result['detail']})
+        await db.commit()
+        progress['created'] += sum(result['status'] == 'created' for result in results)
+        progress['rejected'] += len(errors)
+        progress['errors'] = (progress['errors'] + sorted(errors, key=lambda error: error['index']))[:IMPORT_ERRORS_LIMIT]
+        progress['offset'] = end
+        items.clear()
+        errors.clear()
+
+    items, errors = [], []
+    index = 0
+    async for row in rows:
+        if index >= progress['offset']:
+            try:
+                items.append((index, mapping.to_transaction(row)))
+            except ValueError as e:
+                errors.append({'index': index, 'detail': str(e)})
+        index += 1
+        if index - progress['offset'] >= chunk_size:
+            await flush(index)
+    if index > progress['offset']:
+        await flush(index)
+    progress['status'] = 'completed'
+    return progress
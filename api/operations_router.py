@@ -1,13 +1,35 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
+from api.idempotency import Idempotency, get_idempotency
 from api.sign_in_router import get_current_user
-from database.cruds import WalletsCRUD, category, CategoriesCRUD, TransactionsCRUD
+from database.cruds import WalletsCRUD, CategoriesCRUD, TransactionsCRUD
 from database.database import get_db
-from database.models import Transactions
+from database.models import Transactions, Wallets
 from shchemas import UserLoginSchema, TransactionPostSchema, WalletGetSchema
 
 operation_router = APIRouter(prefix='/operation')
 
+
+async def get_operation_category(db: AsyncSession, category_id: int):
+    """
+    Получение категории операции из справочника категорий.
+
+    Параметры:
+        db: AsyncSession - объект базы данных,
+        category_id: int - уникальный ключ категории.
+
+    Возвращает:
+        category: CategoryEntry - запись справочника; если категории нет - ошибка 404.
+    """
+    category = await CategoriesCRUD.get_cached(db, category_id)
+    if category is None:
+        raise HTTPException(
+            status_code=404,
+            detail='Такая категория не найдена.'
+        )
+    return category
+
+
 @operation_router.post(
     '/transfer_between_my_wallets',
     summary='Перевод между счетами.',
@@ -17,7 +39,8 @@ async def transfer_between_my_wallets(
         target_wallet_id: int,
         transaction: TransactionPostSchema,
         db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        current_user: UserLoginSchema = Depends(get_current_user),
+        idempotency: Idempotency = Depends(get_idempotency)
 ):
     """
     Перевод средств между своими счетами.
@@ -26,18 +49,20 @@ async def transfer_between_my_wallets(
         target_wallet_id: int - уникальный идентификатор кошелька, на который совершается перевод,
         transaction: TransactionPostSchema - сумма, которая кладется или снимается с конкретного кошелька,
         db: AsyncSession - объект базы данных,
-        current_user: UserLoginSchema - текущий авторизованный пользователь.
+        current_user: UserLoginSchema - текущий авторизованный пользователь,
+        idempotency: Idempotency - защита от повторного выполнения по заголовку Idempotency-Key.
 
     Возвращает:
         wallets_state: dict - словарь, в котором содержатся балансы двух кошельков после перевода.
     """
-    wallets = await WalletsCRUD.get_all(db)
-    user_wallets = [wallet for wallet in wallets if wallet.user_id == current_user['user_id']
-                    and wallet.type_of_wallet != 'Cash']
-    target_wallet = await WalletsCRUD.get_by_id(db, target_wallet_id)
-    start_wallet = await WalletsCRUD.get_by_id(db, transaction.wallet_id)
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+
+    target_wallet = await WalletsCRUD.get_by_id_for_user(db, target_wallet_id, current_user['user_id'])
+    start_wallet = await WalletsCRUD.get_by_id_for_user(db, transaction.wallet_id, current_user['user_id'])
 
-    if (target_wallet not in user_wallets) or (start_wallet not in user_wallets):
+    if not target_wallet or not start_wallet:
         raise HTTPException(
             status_code=404,
             detail='Такой кошелек не найден.'
@@ -48,22 +73,28 @@ async def transfer_between_my_wallets(
             status_code=403,
             detail='Нельзя переводить наличные деньги.'
         )
+
+    if target_wallet.id == start_wallet.id:
+        raise HTTPException(
+            status_code=403,
+            detail='Нельзя переводить деньги на тот же кошелек.'
+        )
+    category = await get_operation_category(db, transaction.category_id)
     try:
-        category = await CategoriesCRUD.get_by_id(db, transaction.category_id)
         if category.type == 'Income':
-            new_amount_target_wallet = target_wallet.amount - transaction.amount
-            new_amount_start_wallet = start_wallet.amount + transaction.amount
+            balances = await WalletsCRUD.transfer(db, target_wallet.id, start_wallet.id, transaction.amount)
+            if balances:
+                new_amount_target_wallet, new_amount_start_wallet = balances
         else:
-            new_amount_target_wallet = target_wallet.amount + transaction.amount
-            new_amount_start_wallet = start_wallet.amount - transaction.amount
-        if new_amount_start_wallet < 0 or new_amount_target_wallet < 0:
+            balances = await WalletsCRUD.transfer(db, start_wallet.id, target_wallet.id, transaction.amount)
+            if balances:
+                new_amount_start_wallet, new_amount_target_wallet = balances
+        if not balances:
             raise HTTPException(
                 status_code=409,
                 detail='Баланс не может быть отрицательным.'
             )
 
-        await WalletsCRUD.update(db, target_wallet_id, {'amount': new_amount_target_wallet})
-        await WalletsCRUD.update(db, start_wallet.id, {'amount': new_amount_start_wallet})
         await TransactionsCRUD.create(db, Transactions(**transaction.model_dump()))
     except Exception as e:
         raise HTTPException(
@@ -75,7 +106,7 @@ async def transfer_between_my_wallets(
         'start_wallet_amount': new_amount_start_wallet,
         'target_wallet_amount': new_amount_target_wallet
     }
-    return wallets_state
+    return await idempotency.save(wallets_state)
 
 
 @operation_router.post(
@@ -87,7 +118,8 @@ async def transfer_money_to_user(
         target_user_id: int,
         transaction: TransactionPostSchema,
         db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        current_user: UserLoginSchema = Depends(get_current_user),
+        idempotency: Idempotency = Depends(get_idempotency)
 ) -> int:
     """
     Перевод денег конкретному пользователю.
@@ -96,40 +128,47 @@ async def transfer_money_to_user(
         target_user_id: int - уникальный идентификатор пользователя, на чей кошелек совершается перевод,
         transaction: TransactionPostSchema - сумма, которая снимается с конкретного кошелька,
         db: AsyncSession - объект базы данных,
-        current_user: UserLoginSchema - текущий авторизованный пользователь.
+        current_user: UserLoginSchema - текущий авторизованный пользователь,
+        idempotency: Idempotency - защита от повторного выполнения по заголовку Idempotency-Key.
 
     Возвращает:
         my_balance: int - баланс счета после перевода денег.
     """
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+
     if target_user_id == current_user['user_id']:
         raise HTTPException(
             status_code=403,
             detail='Нельзя перевести деньги себе же.'
         )
 
-    wallets = await WalletsCRUD.get_all(db)
+    wallets = await WalletsCRUD.get_by_user(db, target_user_id, columns=(Wallets.id, Wallets.type_of_wallet))
 
-    user_wallets = [wallet for wallet in wallets if wallet.user_id == target_user_id
-                    and wallet.type_of_wallet != 'Cash']
+    user_wallets = [wallet for wallet in wallets if wallet.type_of_wallet != 'Cash']
     if not user_wallets:
         raise HTTPException(
             status_code=403,
             detail='Кошельки пользователя не найдены.'
         )
 
-    my_wallet = await WalletsCRUD.get_by_id(db, transaction.wallet_id)
+    my_wallet = await WalletsCRUD.get_by_id_for_user(db, transaction.wallet_id, current_user['user_id'])
+    if not my_wallet:
+        raise HTTPException(
+            status_code=403,
+            detail='Данный кошелек не принадлежит пользователю.'
+        )
+    category = await get_operation_category(db, transaction.category_id)
     try:
-        category = await CategoriesCRUD.get_by_id(db, transaction.category_id)
         if category.type == 'Expense':
-            my_balance = my_wallet.amount - transaction.amount
-            new_user_balance = user_wallets[0].amount + transaction.amount
-            if new_user_balance < 0 or my_balance < 0:
+            balances = await WalletsCRUD.transfer(db, my_wallet.id, user_wallets[0].id, transaction.amount)
+            if not balances:
                 raise HTTPException(
                     status_code=409,
                     detail='Баланс не может быть отрицательным.'
                 )
-            await WalletsCRUD.update(db, my_wallet.id, {'amount': my_balance})
-            await WalletsCRUD.update(db, user_wallets[0].id, {'amount': new_user_balance})
+            my_balance = balances[0]
             await TransactionsCRUD.create(db, Transactions(**transaction.model_dump()))
         else:
             raise HTTPException(
@@ -141,7 +180,7 @@ async def transfer_money_to_user(
             status_code=500,
             detail=f'Ошибка сервера: {e}'
         )
-    return my_balance
+    return await idempotency.save(my_balance)
 
 
 
@@ -154,7 +193,8 @@ async def transfer_money_to_user(
 async def buy_something(
         purchase: TransactionPostSchema,
         db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        current_user: UserLoginSchema = Depends(get_current_user),
+        idempotency: Idempotency = Depends(get_idempotency)
 ) -> WalletGetSchema:
     """
     Совершение любой покупки.
@@ -162,30 +202,31 @@ async def buy_something(
     Параметры:
         purchase: TransactionPostSchema - покупка в формате TransactionPostSchema,
         db: AsyncSession - объект базы данных,
-        current_user: UserLoginSchema - текущий авторизованный пользователь.
+        current_user: UserLoginSchema - текущий авторизованный пользователь,
+        idempotency: Idempotency - защита от повторного выполнения по заголовку Idempotency-Key.
 
     Возвращает:
         current_wallet: WalletGetSchema - состояние кошелька после покупки.
     """
-    wallets = await WalletsCRUD.get_all(db)
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
 
-    user_wallets = [wallet for wallet in wallets if wallet.user_id == current_user['user_id']]
-    my_wallet = await WalletsCRUD.get_by_id(db, purchase.wallet_id)
-    if my_wallet not in user_wallets:
+    my_wallet = await WalletsCRUD.get_by_id_for_user(db, purchase.wallet_id, current_user['user_id'])
+    if not my_wallet:
         raise HTTPException(
             status_code=403,
             detail='Данный кошелек не принадлежит пользователю.'
         )
+    category = await get_operation_category(db, purchase.category_id)
     try:
-        category = await CategoriesCRUD.get_by_id(db, purchase.category_id)
         if category.type == 'Expense':
-            new_balance = my_wallet.amount - purchase.amount
-            if new_balance < 0:
+            new_balance = await WalletsCRUD.change_amount(db, my_wallet.id, -purchase.amount)
+            if new_balance is None:
                 raise HTTPException(
                     status_code=409,
                     detail='Баланс не может быть отрицательным.'
                 )
-            await WalletsCRUD.update(db, my_wallet.id, {'amount': new_balance})
             await TransactionsCRUD.create(db, Transactions(**purchase.model_dump()))
         else:
             raise HTTPException(
@@ -197,4 +238,5 @@ async def buy_something(
             status_code=500,
             detail=f'Ошибка сервера: {e}'
         )
-    return my_wallet
\ No newline at end of file
+    current_wallet = WalletGetSchema.model_validate(my_wallet).model_copy(update={'amount': new_balance})
+    return await idempotency.save(current_wallet)
@@ -1,9 +1,10 @@
 from fastapi import APIRouter
 from fastapi.params import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from api.sign_in_router import get_current_user
+from api.sign_in_router import get_current_principal
 from database.cruds import UsersCRUD, WalletsCRUD, BudgetsCRUD, GoalsCRUD
-from database.database import get_db
+from database.models import Users, Wallets, Budgets, Goals
+from database.database import get_read_db
 from shchemas import UserLoginSchema
 
 personal_cabinet_router = APIRouter(prefix='/personal_cabinet')
@@ -15,30 +16,32 @@ personal_cabinet_router = APIRouter(prefix='/personal_cabinet')
     description='Выводит все данные касательно пользователя и его финансов.'
 )
 async def my_data(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ):
     data = {}
-    user = await UsersCRUD.get_by_id(db, current_user['user_id'])
+    user = await UsersCRUD.get_by_id(db, current_user['user_id'], columns=(Users.name, Users.lastname, Users.login))
 
-    wallets = await WalletsCRUD.get_all(db)
+    wallets = await WalletsCRUD.get_by_user(db, current_user['user_id'],
+                                            columns=(Wallets.amount, Wallets.type_of_wallet))
     user_wallets = [ {'amount': wallet.amount, 'type_of_wallet': wallet.type_of_wallet}
-                     for wallet in wallets if wallet.user_id == current_user['user_id']]
+                     for wallet in wallets]
     if not user_wallets:
         user_wallets = 'Кошельков пока нет.'
 
-    budgets = await BudgetsCRUD.get_all(db)
+    budgets = await BudgetsCRUD.get_by_user(db, current_user['user_id'], columns=(Budgets.name, Budgets.amount))
     user_budgets = [ {'name': budget.name, 'amount': budget.amount}
-                     for budget in budgets if budget.user_id == current_user['user_id']]
+                     for budget in budgets]
     if not user_budgets:
         user_budgets = 'Бюджетов пока нет.'
 
-    goals = await GoalsCRUD.get_all(db)
+    goals = await GoalsCRUD.get_by_user(db, current_user['user_id'],
+                                        columns=(Goals.name, Goals.actual_amount, Goals.deadline, Goals.cost))
     user_goals = [ {'name': goal.name,
                     'amount': goal.actual_amount,
                     'deadline': goal.deadline,
                     'goal': goal.cost}
-                    for goal in goals if goal.user_id == current_user['user_id']]
+                    for goal in goals]
     if not user_goals:
         user_goals = 'Целей пока нет.'
 
@@ -0,0 +1,135 @@
+import logging
+import os
+from dotenv import load_dotenv
+from database.query_stats import QueryStats, track_queries
+
+load_dotenv()
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """
+    Эндпоинт выполнил больше SQL-запросов, чем разрешено бюджетом, или повторил один запрос в цикле (N+1).
+    Выбрасывается только в строгом режиме.
+    """
+
+
+class QueryBudgets:
+    """
+    Ограничения количества SQL-запросов на один HTTP-запрос.
+
+    Параметры:
+        default: int | None - бюджет для всех эндпоинтов (None - без ограничения),
+        routes: dict | None - бюджеты отдельных эндпоинтов по ключу 'METHOD /path/{param}',
+        repeat_threshold: int - с какого количества одинаковых запросов считать их признаком N+1,
+        strict: bool - выбрасывать QueryBudgetExceeded вместо записи предупреждения в лог.
+    """
+
+    def __init__(self, default: int | None = None, routes: dict | None = None, repeat_threshold: int = 5,
+                 strict: bool = False):
+        self.default = default
+        self.routes = dict(routes or {})
+        self.repeat_threshold = repeat_threshold
+        self.strict = strict
+
+    def limit(self, route: str) -> int | None:
+        """
+        Бюджет эндпоинта.
+
+        Параметры:
+            route: str - ключ эндпоинта 'METHOD /path/{param}'.
+
+        Возвращает:
+            int | None - допустимое количество запросов или None, если ограничения нет.
+        """
+        return self.routes.get(route, self.default)
+
+    def violations(self, route: str, stats: QueryStats) -> list[str]:
+        """
+        Нарушения бюджета и повторяющиеся запросы (N+1) эндпоинта.
+
+        Параметры:
+            route: str - ключ эндпоинта 'METHOD /path/{param}',
+            stats: QueryStats - счетчики запросов.
+
+        Возвращает:
+            list[str] - описания нарушений (пустой список, если их нет).
+        """
+        problems = []
+        limit = self.limit(route)
+        if limit is not None and stats.queries > limit:
+            problems.append(f'{route}: {stats.queries} SQL-запросов при бюджете {limit}')
+        for statement, count in stats.repeated(self.repeat_threshold).items():
+            problems.append(f'{route}: запрос выполнен {count} раз (возможен N+1): {" ".join(statement.split())}')
+        return problems
+
+
+query_budgets = QueryBudgets(
+    default=int(os.getenv('QUERY_BUDGET')) if os.getenv('QUERY_BUDGET') else None,
+    repeat_threshold=int(os.getenv('QUERY_REPEAT_THRESHOLD', 5)),
+    strict=os.getenv('QUERY_BUDGET_STRICT', '').lower() in ('1', 'true', 'yes')
+)
+
+
+def _route_key(scope) -> str:
+    """
+    Ключ эндпоинта: метод и шаблон пути маршрута (без значений параметров), для неизвестных путей - сам путь.
+    """
+    route = scope.get('route')
+    return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+
+def server_timing(stats: QueryStats) -> str:
+    """
+    Значение заголовка Server-Timing: суммарное время запросов к БД в миллисекундах,
+    количество запросов и измененных строк.
+
+    Параметры:
+        stats: QueryStats - счетчики запросов.
+
+    Возвращает:
+        str - значение заголовка.
+    """
+    return f'db;dur={stats.duration * 1000:.3f};desc="queries={stats.queries} affected_rows={stats.affected_rows}"'
+
+
+class QueryStatsMiddleware:
+    """
+    Подсчет SQL-запросов, измененных строк и времени работы БД для каждого HTTP-запроса.
+
+    Счетчики на момент начала ответа отдаются в заголовке Server-Timing. Итоговые счетчики пишутся в лог
+    после отправки всего тела ответа, поэтому в них попадают и запросы, выполненные во время потоковой
+    отдачи (StreamingResponse). Превышение бюджета query_budgets и повторяющиеся запросы (N+1) пишутся
+    в лог как предупреждение, а в строгом режиме (QUERY_BUDGET_STRICT=1, например в тестах) приводят
+    к QueryBudgetExceeded - до отправки ответа или после потоковой отдачи.
+    """
+
+    def __init__(self, app, budgets: QueryBudgets = query_budgets):
+        self.app = app
+        self.budgets = budgets
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_stats(message):
+                if message['type'] == 'http.response.start':
+                    problems = self.budgets.violations(_route_key(scope), stats)
+                    if problems and self.budgets.strict:
+                        raise QueryBudgetExceeded('; '.join(problems))
+                    timing = (b'server-timing', server_timing(stats).encode())
+                    message['headers'] = [*message.get('headers', []), timing]
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+            route = _route_key(scope)
+            logger.info('%s: %d SQL-запросов, %d строк изменено, %.1f ms', route, stats.queries,
+                        stats.affected_rows, stats.duration * 1000)
+            problems = self.budgets.violations(route, stats)
+            if problems and self.budgets.strict:
+                raise QueryBudgetExceeded('; '.join(problems))
+            for problem in problems:
+                logger.warning(problem)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Response, HTTPException
 from fastapi.params import Depends
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from cache import principal_cache, token_versions
 from database.cruds import UsersCRUD
 from database.database import get_db
 from shchemas import UserLoginSchema
@@ -30,7 +31,12 @@ security = AuthX(config=config)
 async def auth(user_data: UserLoginSchema, response: Response, db: AsyncSession = Depends(get_db)) -> dict:
     user = await UsersCRUD.get_by_login(db, user_data.login)
     if user_data.login == user.login and user_data.password == user.password:
-        token = security.create_access_token(uid=str(user.id))
+        token_version = user.token_version or 0
+        token = security.create_access_token(
+            uid=str(user.id),
+            data={'login': user.login, 'is_admin': user.is_admin, 'ver': token_version}
+        )
+        await token_versions.set(user.id, token_version)
         response.set_cookie(config.JWT_ACCESS_COOKIE_NAME, token)
         return {'access_token': token}
     else:
@@ -96,6 +102,8 @@ async def get_current_user(
 ) -> dict:
     """
     Получение данных текущего пользователя по JWT токену.
+
+    Данные пользователя кэшируются по subject токена, повторные запросы не обращаются к БД.
     """
     try:
         user_id = token.__dict__['sub']
@@ -104,26 +112,80 @@ async def get_current_user(
                 status_code=401,
                 detail='Неверный токен: отсутствует user_id.'
             )
-        user = await UsersCRUD.get_by_id(db, int(user_id))
-        if not user:
+        principal = await principal_cache.get(user_id)
+        if principal is None:
+            user = await UsersCRUD.get_by_id(db, int(user_id))
+            if not user:
+                raise HTTPException(
+                    status_code=404,
+                    detail='Пользователь не найден.'
+                )
+            principal = {
+                'user_id': user.id,
+                'login': user.login,
+                'name': user.name,
+                'passport': user.passport,
+                'is_admin': user.is_admin,
+                'token_version': user.token_version or 0
+            }
+            await principal_cache.set(user_id, principal)
+        if getattr(token, 'ver', 0) < principal.get('token_version', 0):
             raise HTTPException(
-                status_code=404,
-                detail='Пользователь не найден.'
+                status_code=401,
+                detail='Токен отозван. Авторизируйтесь повторно.'
             )
-        return {
-            'user_id': user.id,
-            'login': user.login,
-            'name': user.name,
-            'passport': user.passport,
-            'is_admin': user.is_admin
-        }
+        return principal
     except ValueError:
         raise HTTPException(
             status_code=400,
             detail='Неверный формат user_id в токене.'
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f'Ошибка сервера: {str(e)}'
         )
+
+
+async def get_current_principal(
+        token=Depends(security.access_token_required),
+        db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Получение данных текущего пользователя из подписанных полей JWT токена без обращения к БД.
+
+    Токен содержит логин, признак администратора и версию токенов пользователя. Отзыв токена проверяется
+    по реестру версий, а если версии в нем нет - по БД. Для токенов без этих полей данные пользователя
+    берутся через get_current_user.
+
+    Возвращает:
+        {
+            'user_id': user_id,
+            'login': login,
+            'is_admin': is_admin
+        } - данные текущего пользователя.
+    """
+    user_id = token.sub
+    is_admin = getattr(token, 'is_admin', None)
+    if is_admin is None:
+        return await get_current_user(token, db)
+    try:
+        principal = {
+            'user_id': int(user_id),
+            'login': getattr(token, 'login', None),
+            'is_admin': bool(is_admin)
+        }
+    except (TypeError, ValueError):
+        raise HTTPException(
+            status_code=400,
+            detail='Неверный формат user_id в токене.'
+        )
+    if await token_versions.is_revoked(user_id, getattr(token, 'ver', 0),
+                                       load=lambda: UsersCRUD.get_token_version(db, principal['user_id'])):
+        raise HTTPException(
+            status_code=401,
+            detail='Токен отозван. Авторизируйтесь повторно.'
+        )
+    return principal
@@ -0,0 +1,116 @@
+import codecs
+import csv
+import re
+from collections import deque
+
+MAX_LINE_LENGTH = 64 * 1024
+OFX_TAG = re.compile(r'<(/?[A-Za-z0-9.]+)>([^<]*)')
+
+
+async def iter_lines(chunks, encoding: str = 'utf-8-sig'):
+    """
+    Построчное чтение потока байтов без загрузки всего файла в память.
+
+    Параметры:
+        chunks - асинхронный итератор частей файла в байтах,
+        encoding: str - кодировка файла.
+
+    Возвращает:
+        line: str - очередная строка файла без символов перевода строки.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ''
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split('\n')
+        for line in lines:
+            yield line.rstrip('\r')
+        if len(buffer) > MAX_LINE_LENGTH:
+            raise ValueError(f'Строка длиннее {MAX_LINE_LENGTH} символов.')
+    buffer += decoder.decode(b'', final=True)
+    if buffer:
+        yield buffer.rstrip('\r')
+
+
+class _LineFeed:
+    """
+    Источник строк для csv.reader, пополняемый по мере чтения потока.
+    """
+
+    def __init__(self):
+        self.lines = deque()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.lines:
+            raise StopIteration
+        return self.lines.popleft()
+
+
+async def iter_csv_rows(chunks, delimiter: str = ','):
+    """
+    Чтение строк выписки в формате CSV. Первая непустая запись файла - заголовок с названиями колонок.
+
+    Строки потока передаются одному csv.reader, запись разбирается, когда все открытые кавычки закрыты,
+    поэтому значения в кавычках могут содержать разделители и переводы строк.
+
+    Параметры:
+        chunks - асинхронный итератор частей файла в байтах,
+        delimiter: str - разделитель колонок.
+
+    Возвращает:
+        row: dict - очередная строка выписки в виде {название колонки: значение}.
+    """
+    feed = _LineFeed()
+    reader = csv.reader(feed, delimiter=delimiter)
+    header = None
+    quoted = False
+    record_length = 0
+    lines = iter_lines(chunks)
+    while True:
+        line = await anext(lines, None)
+        if line is not None:
+            feed.lines.append(line + '\n')
+            record_length += len(line)
+            quoted ^= line.count('"') % 2 == 1
+            if quoted:
+                if record_length > MAX_LINE_LENGTH:
+                    raise ValueError(f'Запись длиннее {MAX_LINE_LENGTH} символов.')
+                continue
+        elif not feed.lines:
+            break
+        record_length = 0
+        quoted = False
+        values = next(reader, None)
+        if values is None or not ''.join(values).strip():
+            continue
+        if header is None:
+            header = [value.strip() for value in values]
+            continue
+        yield dict(zip(header, values))
+
+
+async def iter_ofx_rows(chunks):
+    """
+    Чтение операций выписки в формате OFX (поддерживаются блоки STMTTRN с полями TRNAMT, NAME, MEMO и т.д.).
+
+    Параметры:
+        chunks - асинхронный итератор частей файла в байтах.
+
+    Возвращает:
+        row: dict - очередная операция выписки в виде {название поля в нижнем регистре: значение}.
+    """
+    transaction = None
+    async for line in iter_lines(chunks):
+        for tag, value in OFX_TAG.findall(line):
+            tag = tag.upper()
+            if tag == 'STMTTRN':
+                transaction = {}
+            elif tag == '/STMTTRN':
+                if transaction is not None:
+                    yield transaction
+                transaction = None
+            elif transaction is not None and not tag.startswith('/'):
+                transaction[tag.lower()] = value.strip()
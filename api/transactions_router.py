@@ -1,55 +1,86 @@
-from typing import List
-from fastapi import APIRouter, HTTPException
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Literal
+from fastapi import APIRouter, Body, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.params import Depends
-from sqlalchemy import select
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from api.sign_in_router import get_current_user
-from database.database import get_db, async_session
-from database.models import Transactions, Wallets, Users
-from database.cruds import TransactionsCRUD, WalletsCRUD
-from shchemas import TransactionSchema, TransactionGetSchema, TransactionPostSchema, UserLoginSchema
+from api.idempotency import Idempotency, get_idempotency
+from api.ingest import StatementMapping, import_progress, import_statement, ingest_transactions
+from api.statements import iter_csv_rows, iter_ofx_rows
+from api.sign_in_router import get_current_user, get_current_principal
+from database.database import get_db, get_read_db, begin_read_snapshot
+from database.models import Transactions
+from database.cruds import CategoriesCRUD, TransactionsCRUD, WalletsCRUD
+from shchemas import (TransactionSchema, TransactionGetSchema, TransactionPostSchema, TransactionBulkResultSchema,
+                      StatementImportSchema, UserLoginSchema)
 
 transaction_router = APIRouter(prefix='/transactions')
 
+BULK_MAX_ITEMS = 5000
+
 
 @transaction_router.get(
     '/all',
     response_model=List[TransactionGetSchema],
     summary='Получить все транзакции.',
-    description='Выводит список всех транзакций.'
+    description='Выводит список транзакций постранично. Курсор следующей страницы передается в заголовке X-Next-Cursor.'
 )
 async def get_all_transactions(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        response: Response,
+        after_id: int | None = Query(default=None, gt=0, description='Уникальный ключ последней транзакции предыдущей страницы.'),
+        limit: int = Query(default=100, ge=1, le=1000, description='Количество транзакций на странице.'),
+        wallet_id: int | None = Query(default=None, gt=0, description='Фильтр по кошельку.'),
+        category_id: int | None = Query(default=None, gt=0, description='Фильтр по категории.'),
+        min_amount: Decimal | None = Query(default=None, ge=0, description='Минимальная сумма транзакции.'),
+        max_amount: Decimal | None = Query(default=None, ge=0, description='Максимальная сумма транзакции.'),
+        created_from: datetime | None = Query(default=None, alias='from', description='Начало периода (включительно).'),
+        created_to: datetime | None = Query(default=None, alias='to', description='Конец периода (не включительно).'),
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> List[TransactionGetSchema]:
     """
-    Получение списка всех транзакций.
+    Получение списка транзакций с пагинацией по уникальному ключу (keyset).
+
+    Пустая страница (нет транзакций или курсор указывает на последнюю) - пустой список без заголовка X-Next-Cursor.
 
     Параметры:
+        response: Response - ответ, в заголовок X-Next-Cursor которого записывается курсор следующей страницы,
+        after_id: int | None - уникальный ключ последней транзакции предыдущей страницы,
+        limit: int - количество транзакций на странице,
+        wallet_id: int | None - фильтр по кошельку,
+        category_id: int | None - фильтр по категории,
+        min_amount: Decimal | None - минимальная сумма транзакции,
+        max_amount: Decimal | None - максимальная сумма транзакции,
+        created_from: datetime | None - начало периода (включительно),
+        created_to: datetime | None - конец периода (не включительно),
         db: AsyncSession - объект базы данных.
 
     Возвращает:
         List[TransactionGetSchema] - список транзакций в формате TransactionGetSchema.
     """
     try:
-        if current_user['is_admin']:
-            transactions = await TransactionsCRUD.get_all(db)
-        else:
-            stmt = (
-                select(Transactions)
-                .join(Wallets, Transactions.wallet_id == Wallets.id)
-                .join(Users, Wallets.user_id == Users.id)
-                .where(Users.id == current_user['user_id'])
-            )
-            result = await db.execute(stmt)
-            transactions = result.scalars().all()
-        if not transactions:
-             raise HTTPException(
-                 status_code=404,
-                 detail='Транзакции не были найдены.'
-             )
-        return [TransactionGetSchema.model_validate(transaction.__dict__) for transaction in transactions]
+        transactions = await TransactionsCRUD.get_page(
+            db,
+            user_id=None if current_user['is_admin'] else current_user['user_id'],
+            after_id=after_id,
+            limit=limit + 1,
+            wallet_id=wallet_id,
+            category_id=category_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            created_from=created_from,
+            created_to=created_to
+        )
+        if len(transactions) > limit:
+            transactions = transactions[:limit]
+            response.headers['X-Next-Cursor'] = str(transactions[-1].id)
+        return [TransactionGetSchema.model_validate(transaction) for transaction in transactions]
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -62,6 +93,66 @@ async def get_all_transactions(
         )
 
 
+EXPORT_COLUMNS = ('id', 'amount', 'wallet_id', 'category_id')
+EXPORT_MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+
+async def _export_rows(db: AsyncSession, user_id: int | None, export_format: str, chunk_size: int):
+    """
+    Генератор выгрузки транзакций: каждая пачка строк из БД превращается в один фрагмент ответа.
+    """
+    if export_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue()
+    async for rows in TransactionsCRUD.stream_by_user(db, user_id, chunk_size):
+        if export_format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows(rows)
+            yield buffer.getvalue()
+        else:
+            yield ''.join(json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=str) + '\n' for row in rows)
+
+
+@transaction_router.get(
+    '/export',
+    summary='Выгрузить транзакции.',
+    description='Потоковая выгрузка транзакций в формате NDJSON или CSV.'
+)
+async def export_transactions(
+        export_format: Literal['ndjson', 'csv'] = Query(default='ndjson', alias='format', description='Формат выгрузки.'),
+        chunk_size: int = Query(default=1000, ge=1, le=10000, description='Количество строк, читаемых из БД за раз.'),
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка транзакций.
+
+    Строки читаются из БД только для чтения (реплики) через серверный курсор пачками по chunk_size и сразу
+    отправляются клиенту, поэтому потребление памяти не зависит от количества транзакций.
+
+    Параметры:
+        export_format: str - формат выгрузки (ndjson или csv),
+        chunk_size: int - количество строк, читаемых из БД за раз,
+        db: AsyncSession - объект базы данных.
+
+    Возвращает:
+        StreamingResponse - поток строк с транзакциями.
+    """
+    user_id = None if current_user['is_admin'] else current_user['user_id']
+    await begin_read_snapshot(db)
+    return StreamingResponse(
+        _export_rows(db, user_id, export_format, chunk_size),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={'Content-Disposition': f'attachment; filename="transactions.{export_format}"'}
+    )
+
+
 @transaction_router.get(
     '/{transaction_id}',
     response_model=TransactionGetSchema,
@@ -70,8 +161,8 @@ async def get_all_transactions(
 )
 async def get_transaction_by_id(
         transaction_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> TransactionGetSchema:
     """
     Получение транзакции по уникальному ключу.
@@ -87,22 +178,14 @@ async def get_transaction_by_id(
         if current_user['is_admin']:
             transaction = await TransactionsCRUD.get_by_id(db, transaction_id)
         else:
-            stmt = (
-                select(Transactions)
-                .join(Wallets, Transactions.wallet_id == Wallets.id)
-                .join(Users, Wallets.user_id == Users.id)
-                .where(Users.id == current_user['user_id'])
-                .where(Transactions.id == transaction_id)
-            )
-            result = await db.execute(stmt)
-            transaction = result.scalars().first()
+            transaction = await TransactionsCRUD.get_by_id_for_user(db, transaction_id, current_user['user_id'])
         if not transaction:
             raise HTTPException(
                 status_code=404,
                 detail=f'Транзакция с id={transaction_id} не найдена.'
             )
         else:
-            return TransactionGetSchema.model_validate(transaction.__dict__)
+            return TransactionGetSchema.model_validate(transaction)
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -124,33 +207,33 @@ async def get_transaction_by_id(
 async def create_transaction(
         transaction_data: TransactionPostSchema,
         db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        current_user: UserLoginSchema = Depends(get_current_user),
+        idempotency: Idempotency = Depends(get_idempotency)
 ) -> TransactionPostSchema:
     """
     Создание новой транзакции.
 
     Параметры:
         transaction_data: TransactionPostSchema - данные о новой транзакции в формате TransactionPostSchema,
-        db: AsyncSession - объект базы данных.
+        db: AsyncSession - объект базы данных,
+        idempotency: Idempotency - защита от повторного выполнения по заголовку Idempotency-Key.
 
     Возвращает:
         TransactionPostSchema - транзакция в формате TransactionPostSchema.
     """
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
     try:
         if not current_user['is_admin']:
-            wallets = await WalletsCRUD.get_all(db)
-            wallet_ids = []
-            for wallet in wallets:
-                if wallet.user_id == current_user['user_id']:
-                    wallet_ids.append(wallet.id)
-            if transaction_data.wallet_id not in wallet_ids:
+            if not await WalletsCRUD.exists_for_user(db, transaction_data.wallet_id, current_user['user_id']):
                 raise HTTPException(
                     status_code=404,
                     detail=f'Такой кошелек не найден у пользователя.'
                 )
         transaction = Transactions(**transaction_data.model_dump())
         new_transaction = await TransactionsCRUD.create(db, transaction)
-        return TransactionPostSchema.model_validate(new_transaction)
+        created_transaction = TransactionPostSchema.model_validate(new_transaction)
     except IntegrityError as e:
         if 'unique' in str(e).lower():
             raise HTTPException(
@@ -177,6 +260,172 @@ async def create_transaction(
             status_code=500,
             detail=f'Ошибка сервера: {e}'
         )
+    return await idempotency.save(created_transaction)
+
+
+@transaction_router.post(
+    '/bulk',
+    response_model=List[TransactionBulkResultSchema],
+    summary='Создать пачку транзакций.',
+    description=f'Создает до {BULK_MAX_ITEMS} транзакций за один запрос и меняет балансы кошельков. '
+                'Возвращает результат обработки каждой транзакции.'
+)
+async def create_transactions_bulk(
+        transactions_data: List[TransactionPostSchema] = Body(min_length=1, max_length=BULK_MAX_ITEMS),
+        db: AsyncSession = Depends(get_db),
+        current_user: UserLoginSchema = Depends(get_current_user),
+        idempotency: Idempotency = Depends(get_idempotency)
+) -> List[TransactionBulkResultSchema]:
+    """
+    Создание пачки транзакций.
+
+    Параметры:
+        transactions_data: List[TransactionPostSchema] - новые транзакции в формате TransactionPostSchema,
+        db: AsyncSession - объект базы данных,
+        current_user: UserLoginSchema - текущий авторизованный пользователь,
+        idempotency: Idempotency - защита от повторного выполнения по заголовку Idempotency-Key.
+
+    Возвращает:
+        List[TransactionBulkResultSchema] - результат обработки каждой транзакции.
+    """
+    replayed = await idempotency.replay()
+    if replayed is not None:
+        return replayed
+    try:
+        results = await ingest_transactions(db, transactions_data, current_user)
+    except IntegrityError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=f'Нарушена целостность данных: {e}'
+        )
+    except OperationalError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f'Не удалось соединение с базой данных: {e}'
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f'Ошибка сервера: {e}'
+        )
+    return await idempotency.save(results)
+
+
+@transaction_router.post(
+    '/import',
+    response_model=StatementImportSchema,
+    summary='Загрузить выписку.',
+    description='Загружает выписку в формате CSV или OFX из тела запроса потоком и фиксирует транзакции пачками. '
+                'Прерванную загрузку можно продолжить с тем же import_id, передав offset из последнего ответа.'
+)
+async def import_transactions(
+        request: Request,
+        statement_format: Literal['csv', 'ofx'] = Query(default='csv', alias='format', description='Формат выписки.'),
+        import_id: str | None = Query(default=None, min_length=1, max_length=64, description='Идентификатор загрузки.'),
+        offset: int | None = Query(default=None, ge=0, description='Номер строки, с которой продолжить загрузку.'),
+        chunk_size: int = Query(default=1000, ge=1, le=BULK_MAX_ITEMS, description='Количество строк в пачке.'),
+        wallet_id: int | None = Query(default=None, gt=0, description='Кошелек для строк без кошелька.'),
+        income_category_id: int | None = Query(default=None, gt=0, description='Категория для поступлений.'),
+        expense_category_id: int | None = Query(default=None, gt=0, description='Категория для списаний.'),
+        amount_column: str = Query(default='amount', description='Колонка CSV с суммой.'),
+        wallet_column: str = Query(default='wallet_id', description='Колонка CSV с кошельком.'),
+        category_column: str = Query(default='category', description='Колонка CSV с категорией.'),
+        delimiter: str = Query(default=',', min_length=1, max_length=1, description='Разделитель колонок CSV.'),
+        db: AsyncSession = Depends(get_db),
+        current_user: UserLoginSchema = Depends(get_current_user)
+) -> StatementImportSchema:
+    """
+    Потоковая загрузка выписки.
+
+    Состояние загрузки хранится в памяти процесса (api.ingest.import_progress): после перезапуска приложения
+    или на другом процессе оно недоступно, и без offset загрузка начнется с первой строки. Поэтому клиент
+    при возобновлении передает offset из последнего ответа (или из текста ошибки).
+
+    Параметры:
+        request: Request - текущий запрос, тело которого - файл выписки,
+        statement_format: str - формат выписки (csv или ofx),
+        import_id: str | None - идентификатор загрузки (по умолчанию создается новый),
+        offset: int | None - номер строки, с которой продолжить загрузку (по умолчанию - после последней
+            зафиксированной пачки),
+        chunk_size: int - количество строк в пачке,
+        wallet_id: int | None - кошелек для строк без кошелька,
+        income_category_id: int | None - категория для поступлений,
+        expense_category_id: int | None - категория для списаний,
+        amount_column: str - колонка CSV с суммой,
+        wallet_column: str - колонка CSV с кошельком,
+        category_column: str - колонка CSV с категорией,
+        delimiter: str - разделитель колонок CSV,
+        db: AsyncSession - объект базы данных,
+        current_user: UserLoginSchema - текущий авторизованный пользователь.
+
+    Возвращает:
+        StatementImportSchema - состояние загрузки.
+    """
+    import_id = import_id or uuid.uuid4().hex
+    key = (current_user['user_id'], import_id)
+    progress = import_progress.get(key) or {
+        'import_id': import_id, 'status': 'running', 'offset': 0, 'created': 0, 'rejected': 0, 'errors': []
+    }
+    if offset is not None:
+        progress['offset'] = offset
+    progress['status'] = 'running'
+    import_progress.set(key, progress)
+
+    if statement_format == 'ofx':
+        rows = iter_ofx_rows(request.stream())
+        mapping_columns = {'amount_column': 'trnamt', 'wallet_column': None, 'category_column': None}
+    else:
+        rows = iter_csv_rows(request.stream(), delimiter)
+        mapping_columns = {
+            'amount_column': amount_column, 'wallet_column': wallet_column, 'category_column': category_column
+        }
+    try:
+        catalogue = await CategoriesCRUD.get_catalogue(db)
+        mapping = StatementMapping(
+            **mapping_columns,
+            wallet_id=wallet_id,
+            income_category_id=income_category_id,
+            expense_category_id=expense_category_id,
+            category_ids={category.name: category.id for category in catalogue.categories}
+        )
+        await import_statement(db, rows, mapping, current_user, progress, chunk_size)
+    except Exception as e:
+        await db.rollback()
+        progress['status'] = 'failed'
+        raise HTTPException(
+            status_code=500,
+            detail=f'Ошибка сервера: {e}. Загрузку можно продолжить с offset={progress["offset"]}.'
+        )
+    return progress
+
+
+@transaction_router.get(
+    '/import/{import_id}',
+    response_model=StatementImportSchema,
+    summary='Получить состояние загрузки выписки.',
+    description='Выводит количество обработанных строк, созданных транзакций и ошибок загрузки.'
+)
+async def get_import_progress(
+        import_id: str,
+        current_user: UserLoginSchema = Depends(get_current_principal)
+) -> StatementImportSchema:
+    """
+    Получение состояния загрузки выписки.
+
+    Параметры:
+        import_id: str - идентификатор загрузки,
+        current_user: UserLoginSchema - текущий авторизованный пользователь.
+
+    Возвращает:
+        StatementImportSchema - состояние загрузки.
+    """
+    progress = import_progress.get((current_user['user_id'], import_id))
+    if progress is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f'Загрузка с id={import_id} не найдена.'
+        )
+    return progress
 
 
 @transaction_router.patch(
@@ -204,15 +453,7 @@ async def update_transaction(
     """
     try:
         if not current_user['is_admin']:
-            stmt = (
-                select(Transactions)
-                .join(Wallets, Transactions.wallet_id == Wallets.id)
-                .join(Users, Wallets.user_id == Users.id)
-                .where(Users.id == current_user['user_id'])
-                .where(Transactions.id == transaction_id)
-            )
-            result = await db.execute(stmt)
-            transaction = result.scalars().first()
+            transaction = await TransactionsCRUD.get_by_id_for_user(db, transaction_id, current_user['user_id'])
             if transaction:
                 upd_transaction = await TransactionsCRUD.update(db, transaction_id,
                                                             changes.model_dump(exclude_unset=True))
@@ -281,15 +522,7 @@ async def delete_transaction(
         if current_user['is_admin']:
             result = await TransactionsCRUD.delete(db, transaction_id)
         else:
-            stmt = (
-                select(Transactions)
-                .join(Wallets, Transactions.wallet_id == Wallets.id)
-                .join(Users, Wallets.user_id == Users.id)
-                .where(Users.id == current_user['user_id'])
-                .where(Transactions.id == transaction_id)
-            )
-            res = await db.execute(stmt)
-            transaction = res.scalars().first()
+            transaction = await TransactionsCRUD.get_by_id_for_user(db, transaction_id, current_user['user_id'])
             if not transaction:
                 raise HTTPException(
                     status_code=404,
@@ -4,13 +4,16 @@ from fastapi.params import Depends
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from api.sign_in_router import get_current_user
-from database.database import get_db
+from database.database import get_db, get_read_db
 from database.models import Users
 from database.cruds import UsersCRUD
+from database.cruds.projection import schema_columns
 from shchemas import UserSchema, UserGetSchema, UserPostSchema, UserLoginSchema
 
 user_router = APIRouter(prefix='/users')
 
+USER_COLUMNS = schema_columns(Users, UserGetSchema)
+
 
 @user_router.get(
     '/all',
@@ -19,7 +22,7 @@ user_router = APIRouter(prefix='/users')
     description='Выводит список всех пользователей.'
 )
 async def get_all_users(
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
         current_user: UserLoginSchema = Depends(get_current_user)
 ) -> List[UserGetSchema]:
     """
@@ -37,14 +40,14 @@ async def get_all_users(
                 status_code=403,
                 detail='Нет прав на данное действие.'
             )
-        users = await UsersCRUD.get_all(db)
+        users = await UsersCRUD.get_all(db, columns=USER_COLUMNS)
         if not users:
             raise HTTPException(
                 status_code=404,
                 detail='Пользователи не были найдены.'
             )
         else:
-            return [UserGetSchema.model_validate(user.__dict__) for user in users]
+            return [UserGetSchema.model_validate(user) for user in users]
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -65,7 +68,7 @@ async def get_all_users(
 )
 async def get_user_by_id(
         user_id: int,
-        db: AsyncSession = Depends(get_db),
+        db: AsyncSession = Depends(get_read_db),
         current_user: UserLoginSchema = Depends(get_current_user)
 ) -> UserGetSchema:
     """
@@ -91,7 +94,7 @@ async def get_user_by_id(
                 detail=f'Пользователь с id={user_id} не был найден.'
             )
         else:
-            return UserGetSchema.model_validate(user.__dict__)
+            return UserGetSchema.model_validate(user)
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -3,14 +3,17 @@ from fastapi import APIRouter, HTTPException
 from fastapi.params import Depends
 from sqlalchemy.exc import OperationalError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from api.sign_in_router import get_current_user
-from database.database import get_db
+from api.sign_in_router import get_current_user, get_current_principal
+from database.database import get_db, get_read_db
 from database.models import Wallets
 from database.cruds import WalletsCRUD
+from database.cruds.projection import schema_columns
 from shchemas import WalletSchema, WalletGetSchema, WalletPostSchema, UserLoginSchema
 
 wallet_router = APIRouter(prefix='/wallets')
 
+WALLET_COLUMNS = schema_columns(Wallets, WalletGetSchema)
+
 
 @wallet_router.get(
     '/all',
@@ -19,8 +22,8 @@ wallet_router = APIRouter(prefix='/wallets')
     description='Выводит список всех кошельков.'
 )
 async def get_all_wallets(
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> List[WalletGetSchema]:
     """
     Получение списка всех кошельков.
@@ -32,15 +35,16 @@ async def get_all_wallets(
         List[WalletGetSchema] - список кошельков в формате WalletGetSchema.
     """
     try:
-        wallets = await WalletsCRUD.get_all(db)
-        if not current_user['is_admin']:
-            wallets = [wallet for wallet in wallets if wallet.user_id == current_user['user_id']]
+        if current_user['is_admin']:
+            wallets = await WalletsCRUD.get_all(db, columns=WALLET_COLUMNS)
+        else:
+            wallets = await WalletsCRUD.get_by_user(db, current_user['user_id'], columns=WALLET_COLUMNS)
         if not wallets:
             raise HTTPException(
                 status_code=404,
                 detail='Кошельки не были найдены.'
             )
-        return [WalletGetSchema.model_validate(wallet.__dict__) for wallet in wallets]
+        return [WalletGetSchema.model_validate(wallet) for wallet in wallets]
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -61,8 +65,8 @@ async def get_all_wallets(
 )
 async def get_wallet_by_id(
         wallet_id: int,
-        db: AsyncSession = Depends(get_db),
-        current_user: UserLoginSchema = Depends(get_current_user)
+        db: AsyncSession = Depends(get_read_db),
+        current_user: UserLoginSchema = Depends(get_current_principal)
 ) -> WalletGetSchema:
     """
     Получение кошелька по уникальному ключу.
@@ -75,18 +79,16 @@ async def get_wallet_by_id(
         WalletGetSchema - кошелек в формате WalletGetSchema.
     """
     try:
-        wallet = await WalletsCRUD.get_by_id(db, wallet_id)
+        if current_user['is_admin']:
+            wallet = await WalletsCRUD.get_by_id(db, wallet_id)
+        else:
+            wallet = await WalletsCRUD.get_by_id_for_user(db, wallet_id, current_user['user_id'])
         if not wallet:
             raise HTTPException(
                 status_code=404,
                 detail=f'Кошелек с id={wallet_id} не был найден.'
             )
-        if not current_user['is_admin'] and wallet.user_id == current_user['user_id']:
-            raise HTTPException(
-                status_code=404,
-                detail=f'Кошелек с id={wallet_id} не был найден.'
-            )
-        return WalletGetSchema.model_validate(wallet.__dict__)
+        return WalletGetSchema.model_validate(wallet)
     except OperationalError as e:
         raise HTTPException(
             status_code=500,
@@ -0,0 +1,12 @@
+from .backends import TTLCache, MemoryBackend, RedisBackend, redis_backend_from_url
+from .principal import PrincipalCache, TokenVersionRegistry, principal_cache, token_versions, check_shared_backends
+from .analytics import AnalyticsCache, GLOBAL_SCOPE, analytics_cache
+from .categories import CategoryEntry, CategoryIndex, CategoryCatalogue, category_catalogue
+
+
+__all__ = [
+    "TTLCache", "MemoryBackend", "RedisBackend", "redis_backend_from_url",
+    "PrincipalCache", "TokenVersionRegistry", "principal_cache", "token_versions", "check_shared_backends",
+    "AnalyticsCache", "GLOBAL_SCOPE", "analytics_cache",
+    "CategoryEntry", "CategoryIndex", "CategoryCatalogue", "category_catalogue"
+]
@@ -0,0 +1,204 @@
+import hashlib
+import os
+import time
+import uuid
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from cache.backends import TTLCache
+
+load_dotenv()
+ANALYTICS_CACHE_TTL = float(os.getenv('ANALYTICS_CACHE_TTL', 300))
+ANALYTICS_CACHE_SIZE = int(os.getenv('ANALYTICS_CACHE_SIZE', 10000))
+
+GLOBAL_SCOPE = '*'
+
+
+class AnalyticsCache:
+    """
+    Кэш результатов аналитики пользователя с вытеснением LRU и временем жизни записей.
+
+    Ключ результата включает версию данных пользователя и общую версию (категории), поэтому
+    после изменения данных старые результаты просто перестают находиться. Версии меняются
+    после фиксации транзакции БД, в которой данные были изменены через CRUD-слой.
+
+    Параметры:
+        maxsize: int - максимальное количество результатов,
+        ttl: float - время жизни результата в секундах.
+
+    Счетчики:
+        hits: int - количество попаданий в кэш,
+        misses: int - количество промахов,
+        not_modified: int - количество ответов 304 Not Modified.
+    """
+    SESSION_KEY = 'analytics_cache_dirty'
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300):
+        self._results = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._versions = TTLCache(maxsize=maxsize, ttl=ttl * 2)
+        self._changed_at = TTLCache(maxsize=maxsize, ttl=ttl * 2)
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def version(self, scope) -> str:
+        """
+        Получение версии данных. Если версия вытеснена из памяти, создается новая,
+        и результаты, посчитанные до этого, больше не используются.
+
+        Параметры:
+            scope - уникальный ключ пользователя или GLOBAL_SCOPE для общих данных.
+
+        Возвращает:
+            version: str - версия данных.
+        """
+        version = self._versions.get(str(scope))
+        if version is None:
+            version = uuid.uuid4().hex
+            self._versions.set(str(scope), version)
+        return version
+
+    def bump(self, scope) -> str:
+        """
+        Смена версии данных.
+
+        Параметры:
+            scope - уникальный ключ пользователя или GLOBAL_SCOPE для общих данных.
+
+        Возвращает:
+            version: str - новая версия данных.
+        """
+        version = uuid.uuid4().hex
+        self._versions.set(str(scope), version)
+        self._changed_at.set(str(scope), time.monotonic())
+        return version
+
+    def changed_within(self, user_id, seconds: float) -> bool:
+        """
+        Проверка, менялись ли данные пользователя или общие данные за последние seconds секунд.
+
+        Параметры:
+            user_id - уникальный ключ пользователя,
+            seconds: float - длительность периода в секундах.
+
+        Возвращает:
+            True, если версия данных пользователя или общая версия сменилась за этот период.
+        """
+        now = time.monotonic()
+        for scope in (user_id, GLOBAL_SCOPE):
+            changed_at = self._changed_at.get(str(scope))
+            if changed_at is not None and now - changed_at < seconds:
+                return True
+        return False
+
+    def key(self, user_id, resource: str) -> str:
+        """
+        Получение ключа результата для текущих версий данных.
+
+        Параметры:
+            user_id - уникальный ключ пользователя,
+            resource: str - путь и параметры запроса.
+
+        Возвращает:
+            key: str - ключ результата.
+        """
+        return f'{user_id}:{self.version(user_id)}:{self.version(GLOBAL_SCOPE)}:{resource}'
+
+    @staticmethod
+    def etag(key: str) -> str:
+        """
+        Получение ETag результата по его ключу.
+
+        Параметры:
+            key: str - ключ результата.
+
+        Возвращает:
+            etag: str - значение заголовка ETag.
+        """
+        return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+    def get(self, key: str):
+        """
+        Получение результата из кэша.
+
+        Параметры:
+            key: str - ключ результата.
+
+        Возвращает:
+            result - результат или None при промахе.
+        """
+        result = self._results.get(key)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return result
+
+    def set(self, key: str, result):
+        """
+        Сохранение результата в кэш.
+
+        Параметры:
+            key: str - ключ результата,
+            result - результат.
+        """
+        self._results.set(key, result)
+
+    def mark_dirty(self, db, *scopes):
+        """
+        Отметка данных, измененных в транзакции БД. Версии меняются после фиксации транзакции,
+        при откате отметки сбрасываются.
+
+        Параметры:
+            db - сессия БД (AsyncSession или Session),
+            scopes - уникальные ключи пользователей или GLOBAL_SCOPE.
+        """
+        session = getattr(db, 'sync_session', db)
+        session.info.setdefault(self.SESSION_KEY, set()).update(scope for scope in scopes if scope is not None)
+
+    def clear(self):
+        """
+        Очистка кэша и счетчиков.
+        """
+        self._results.clear()
+        self._versions.clear()
+        self._changed_at.clear()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def stats(self) -> dict:
+        """
+        Статистика работы кэша.
+
+        Возвращает:
+            {
+                'hits': hits,
+                'misses': misses,
+                'not_modified': not_modified,
+                'hit_rate': hit_rate,
+                'size': size
+            } - счетчики попаданий и промахов.
+        """
+        total = self.hits + self.misses + self.not_modified
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+            'hit_rate': round((self.hits + self.not_modified) / total, 4) if total else 0.0,
+            'size': len(self._results)
+        }
+
+
+analytics_cache = AnalyticsCache(maxsize=ANALYTICS_CACHE_SIZE, ttl=ANALYTICS_CACHE_TTL)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_after_commit(session):
+    for scope in session.info.pop(AnalyticsCache.SESSION_KEY, ()):
+        analytics_cache.bump(scope)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop(AnalyticsCache.SESSION_KEY, None)
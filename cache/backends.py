@@ -0,0 +1,157 @@
+import json
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Кэш в памяти процесса с вытеснением давно не используемых записей (LRU) и временем жизни записей (TTL).
+
+    Параметры:
+        maxsize: int - максимальное количество записей,
+        ttl: float - время жизни записи в секундах.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key):
+        """
+        Получение значения по ключу.
+
+        Параметры:
+            key - ключ записи.
+
+        Возвращает:
+            value - сохраненное значение или None, если записи нет или ее время жизни истекло.
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, ttl: float | None = None):
+        """
+        Сохранение значения по ключу.
+
+        Параметры:
+            key - ключ записи,
+            value - сохраняемое значение,
+            ttl: float | None - время жизни записи в секундах (по умолчанию берется из настроек кэша).
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key):
+        """
+        Удаление записи по ключу.
+
+        Параметры:
+            key - ключ записи.
+        """
+        self._data.pop(key, None)
+
+    def clear(self):
+        """
+        Удаление всех записей.
+        """
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class MemoryBackend:
+    """
+    Хранилище кэша в памяти процесса.
+
+    Параметры:
+        maxsize: int - максимальное количество записей,
+        ttl: float - время жизни записи в секундах.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, key: str):
+        return self._cache.get(key)
+
+    async def set(self, key: str, value, ttl: float | None = None):
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: str):
+        self._cache.delete(key)
+
+    async def clear(self):
+        self._cache.clear()
+
+
+class RedisBackend:
+    """
+    Общее для нескольких процессов хранилище кэша поверх клиента с протоколом Redis.
+
+    Подходит любой асинхронный клиент с методами get, set(ex=...) и delete (например, redis.asyncio.Redis).
+    Значения сериализуются в JSON.
+
+    Параметры:
+        client - асинхронный клиент Redis,
+        prefix: str - префикс ключей,
+        ttl: float - время жизни записи в секундах.
+    """
+
+    def __init__(self, client, prefix: str = 'cache', ttl: float = 60):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+
+    def _key(self, key: str) -> str:
+        return f'{self.prefix}:{key}'
+
+    async def get(self, key: str):
+        raw = await self.client.get(self._key(key))
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set(self, key: str, value, ttl: float | None = None):
+        await self.client.set(self._key(key), json.dumps(value, default=str),
+                              ex=max(1, int(self.ttl if ttl is None else ttl)))
+
+    async def delete(self, key: str):
+        await self.client.delete(self._key(key))
+
+    async def clear(self):
+        """
+        Записи в Redis очищаются по истечении TTL, принудительная очистка не выполняется.
+        """
+        pass
+
+
+def redis_backend_from_url(url: str, prefix: str, ttl: float):
+    """
+    Создание хранилища RedisBackend по адресу сервера.
+
+    Требует установленного пакета redis.
+
+    Параметры:
+        url: str - адрес сервера Redis,
+        prefix: str - префикс ключей,
+        ttl: float - время жизни записи в секундах.
+
+    Возвращает:
+        RedisBackend - хранилище кэша.
+    """
+    try:
+        from redis import asyncio as redis_asyncio
+    except ImportError:
+        raise RuntimeError('Для использования Redis необходимо установить пакет redis.')
+    return RedisBackend(redis_asyncio.from_url(url), prefix=prefix, ttl=ttl)
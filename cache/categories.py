@@ -0,0 +1,230 @@
+import asyncio
+import os
+import time
+import uuid
+from types import MappingProxyType
+from typing import NamedTuple
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from cache.backends import redis_backend_from_url
+
+load_dotenv()
+CATEGORY_CACHE_TTL = float(os.getenv('CATEGORY_CACHE_TTL', 600))
+CATEGORY_CACHE_CHECK_INTERVAL = float(os.getenv('CATEGORY_CACHE_CHECK_INTERVAL', 1))
+CATEGORY_CACHE_REDIS_URL = os.getenv('CATEGORY_CACHE_REDIS_URL')
+
+
+class CategoryEntry(NamedTuple):
+    """
+    Неизменяемая запись справочника категорий.
+
+    Поля:
+        id: int - уникальный ключ категории,
+        name: str - название категории,
+        is_public: bool | None - флаг, отмечающий является ли категория общей,
+        type: str - тип категории (Income или Expense).
+    """
+    id: int
+    name: str
+    is_public: bool | None
+    type: str
+
+
+class CategoryIndex:
+    """
+    Неизменяемый снимок справочника категорий с поиском по уникальному ключу и по названию.
+
+    Параметры:
+        categories - записи о категориях (объекты с полями id, name, is_public, type).
+    """
+
+    def __init__(self, categories=()):
+        entries = sorted(
+            (CategoryEntry(category.id, category.name, category.is_public, category.type) for category in categories),
+            key=lambda entry: entry.id
+        )
+        self.categories = tuple(entries)
+        self.by_id = MappingProxyType({entry.id: entry for entry in entries})
+        self.by_name = MappingProxyType({entry.name: entry for entry in entries})
+
+    def __contains__(self, category_id) -> bool:
+        return category_id in self.by_id
+
+    def __len__(self):
+        return len(self.categories)
+
+
+class CategoryCatalogue:
+    """
+    Справочник категорий в памяти процесса.
+
+    Снимок справочника заменяется целиком, читатели никогда не видят его частично обновленным.
+    Снимок перезагружается из БД по истечении времени жизни, после изменения категорий через CRUD-слой
+    и после изменения общей версии справочника другим процессом.
+
+    Параметры:
+        ttl: float - время жизни снимка в секундах,
+        check_interval: float - как часто сверять общую версию справочника, в секундах.
+
+    Счетчики:
+        hits: int - количество обращений без загрузки из БД,
+        loads: int - количество загрузок из БД.
+    """
+    SESSION_KEY = 'category_catalogue_dirty'
+    VERSION_KEY = 'version'
+
+    def __init__(self, ttl: float = 600, check_interval: float = 1):
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.backend = None
+        self.hooks = []
+        self._tasks = set()
+        self._index = None
+        self._loaded_at = 0.0
+        self._version = None
+        self._checked_at = 0.0
+        self.hits = 0
+        self.loads = 0
+
+    def use_backend(self, backend):
+        """
+        Подключение общего для нескольких процессов хранилища версии справочника.
+
+        Параметры:
+            backend - хранилище (MemoryBackend или RedisBackend).
+        """
+        self.backend = backend
+
+    def add_hook(self, hook):
+        """
+        Регистрация функции, вызываемой при сбросе справочника (например, для рассылки другим процессам).
+
+        Параметры:
+            hook - функция без параметров.
+        """
+        self.hooks.append(hook)
+
+    @property
+    def index(self) -> CategoryIndex | None:
+        return self._index
+
+    async def is_stale(self, category_ids=(), names=()) -> bool:
+        """
+        Проверка, нужно ли перезагрузить справочник.
+
+        Параметры:
+            category_ids - уникальные ключи категорий, которые должны быть в справочнике,
+            names - названия категорий, которые должны быть в справочнике.
+
+        Возвращает:
+            True, если снимка нет, он устарел, в нем нет нужных категорий или общая версия изменилась.
+            Из-за отсутствующих категорий (например, неверного category_id в запросе) справочник
+            перезагружается не чаще одного раза в check_interval.
+        """
+        now = time.monotonic()
+        if self._index is None or now - self._loaded_at > self.ttl:
+            return True
+        missing = (any(category_id not in self._index.by_id for category_id in category_ids)
+                   or any(name not in self._index.by_name for name in names))
+        if missing and now - self._loaded_at >= self.check_interval:
+            return True
+        if self.backend is not None and now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            version = await self.backend.get(self.VERSION_KEY)
+            if version != self._version:
+                self._version = version
+                return True
+        return False
+
+    def replace(self, categories) -> CategoryIndex:
+        """
+        Замена снимка справочника.
+
+        Параметры:
+            categories - записи о категориях из БД.
+
+        Возвращает:
+            CategoryIndex - новый снимок справочника.
+        """
+        self._index = CategoryIndex(categories)
+        self._loaded_at = time.monotonic()
+        self.loads += 1
+        return self._index
+
+    def invalidate(self):
+        """
+        Сброс снимка справочника в текущем процессе, смена общей версии и вызов зарегистрированных функций.
+        """
+        self._index = None
+        if self.backend is not None:
+            try:
+                task = asyncio.get_running_loop().create_task(self.publish())
+            except RuntimeError:
+                pass
+            else:
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        for hook in self.hooks:
+            hook()
+
+    async def publish(self):
+        """
+        Смена общей версии справочника, чтобы другие процессы перезагрузили его.
+        """
+        if self.backend is not None:
+            self._version = uuid.uuid4().hex
+            await self.backend.set(self.VERSION_KEY, self._version)
+
+    def mark_dirty(self, db):
+        """
+        Отметка изменения категорий в транзакции БД. Справочник сбрасывается после фиксации транзакции.
+
+        Параметры:
+            db - сессия БД (AsyncSession или Session).
+        """
+        getattr(db, 'sync_session', db).info[self.SESSION_KEY] = True
+
+    def clear(self):
+        """
+        Сброс снимка справочника и счетчиков.
+        """
+        self._index = None
+        self.hits = 0
+        self.loads = 0
+
+    def stats(self) -> dict:
+        """
+        Статистика работы справочника.
+
+        Возвращает:
+            {
+                'hits': hits,
+                'loads': loads,
+                'size': size
+            } - счетчики обращений и загрузок.
+        """
+        return {
+            'hits': self.hits,
+            'loads': self.loads,
+            'size': len(self._index) if self._index is not None else 0
+        }
+
+
+category_catalogue = CategoryCatalogue(ttl=CATEGORY_CACHE_TTL, check_interval=CATEGORY_CACHE_CHECK_INTERVAL)
+
+if CATEGORY_CACHE_REDIS_URL:
+    category_catalogue.use_backend(
+        redis_backend_from_url(CATEGORY_CACHE_REDIS_URL, prefix='categories', ttl=CATEGORY_CACHE_TTL)
+    )
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session):
+    if session.info.pop(CategoryCatalogue.SESSION_KEY, False):
+        category_catalogue.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop(CategoryCatalogue.SESSION_KEY, None)
@@ -0,0 +1,259 @@
+import asyncio
+import os
+from dotenv import load_dotenv
+from sqlalchemy import event
+from sqlalchemy.exc import MissingGreenlet
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+from cache.backends import MemoryBackend, redis_backend_from_url
+
+load_dotenv()
+PRINCIPAL_CACHE_TTL = float(os.getenv('PRINCIPAL_CACHE_TTL', 60))
+PRINCIPAL_CACHE_SIZE = int(os.getenv('PRINCIPAL_CACHE_SIZE', 10000))
+PRINCIPAL_CACHE_REDIS_URL = os.getenv('PRINCIPAL_CACHE_REDIS_URL')
+TOKEN_VERSIONS_TTL = float(os.getenv('TOKEN_VERSIONS_TTL', 24 * 60 * 60))
+TOKEN_VERSIONS_SIZE = int(os.getenv('TOKEN_VERSIONS_SIZE', 100000))
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+
+
+class PrincipalCache:
+    """
+    Кэш данных авторизованных пользователей, ключом является subject JWT токена.
+
+    Параметры:
+        backend - хранилище кэша (MemoryBackend или RedisBackend).
+
+    Счетчики:
+        hits: int - количество попаданий в кэш,
+        misses: int - количество промахов.
+    """
+    SESSION_KEY = 'principal_changes'
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def use_backend(self, backend):
+        """
+        Замена хранилища кэша, например на общее для нескольких процессов.
+
+        Параметры:
+            backend - новое хранилище кэша.
+        """
+        self.backend = backend
+
+    async def get(self, subject) -> dict | None:
+        """
+        Получение данных пользователя из кэша.
+
+        Параметры:
+            subject - subject JWT токена (уникальный ключ пользователя).
+
+        Возвращает:
+            principal: dict | None - данные пользователя или None при промахе.
+        """
+        principal = await self.backend.get(str(subject))
+        if principal is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return principal
+
+    async def set(self, subject, principal: dict):
+        """
+        Сохранение данных пользователя в кэш.
+
+        Параметры:
+            subject - subject JWT токена (уникальный ключ пользователя),
+            principal: dict - данные пользователя.
+        """
+        await self.backend.set(str(subject), principal)
+
+    async def invalidate(self, subject):
+        """
+        Удаление данных пользователя из кэша при их изменении.
+
+        Параметры:
+            subject - subject JWT токена (уникальный ключ пользователя).
+        """
+        await self.backend.delete(str(subject))
+
+    def mark_changed(self, db, subject, token_version: int | None = None):
+        """
+        Отметка изменения пользователя в транзакции БД. После фиксации транзакции данные пользователя
+        удаляются из кэша, а новая версия токенов сохраняется в реестре token_versions; при откате отметка сбрасывается.
+
+        Параметры:
+            db - сессия БД (AsyncSession или Session),
+            subject - subject JWT токена (уникальный ключ пользователя),
+            token_version: int | None - новая версия токенов или None, если токены не отзываются.
+        """
+        changes = getattr(db, 'sync_session', db).info.setdefault(self.SESSION_KEY, {})
+        if token_version is not None or str(subject) not in changes:
+            changes[str(subject)] = token_version
+
+    async def clear(self):
+        """
+        Очистка кэша и счетчиков.
+        """
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Статистика работы кэша.
+
+        Возвращает:
+            {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hit_rate
+            } - счетчики попаданий и промахов.
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0
+        }
+
+
+class TokenVersionRegistry:
+    """
+    Реестр актуальных версий токенов пользователей для отзыва JWT без обращения к БД.
+
+    Версия сохраняется при входе пользователя и при изменении его учетных данных, при промахе
+    (перезапуск, вытеснение записи) она загружается из БД. Хранилище в памяти допустимо только для одного
+    процесса приложения, см. check_shared_backends.
+
+    Параметры:
+        backend - хранилище версий (MemoryBackend или RedisBackend).
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    def use_backend(self, backend):
+        """
+        Замена хранилища версий, например на общее для нескольких процессов.
+
+        Параметры:
+            backend - новое хранилище версий.
+        """
+        self.backend = backend
+
+    async def get(self, subject) -> int | None:
+        """
+        Получение актуальной версии токенов пользователя.
+
+        Параметры:
+            subject - subject JWT токена (уникальный ключ пользователя).
+
+        Возвращает:
+            version: int | None - версия токенов или None, если версия не менялась.
+        """
+        return await self.backend.get(str(subject))
+
+    async def set(self, subject, version: int):
+        """
+        Сохранение актуальной версии токенов пользователя.
+
+        Параметры:
+            subject - subject JWT токена (уникальный ключ пользователя),
+            version: int - версия токенов.
+        """
+        await self.backend.set(str(subject), version)
+
+    async def is_revoked(self, subject, version: int | None, load=None) -> bool:
+        """
+        Проверка, отозван ли токен с указанной версией.
+
+        Параметры:
+            subject - subject JWT токена (уникальный ключ пользователя),
+            version: int | None - версия из токена,
+            load - асинхронная функция без аргументов, возвращающая версию токенов из БД
+                   (None - пользователь не найден); вызывается при отсутствии версии в реестре.
+
+        Возвращает:
+            True, если версия токена меньше актуальной или пользователь не найден, иначе False.
+        """
+        current = await self.get(subject)
+        if current is None and load is not None:
+            current = await load()
+            if current is None:
+                return True
+            await self.set(subject, current)
+        return current is not None and (version or 0) < current
+
+    async def clear(self):
+        """
+        Очистка реестра.
+        """
+        await self.backend.clear()
+
+
+def check_shared_backends(workers: int = WEB_CONCURRENCY):
+    """
+    Проверка хранилищ при запуске приложения: при нескольких процессах (WEB_CONCURRENCY, его же читают
+    uvicorn --workers и gunicorn) кэш пользователей и реестр версий токенов должны быть общими (Redis),
+    иначе изменение прав или удаление пользователя в одном процессе не отзывает его токены в остальных.
+
+    Параметры:
+        workers: int - количество процессов приложения.
+    """
+    if workers > 1 and (isinstance(principal_cache.backend, MemoryBackend)
+                        or isinstance(token_versions.backend, MemoryBackend)):
+        raise RuntimeError(
+            f'Для {workers} процессов приложения нужен общий кэш пользователей: задайте PRINCIPAL_CACHE_REDIS_URL.'
+        )
+
+
+principal_cache = PrincipalCache(MemoryBackend(maxsize=PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_CACHE_TTL))
+
+token_versions = TokenVersionRegistry(MemoryBackend(maxsize=TOKEN_VERSIONS_SIZE, ttl=TOKEN_VERSIONS_TTL))
+
+if PRINCIPAL_CACHE_REDIS_URL:
+    principal_cache.use_backend(
+        redis_backend_from_url(PRINCIPAL_CACHE_REDIS_URL, prefix='principal', ttl=PRINCIPAL_CACHE_TTL)
+    )
+    token_versions.use_backend(
+        redis_backend_from_url(PRINCIPAL_CACHE_REDIS_URL, prefix='token_version', ttl=TOKEN_VERSIONS_TTL)
+    )
+
+
+async def _apply_principal_changes(changes: dict):
+    for subject, version in changes.items():
+        if version is not None:
+            await token_versions.set(subject, version)
+        await principal_cache.invalidate(subject)
+
+
+_tasks = set()
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_after_commit(session):
+    """
+    Хранилища кэша асинхронные: в AsyncSession изменения применяются до возврата из commit,
+    в синхронной сессии - задачей цикла событий.
+    """
+    changes = session.info.pop(PrincipalCache.SESSION_KEY, None)
+    if not changes:
+        return
+    try:
+        await_only(_apply_principal_changes(changes))
+    except MissingGreenlet:
+        try:
+            task = asyncio.get_running_loop().create_task(_apply_principal_changes(changes))
+        except RuntimeError:
+            asyncio.run(_apply_principal_changes(changes))
+        else:
+            _tasks.add(task)
+            task.add_done_callback(_tasks.discard)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop(PrincipalCache.SESSION_KEY, None)
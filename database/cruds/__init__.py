@@ -4,6 +4,9 @@ from .goals import GoalsCRUD
 from .users import UsersCRUD
 from .wallets import WalletsCRUD
 from .transactions import TransactionsCRUD
+from .analytics import AnalyticsCRUD
+from .idempotency_keys import IdempotencyKeysCRUD
+from .rollups import RollupsCRUD
 
 
 user = UsersCRUD
@@ -12,8 +15,12 @@ category = CategoriesCRUD
 goal = GoalsCRUD
 wallet = WalletsCRUD
 transaction = TransactionsCRUD
+analytics = AnalyticsCRUD
+idempotency_key = IdempotencyKeysCRUD
+rollup = RollupsCRUD
 
 __all__ = [
-    "BudgetsCRUD", "CategoriesCRUD", "GoalsCRUD", "UsersCRUD", "WalletsCRUD", "TransactionsCRUD",
-    "user", "budget", "category", "goal", "wallet", "transaction"
+    "BudgetsCRUD", "CategoriesCRUD", "GoalsCRUD", "UsersCRUD", "WalletsCRUD", "TransactionsCRUD", "AnalyticsCRUD",
+    "IdempotencyKeysCRUD", "RollupsCRUD",
+    "user", "budget", "category", "goal", "wallet", "transaction", "analytics", "idempotency_key", "rollup"
 ]
\ No newline at end of file
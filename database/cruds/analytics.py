@@ -0,0 +1,104 @@
+from datetime import date, datetime
+from sqlalchemy.exc import OperationalError
+from sqlalchemy import select, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import Transactions, Wallets, Categories, MonthlyRollups
+from database.models.categories import CatTypes
+from database.cruds.transactions import TransactionsCRUD
+
+
+class AnalyticsCRUD:
+    """
+    Агрегирующие запросы для аналитики.
+    """
+
+    @staticmethod
+    async def money_movement(
+            db: AsyncSession,
+            user_id: int,
+            created_from: datetime | None = None,
+            created_to: datetime | None = None
+    ):
+        """
+        Получение сумм транзакций пользователя по категориям.
+
+        Суммы считаются одним запросом на стороне БД: доходы берутся со знаком плюс,
+        расходы - со знаком минус. Категории без транзакций пользователя возвращаются с нулевой суммой.
+        Период выбирается по индексу (wallet_id, created_at) для каждого кошелька пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            created_from: datetime | None - начало периода (включительно);
+            created_to: datetime | None - конец периода (не включительно).
+
+        Возвращает:
+            movement - список пар (название категории, сумма).
+        """
+        try:
+            signed_amount = case(
+                (Categories.type == CatTypes.Income, Transactions.amount),
+                else_=-Transactions.amount
+            )
+            sums = (
+                select(Transactions.category_id, func.sum(signed_amount).label('summa'))
+                .join(Wallets, Transactions.wallet_id == Wallets.id)
+                .join(Categories, Transactions.category_id == Categories.id)
+                .where(Wallets.user_id == user_id)
+            )
+            sums = TransactionsCRUD._for_period(sums, created_from, created_to)
+            sums = sums.group_by(Transactions.category_id).subquery()
+            stmt = (
+                select(Categories.name, func.coalesce(sums.c.summa, 0))
+                .outerjoin(sums, sums.c.category_id == Categories.id)
+                .order_by(Categories.id)
+            )
+            data = await db.execute(stmt)
+            movement = data.all()
+            return movement
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def money_movement_rollup(
+            db: AsyncSession,
+            user_id: int,
+            month_from: date | None = None,
+            month_to: date | None = None
+    ):
+        """
+        Получение сумм транзакций пользователя по категориям из таблицы сумм за месяц без чтения транзакций.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            month_from: date | None - первый месяц периода (включительно);
+            month_to: date | None - месяц окончания периода (не включительно).
+
+        Возвращает:
+            movement - список пар (название категории, сумма).
+        """
+        try:
+            sums = (
+                select(MonthlyRollups.category_id, func.sum(MonthlyRollups.amount).label('summa'))
+                .where(MonthlyRollups.user_id == user_id)
+            )
+            if month_from is not None:
+                sums = sums.where(MonthlyRollups.month >= month_from)
+            if month_to is not None:
+                sums = sums.where(MonthlyRollups.month < month_to)
+            sums = sums.group_by(MonthlyRollups.category_id).subquery()
+            stmt = (
+                select(Categories.name, func.coalesce(sums.c.summa, 0))
+                .outerjoin(sums, sums.c.category_id == Categories.id)
+                .order_by(Categories.id)
+            )
+            data = await db.execute(stmt)
+            movement = data.all()
+            return movement
+        except OperationalError:
+            raise
+        except Exception:
+            raise
@@ -1,6 +1,8 @@
 from sqlalchemy.exc import IntegrityError, OperationalError, NoResultFound
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from cache import analytics_cache
+from database.cruds.projection import select_columns, fetch_all
 from database.models import Budgets
 
 
@@ -10,19 +12,20 @@ class BudgetsCRUD:
     """
 
     @staticmethod
-    async def get_all(db: AsyncSession):
+    async def get_all(db: AsyncSession, columns=()):
         """
         Получение всех записей о бюджете.
 
         Параметры:
-            db: AsyncSession - асинхронная сессия БД.
+            db: AsyncSession - асинхронная сессия БД;
+            columns - колонки для выборки (пустой набор - запись целиком).
 
         Возвращает:
-            budgets - список записей о бюджетах из БД.
+            budgets - список записей о бюджетах из БД; строки (Row) с переданными колонками, если они заданы.
         """
         try:
-            data = await db.execute(select(Budgets))
-            budgets = data.scalars().all()
+            data = await db.execute(select_columns(Budgets, columns))
+            budgets = fetch_all(data, columns)
             return budgets
         except OperationalError:
             raise
@@ -50,6 +53,28 @@ class BudgetsCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    async def get_by_user(db: AsyncSession, user_id: int, columns=()):
+        """
+        Получение всех записей о бюджетах пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            columns - колонки для выборки (пустой набор - запись целиком).
+
+        Возвращает:
+            budgets - список записей о бюджетах пользователя из БД; строки (Row) с переданными колонками, если они заданы.
+        """
+        try:
+            data = await db.execute(select_columns(Budgets, columns).where(Budgets.user_id == user_id).order_by(Budgets.id))
+            budgets = fetch_all(data, columns)
+            return budgets
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
     @staticmethod
     async def create(db: AsyncSession, budget: Budgets):
         """
@@ -69,6 +94,7 @@ class BudgetsCRUD:
         """
         try:
             db.add(budget)
+            analytics_cache.mark_dirty(db, budget.user_id)
             return {
                 "name": budget.name,
                 "amount": budget.amount,
@@ -103,11 +129,13 @@ class BudgetsCRUD:
         try:
             data = await db.execute(select(Budgets).where(Budgets.id == budget_id))
             budget = data.scalars().first()
+            analytics_cache.mark_dirty(db, budget.user_id)
             for field, value in changes.items():
                 if hasattr(budget, field):
                     setattr(budget, field, value)
                 else:
                     raise ValueError(f'Поле "{field}" не существует в модели.')
+            analytics_cache.mark_dirty(db, budget.user_id)
             return {
                 "name": budget.name,
                 "amount": budget.amount,
@@ -137,6 +165,7 @@ class BudgetsCRUD:
             budget = data.scalars().first()
             if not budget:
                 raise NoResultFound(f'Бюджет c id={budget_id} не найден.')
+            analytics_cache.mark_dirty(db, budget.user_id)
             await db.delete(budget)
             return {
                 'message': f'Удаление записи с id={budget_id} прошло успешно.'
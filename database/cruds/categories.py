@@ -1,6 +1,8 @@
 from sqlalchemy.exc import IntegrityError, OperationalError, NoResultFound
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from cache import analytics_cache, GLOBAL_SCOPE, category_catalogue, CategoryEntry, CategoryIndex
+from database.cruds.projection import select_columns, fetch_all
 from database.models import Categories
 
 
@@ -10,19 +12,20 @@ class CategoriesCRUD:
     """
 
     @staticmethod
-    async def get_all(db: AsyncSession):
+    async def get_all(db: AsyncSession, columns=()):
         """
         Получение всех записей о категориях.
 
         Параметры:
-            db: AsyncSession - асинхронная сессия БД.
+            db: AsyncSession - асинхронная сессия БД;
+            columns - колонки для выборки (пустой набор - запись целиком).
 
         Возвращает:
-            categories - список записей о категориях из БД.
+            categories - список записей о категориях из БД; строки (Row) с переданными колонками, если они заданы.
         """
         try:
-            data = await db.execute(select(Categories))
-            categories = data.scalars().all()
+            data = await db.execute(select_columns(Categories, columns))
+            categories = fetch_all(data, columns)
             return categories
         except OperationalError:
             raise
@@ -50,6 +53,64 @@ class CategoriesCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    async def get_catalogue(db: AsyncSession, category_ids=(), names=()) -> CategoryIndex:
+        """
+        Получение справочника категорий из памяти процесса. Справочник загружается из БД одним запросом,
+        только если его нет, он устарел или в нем нет запрошенных категорий.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            category_ids - уникальные ключи категорий, которые должны быть в справочнике;
+            names - названия категорий, которые должны быть в справочнике.
+
+        Возвращает:
+            catalogue: CategoryIndex - неизменяемый снимок справочника категорий.
+        """
+        try:
+            if await category_catalogue.is_stale(category_ids, names):
+                data = await db.execute(select(Categories))
+                return category_catalogue.replace(data.scalars().all())
+            category_catalogue.hits += 1
+            return category_catalogue.index
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def get_cached(db: AsyncSession, category_id: int) -> CategoryEntry | None:
+        """
+        Получение категории по уникальному ключу из справочника в памяти процесса.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            category_id: int - целочисленный уникальный ключ записи о категории.
+
+        Возвращает:
+            category: CategoryEntry | None - запись справочника или None, если категории нет.
+        """
+        catalogue = await CategoriesCRUD.get_catalogue(db, [category_id])
+        return catalogue.by_id.get(category_id)
+
+    @staticmethod
+    async def get_types(db: AsyncSession, category_ids) -> dict:
+        """
+        Получение типов категорий из переданного набора по справочнику в памяти процесса.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            category_ids - набор уникальных ключей категорий.
+
+        Возвращает:
+            types: dict - словарь {уникальный ключ категории: тип категории} для существующих категорий.
+        """
+        category_ids = set(category_ids)
+        catalogue = await CategoriesCRUD.get_catalogue(db, category_ids)
+        types = {category_id: catalogue.by_id[category_id].type
+                 for category_id in category_ids if category_id in catalogue}
+        return types
+
     @staticmethod
     async def create(db: AsyncSession, category: Categories):
         """
@@ -68,6 +129,8 @@ class CategoriesCRUD:
         """
         try:
             db.add(category)
+            analytics_cache.mark_dirty(db, GLOBAL_SCOPE)
+            category_catalogue.mark_dirty(db)
             return {
                 'name': category.name,
                 'is_public': category.is_public,
@@ -85,6 +148,9 @@ class CategoriesCRUD:
         """
         Обновление существующей записи о категории.
 
+        Суммы за месяц (RollupsCRUD) не пересчитываются: после смены типа категории с транзакциями
+        нужно выполнить RollupsCRUD.rebuild.
+
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
             category_id: int - целочисленный уникальный ключ записи о категории;
@@ -105,6 +171,8 @@ class CategoriesCRUD:
                     setattr(category, field, value)
                 else:
                     raise ValueError(f'Поле "{field}" не существует в модели.')
+            analytics_cache.mark_dirty(db, GLOBAL_SCOPE)
+            category_catalogue.mark_dirty(db)
             return {
                 'name': category.name,
                 'is_public': category.is_public,
@@ -133,6 +201,8 @@ class CategoriesCRUD:
             category = data.scalars().first()
             if not category:
                 raise NoResultFound(f'Категория с id={category_id} не найдена.')
+            analytics_cache.mark_dirty(db, GLOBAL_SCOPE)
+            category_catalogue.mark_dirty(db)
             await db.delete(category)
             return {
                 'message': f'Удаление записи с id={category_id} прошло успешно.'
@@ -1,6 +1,8 @@
 from sqlalchemy.exc import IntegrityError, OperationalError, NoResultFound
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from cache import analytics_cache
+from database.cruds.projection import select_columns, fetch_all
 from database.models import Goals
 
 
@@ -10,19 +12,20 @@ class GoalsCRUD:
     """
 
     @staticmethod
-    async def get_all(db: AsyncSession):
+    async def get_all(db: AsyncSession, columns=()):
         """
         Получение всех записей о целях.
 
         Параметры:
-            db: AsyncSession - асинхронная сессия БД.
+            db: AsyncSession - асинхронная сессия БД;
+            columns - колонки для выборки (пустой набор - запись целиком).
 
         Возвращает:
-            goals - список записей о целях из БД.
+            goals - список записей о целях из БД; строки (Row) с переданными колонками, если они заданы.
         """
         try:
-            data = await db.execute(select(Goals))
-            goals = data.scalars().all()
+            data = await db.execute(select_columns(Goals, columns))
+            goals = fetch_all(data, columns)
             return goals
         except OperationalError:
             raise
@@ -50,6 +53,28 @@ class GoalsCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    async def get_by_user(db: AsyncSession, user_id: int, columns=()):
+        """
+        Получение всех записей о целях пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            columns - колонки для выборки (пустой набор - запись целиком).
+
+        Возвращает:
+            goals - список записей о целях пользователя из БД; строки (Row) с переданными колонками, если они заданы.
+        """
+        try:
+            data = await db.execute(select_columns(Goals, columns).where(Goals.user_id == user_id).order_by(Goals.id))
+            goals = fetch_all(data, columns)
+            return goals
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
     @staticmethod
     async def create(db: AsyncSession, goal: Goals):
         """
@@ -70,6 +95,7 @@ class GoalsCRUD:
         """
         try:
             db.add(goal)
+            analytics_cache.mark_dirty(db, goal.user_id)
             return {
                 'name': goal.name,
                 'cost': goal.cost,
@@ -106,11 +132,13 @@ class GoalsCRUD:
         try:
             data = await db.execute(select(Goals).where(Goals.id == goal_id))
             goal = data.scalars().first()
+            analytics_cache.mark_dirty(db, goal.user_id)
             for field, value in changes.items():
                 if hasattr(goal, field):
                     setattr(goal, field, value)
                 else:
                     raise ValueError(f'Поле "{field}" не существует в модели.')
+            analytics_cache.mark_dirty(db, goal.user_id)
             return {
                 'name': goal.name,
                 'cost': goal.cost,
@@ -141,6 +169,7 @@ class GoalsCRUD:
             goal = data.scalars().first()
             if not goal:
                 raise NoResultFound(f'Цель с id={goal_id} не найдена.')
+            analytics_cache.mark_dirty(db, goal.user_id)
             await db.delete(goal)
             return {
                 'message': f'Удаление записи с id={goal_id} прошло успешно.'
@@ -0,0 +1,111 @@
+from datetime import datetime
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import IdempotencyKeys
+
+
+class IdempotencyKeysCRUD:
+    """
+    CRUD-операции для таблицы с ключами идемпотентности.
+    """
+
+    @staticmethod
+    async def get(db: AsyncSession, user_id: int, key: str):
+        """
+        Получение записи о выполненном запросе по ключу идемпотентности (чтение одной строки по первичному ключу).
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            key: str - ключ идемпотентности.
+
+        Возвращает:
+            idempotency_key - запись о выполненном запросе из БД.
+        """
+        try:
+            idempotency_key = await db.get(IdempotencyKeys, (user_id, key))
+            return idempotency_key
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def create(db: AsyncSession, idempotency_key: IdempotencyKeys):
+        """
+        Сохранение записи о выполненном запросе.
+
+        Запись сразу отправляется в БД, чтобы параллельный запрос с тем же ключом завершился ошибкой
+        целостности до фиксации транзакции.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            idempotency_key: IdempotencyKeys - объект ORM-модели ключа идемпотентности.
+
+        Возвращает:
+            {
+                'key': idempotency_key.key,
+                'user_id': idempotency_key.user_id,
+                'status_code': idempotency_key.status_code
+            } - запись о выполненном запросе без тела ответа.
+        """
+        try:
+            db.add(idempotency_key)
+            await db.flush()
+            return {
+                'key': idempotency_key.key,
+                'user_id': idempotency_key.user_id,
+                'status_code': idempotency_key.status_code
+            }
+        except IntegrityError:
+            raise
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def delete(db: AsyncSession, user_id: int, key: str):
+        """
+        Удаление записи о выполненном запросе.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            key: str - ключ идемпотентности.
+
+        Возвращает сообщение о результате операции.
+        """
+        try:
+            await db.execute(
+                delete(IdempotencyKeys).where(IdempotencyKeys.user_id == user_id, IdempotencyKeys.key == key)
+            )
+            return {
+                'message': f'Удаление ключа идемпотентности {key} прошло успешно.'
+            }
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def purge_expired(db: AsyncSession, older_than: datetime) -> int:
+        """
+        Удаление записей, созданных раньше указанного времени.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            older_than: datetime - граница времени создания записей.
+
+        Возвращает:
+            count: int - количество удаленных записей.
+        """
+        try:
+            data = await db.execute(delete(IdempotencyKeys).where(IdempotencyKeys.created_at < older_than))
+            count = data.rowcount
+            return count
+        except OperationalError:
+            raise
+        except Exception:
+            raise
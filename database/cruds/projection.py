@@ -0,0 +1,58 @@
+from sqlalchemy import select
+
+
+def select_columns(model, columns=()):
+    """
+    Запрос всей ORM-модели или только переданных колонок.
+
+    Параметры:
+        model - ORM-модель таблицы;
+        columns - колонки ORM-модели (например, (Wallets.id, Wallets.amount)), пустой набор - вся модель.
+
+    Возвращает:
+        stmt - запрос SELECT.
+    """
+    return select(*columns) if columns else select(model)
+
+
+def fetch_all(data, columns=()) -> list:
+    """
+    Все записи результата запроса, построенного select_columns.
+
+    Параметры:
+        data - результат выполнения запроса;
+        columns - колонки, переданные в select_columns.
+
+    Возвращает:
+        list - ORM-модели или, если переданы колонки, строки (Row) с доступом к значениям по имени колонки.
+    """
+    return data.all() if columns else data.scalars().all()
+
+
+def fetch_first(data, columns=()):
+    """
+    Первая запись результата запроса, построенного select_columns.
+
+    Параметры:
+        data - результат выполнения запроса;
+        columns - колонки, переданные в select_columns.
+
+    Возвращает:
+        ORM-модель, строку (Row) или None.
+    """
+    return data.first() if columns else data.scalars().first()
+
+
+def schema_columns(model, schema) -> tuple:
+    """
+    Колонки ORM-модели, нужные для заполнения pydantic-схемы.
+
+    Параметры:
+        model - ORM-модель таблицы;
+        schema - pydantic-схема.
+
+    Возвращает:
+        tuple - колонки модели, имена которых совпадают с полями схемы.
+    """
+    table_columns = model.__table__.columns
+    return tuple(getattr(model, name) for name in schema.model_fields if name in table_columns)
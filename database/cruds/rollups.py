@@ -0,0 +1,158 @@
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import OperationalError
+from sqlalchemy import select, delete, insert, func, case, cast, Date
+from sqlalchemy.ext.asyncio import AsyncSession
+from cache import analytics_cache
+from database.models import MonthlyRollups, Transactions, Wallets, Categories
+from database.models.categories import CatTypes
+from database.cruds.categories import CategoriesCRUD
+
+
+class RollupsCRUD:
+    """
+    CRUD-операции для таблицы с суммами транзакций по категориям за месяц.
+
+    Суммы поддерживаются при создании, изменении и удалении транзакций. Знак суммы зависит от типа категории,
+    а владелец - от кошелька, поэтому после смены типа категории или владельца кошелька с транзакциями
+    суммы нужно пересчитать: RollupsCRUD.rebuild (python -m scripts.rebuild_rollups).
+    """
+
+    @staticmethod
+    def month_of(moment: datetime | date) -> date:
+        """
+        Получение первого дня месяца.
+
+        Параметры:
+            moment: datetime | date - момент времени.
+
+        Возвращает:
+            date - первый день месяца, в который попадает момент времени.
+        """
+        return date(moment.year, moment.month, 1)
+
+    @staticmethod
+    async def apply(db: AsyncSession, transactions, sign: int = 1):
+        """
+        Изменение сумм за месяц на суммы транзакций в той же транзакции БД, что и изменение самих транзакций.
+
+        Владельцы кошельков и типы категорий получаются одним запросом каждый, суммы меняются
+        одним запросом INSERT ... ON CONFLICT DO UPDATE. Кэш аналитики владельцев кошельков
+        сбрасывается после фиксации транзакции БД.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            transactions - набор кортежей (wallet_id, category_id, amount, created_at);
+            sign: int - 1 - транзакции добавляются, -1 - транзакции удаляются.
+        """
+        transactions = list(transactions)
+        if not transactions:
+            return
+        try:
+            data = await db.execute(
+                select(Wallets.id, Wallets.user_id).where(Wallets.id.in_({item[0] for item in transactions}))
+            )
+            owners = dict(data.all())
+            analytics_cache.mark_dirty(db, *owners.values())
+            transactions = [item for item in transactions if item[3] is not None]
+            if not transactions:
+                return
+            types = await CategoriesCRUD.get_types(db, {item[1] for item in transactions})
+
+            deltas = defaultdict(lambda: [Decimal(0), 0])
+            for wallet_id, category_id, amount, created_at in transactions:
+                if wallet_id not in owners or category_id not in types:
+                    continue
+                amount = Decimal(str(amount))
+                signed_amount = amount if types[category_id] == CatTypes.Income else -amount
+                delta = deltas[(owners[wallet_id], category_id, RollupsCRUD.month_of(created_at))]
+                delta[0] += sign * signed_amount
+                delta[1] += sign
+            if not deltas:
+                return
+
+            dialect_insert = postgresql.insert if db.get_bind().dialect.name == 'postgresql' else sqlite.insert
+            stmt = dialect_insert(MonthlyRollups).values([
+                {'user_id': user_id, 'category_id': category_id, 'month': month, 'amount': amount, 'count': count}
+                for (user_id, category_id, month), (amount, count) in deltas.items()
+            ])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[MonthlyRollups.user_id, MonthlyRollups.category_id, MonthlyRollups.month],
+                set_={
+                    'amount': MonthlyRollups.amount + stmt.excluded.amount,
+                    'count': MonthlyRollups.count + stmt.excluded.count
+                }
+            )
+            await db.execute(stmt)
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def get_by_user(db: AsyncSession, user_id: int, month_from: date | None = None, month_to: date | None = None):
+        """
+        Получение сумм за месяц пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            month_from: date | None - первый месяц периода (включительно);
+            month_to: date | None - месяц окончания периода (не включительно).
+
+        Возвращает:
+            rollups - список записей о суммах за месяц, упорядоченный по месяцу и категории.
+        """
+        try:
+            stmt = select(MonthlyRollups).where(MonthlyRollups.user_id == user_id)
+            if month_from is not None:
+                stmt = stmt.where(MonthlyRollups.month >= month_from)
+            if month_to is not None:
+                stmt = stmt.where(MonthlyRollups.month < month_to)
+            data = await db.execute(stmt.order_by(MonthlyRollups.month, MonthlyRollups.category_id))
+            rollups = data.scalars().all()
+            return rollups
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def rebuild(db: AsyncSession) -> int:
+        """
+        Пересчет всех сумм за месяц по таблице транзакций одним запросом INSERT ... SELECT.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД.
+
+        Возвращает:
+            count: int - количество записей о суммах за месяц.
+        """
+        try:
+            if db.get_bind().dialect.name == 'postgresql':
+                month = cast(func.date_trunc('month', Transactions.created_at), Date)
+            else:
+                month = func.date(Transactions.created_at, 'start of month')
+            signed_amount = case(
+                (Categories.type == CatTypes.Income, Transactions.amount),
+                else_=-Transactions.amount
+            )
+            sums = (
+                select(Wallets.user_id, Transactions.category_id, month, func.sum(signed_amount), func.count())
+                .join(Wallets, Transactions.wallet_id == Wallets.id)
+                .join(Categories, Transactions.category_id == Categories.id)
+                .where(Transactions.created_at.is_not(None))
+                .group_by(Wallets.user_id, Transactions.category_id, month)
+            )
+            await db.execute(delete(MonthlyRollups))
+            data = await db.execute(
+                insert(MonthlyRollups).from_select(['user_id', 'category_id', 'month', 'amount', 'count'], sums)
+            )
+            count = data.rowcount
+            return count
+        except OperationalError:
+            raise
+        except Exception:
+            raise
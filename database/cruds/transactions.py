@@ -1,7 +1,10 @@
+from datetime import datetime
+from decimal import Decimal
 from sqlalchemy.exc import IntegrityError, OperationalError, NoResultFound
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from database.models import Transactions
+from database.models import Transactions, Wallets
+from database.cruds.rollups import RollupsCRUD
 
 
 class TransactionsCRUD:
@@ -50,10 +53,187 @@ class TransactionsCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    def _for_user(stmt, user_id: int):
+        """
+        Ограничение запроса транзакциями из кошельков пользователя.
+
+        Параметры:
+            stmt - запрос, в котором участвует таблица транзакций;
+            user_id: int - целочисленный уникальный ключ пользователя.
+
+        Возвращает:
+            stmt - запрос с присоединенной таблицей кошельков и фильтром по пользователю.
+        """
+        return (
+            stmt
+            .join(Wallets, Transactions.wallet_id == Wallets.id)
+            .where(Wallets.user_id == user_id)
+        )
+
+    @staticmethod
+    def _for_period(stmt, created_from: datetime | None = None, created_to: datetime | None = None):
+        """
+        Ограничение запроса транзакциями за период (диапазон по индексу (wallet_id, created_at)).
+
+        Параметры:
+            stmt - запрос, в котором участвует таблица транзакций;
+            created_from: datetime | None - начало периода (включительно);
+            created_to: datetime | None - конец периода (не включительно).
+
+        Возвращает:
+            stmt - запрос с фильтром по времени создания транзакций.
+        """
+        if created_from is not None:
+            stmt = stmt.where(Transactions.created_at >= created_from)
+        if created_to is not None:
+            stmt = stmt.where(Transactions.created_at < created_to)
+        return stmt
+
+    @staticmethod
+    def _rollup_key(transaction: Transactions) -> tuple:
+        """
+        Получение полей транзакции, от которых зависит сумма за месяц.
+
+        Параметры:
+            transaction: Transactions - объект ORM-модели транзакции.
+
+        Возвращает:
+            tuple - кортеж (wallet_id, category_id, amount, created_at).
+        """
+        return transaction.wallet_id, transaction.category_id, transaction.amount, transaction.created_at
+
+    @staticmethod
+    async def get_by_user(db: AsyncSession, user_id: int):
+        """
+        Получение всех записей о транзакциях пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя.
+
+        Возвращает:
+            transactions - список записей о транзакциях пользователя из БД.
+        """
+        try:
+            stmt = TransactionsCRUD._for_user(select(Transactions), user_id).order_by(Transactions.id)
+            data = await db.execute(stmt)
+            transactions = data.scalars().all()
+            return transactions
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def get_by_id_for_user(db: AsyncSession, transaction_id: int, user_id: int):
+        """
+        Получение записи о транзакции по уникальному ключу среди транзакций пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            transaction_id: int - целочисленный уникальный ключ записи о транзакции;
+            user_id: int - целочисленный уникальный ключ пользователя.
+
+        Возвращает:
+            transaction - запись о транзакции из БД или None, если транзакция не принадлежит пользователю.
+        """
+        try:
+            stmt = TransactionsCRUD._for_user(select(Transactions), user_id).where(Transactions.id == transaction_id)
+            data = await db.execute(stmt)
+            transaction = data.scalars().first()
+            return transaction
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def get_page(
+            db: AsyncSession,
+            user_id: int | None = None,
+            after_id: int | None = None,
+            limit: int = 100,
+            wallet_id: int | None = None,
+            category_id: int | None = None,
+            min_amount: Decimal | None = None,
+            max_amount: Decimal | None = None,
+            created_from: datetime | None = None,
+            created_to: datetime | None = None
+    ):
+        """
+        Получение страницы записей о транзакциях с пагинацией по уникальному ключу (keyset).
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int | None - уникальный ключ пользователя (None - транзакции всех пользователей);
+            after_id: int | None - уникальный ключ последней транзакции предыдущей страницы;
+            limit: int - максимальное количество записей на странице;
+            wallet_id: int | None - фильтр по кошельку;
+            category_id: int | None - фильтр по категории;
+            min_amount: Decimal | None - минимальная сумма транзакции;
+            max_amount: Decimal | None - максимальная сумма транзакции;
+            created_from: datetime | None - начало периода (включительно);
+            created_to: datetime | None - конец периода (не включительно).
+
+        Возвращает:
+            transactions - список строк (id, amount, wallet_id, category_id, created_at), упорядоченный по уникальному
+            ключу. Строки выбираются без создания ORM-моделей.
+        """
+        try:
+            stmt = select(Transactions.id, Transactions.amount, Transactions.wallet_id, Transactions.category_id,
+                          Transactions.created_at)
+            if user_id is not None:
+                stmt = TransactionsCRUD._for_user(stmt, user_id)
+            if after_id is not None:
+                stmt = stmt.where(Transactions.id > after_id)
+            if wallet_id is not None:
+                stmt = stmt.where(Transactions.wallet_id == wallet_id)
+            if category_id is not None:
+                stmt = stmt.where(Transactions.category_id == category_id)
+            if min_amount is not None:
+                stmt = stmt.where(Transactions.amount >= min_amount)
+            if max_amount is not None:
+                stmt = stmt.where(Transactions.amount <= max_amount)
+            stmt = TransactionsCRUD._for_period(stmt, created_from, created_to)
+            data = await db.execute(stmt.order_by(Transactions.id).limit(limit))
+            transactions = data.all()
+            return transactions
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def stream_by_user(db: AsyncSession, user_id: int | None = None, chunk_size: int = 1000):
+        """
+        Потоковое чтение записей о транзакциях пачками через серверный курсор.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int | None - уникальный ключ пользователя (None - транзакции всех пользователей);
+            chunk_size: int - количество записей в одной пачке.
+
+        Возвращает:
+            асинхронный генератор списков строк (id, amount, wallet_id, category_id).
+        """
+        try:
+            stmt = select(Transactions.id, Transactions.amount, Transactions.wallet_id, Transactions.category_id)
+            if user_id is not None:
+                stmt = TransactionsCRUD._for_user(stmt, user_id)
+            stmt = stmt.order_by(Transactions.id).execution_options(yield_per=chunk_size)
+            result = await db.stream(stmt)
+            async for partition in result.partitions():
+                yield partition
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
     @staticmethod
     async def create(db: AsyncSession, transaction: Transactions):
         """
-        Создание новой записи о транзакции.
+        Создание новой записи о транзакции и изменение суммы за месяц по ее категории.
 
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
@@ -67,7 +247,10 @@ class TransactionsCRUD:
             } - запись о транзакции из БД без поля id.
         """
         try:
+            if transaction.created_at is None:
+                transaction.created_at = datetime.now()
             db.add(transaction)
+            await RollupsCRUD.apply(db, [TransactionsCRUD._rollup_key(transaction)])
             return {
                 'amount': transaction.amount,
                 'category_id': transaction.category_id,
@@ -80,10 +263,44 @@ class TransactionsCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    async def create_many(db: AsyncSession, rows: list[dict]) -> list[int]:
+        """
+        Создание пачки записей о транзакциях одним запросом INSERT с несколькими наборами значений
+        и изменение сумм за месяц по их категориям.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            rows: list[dict] - значения полей новых транзакций (amount, wallet_id, category_id).
+
+        Возвращает:
+            ids: list[int] - уникальные ключи созданных транзакций в порядке переданных значений.
+        """
+        if not rows:
+            return []
+        try:
+            created_at = datetime.now()
+            rows = [{'created_at': created_at, **row} for row in rows]
+            data = await db.execute(
+                insert(Transactions).returning(Transactions.id, sort_by_parameter_order=True),
+                rows
+            )
+            ids = data.scalars().all()
+            await RollupsCRUD.apply(
+                db, [(row['wallet_id'], row['category_id'], row['amount'], row['created_at']) for row in rows]
+            )
+            return ids
+        except IntegrityError:
+            raise
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
     @staticmethod
     async def update(db: AsyncSession, transaction_id: int, changes: dict):
         """
-        Обновление существующей записи о транзакции.
+        Обновление существующей записи о транзакции и пересчет сумм за месяц по старой и новой категории.
 
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
@@ -100,11 +317,18 @@ class TransactionsCRUD:
         try:
             data = await db.execute(select(Transactions).where(Transactions.id == transaction_id))
             transaction = data.scalars().first()
+            if not transaction:
+                raise NoResultFound(f'Транзакция с id={transaction_id} не найдена.')
+            old_key = TransactionsCRUD._rollup_key(transaction)
             for field, value in changes.items():
                 if hasattr(transaction, field):
                     setattr(transaction, field, value)
                 else:
                     raise ValueError(f'Поле "{field}" не существует в модели.')
+            new_key = TransactionsCRUD._rollup_key(transaction)
+            if new_key != old_key:
+                await RollupsCRUD.apply(db, [old_key], sign=-1)
+                await RollupsCRUD.apply(db, [new_key])
             return {
                 'amount': transaction.amount,
                 'category_id': transaction.category_id,
@@ -120,7 +344,7 @@ class TransactionsCRUD:
     @staticmethod
     async def delete(db: AsyncSession, transaction_id: int):
         """
-        Удаление существующей записи о транзакции.
+        Удаление существующей записи о транзакции и вычитание ее из суммы за месяц.
 
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
@@ -133,6 +357,7 @@ class TransactionsCRUD:
             transaction = data.scalars().first()
             if not transaction:
                 raise NoResultFound(f'Транзакция с id={transaction_id} не найдена.')
+            await RollupsCRUD.apply(db, [TransactionsCRUD._rollup_key(transaction)], sign=-1)
             await db.delete(transaction)
             return {
                 'message': f'Удаление записи с id={transaction_id} прошло успешно.'
@@ -1,7 +1,12 @@
 from sqlalchemy.exc import IntegrityError, OperationalError, NoResultFound
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from database.cruds.projection import select_columns, fetch_all, fetch_first
 from database.models import Users
+from cache import principal_cache
+
+# Поля, изменение которых отзывает ранее выданные токены пользователя.
+TOKEN_REVOKING_FIELDS = ('login', 'password', 'is_admin')
 
 
 class UsersCRUD:
@@ -10,19 +15,20 @@ class UsersCRUD:
     """
 
     @staticmethod
-    async def get_all(db: AsyncSession):
+    async def get_all(db: AsyncSession, columns=()):
         """
         Получение всех записей о пользователе.
 
         Параметры:
-            db: AsyncSession - асинхронная сессия БД.
+            db: AsyncSession - асинхронная сессия БД;
+            columns - колонки для выборки (пустой набор - запись целиком).
 
         Возвращает:
-            users - список записей о пользователях из БД.
+            users - список записей о пользователях из БД; строки (Row) с переданными колонками, если они заданы.
         """
         try:
-            data = await db.execute(select(Users))
-            users = data.scalars().all()
+            data = await db.execute(select_columns(Users, columns))
+            users = fetch_all(data, columns)
             return users
         except OperationalError:
             raise
@@ -30,20 +36,21 @@ class UsersCRUD:
             raise
 
     @staticmethod
-    async def get_by_id(db: AsyncSession, user_id: int):
+    async def get_by_id(db: AsyncSession, user_id: int, columns=()):
         """
         Получение записи о пользователе по уникальному ключу.
 
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
-            user_id: int - целочисленный уникальный ключ записи о пользователе.
+            user_id: int - целочисленный уникальный ключ записи о пользователе;
+            columns - колонки для выборки (пустой набор - запись целиком).
 
         Возвращает:
-            user - запись о пользователе из БД.
+            user - запись о пользователе из БД или строка (Row) с переданными колонками.
         """
         try:
-            data = await db.execute(select(Users).where(Users.id == user_id))
-            user = data.scalars().first()
+            data = await db.execute(select_columns(Users, columns).where(Users.id == user_id))
+            user = fetch_first(data, columns)
             return user
         except OperationalError:
             raise
@@ -99,6 +106,10 @@ class UsersCRUD:
         """
         Обновление существующей записи о пользователе.
 
+        Изменение логина, пароля или прав администратора увеличивает версию токенов пользователя,
+        что делает ранее выданные токены недействительными. Кэш авторизованного пользователя и реестр версий
+        токенов обновляются после фиксации транзакции.
+
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
             user_id: int - целочисленный уникальный ключ записи о пользователе;
@@ -117,11 +128,18 @@ class UsersCRUD:
         try:
             data = await db.execute(select(Users).where(Users.id == user_id))
             user = data.scalars().first()
+            if not user:
+                raise NoResultFound(f'Пользователь с id={user_id} не найден.')
+            revoke_tokens = any(field in changes and changes[field] != getattr(user, field)
+                                for field in TOKEN_REVOKING_FIELDS)
             for field, value in changes.items():
                 if hasattr(user, field):
                     setattr(user, field, value)
                 else:
                     raise ValueError(f'Поле "{field}" не существует в модели.')
+            if revoke_tokens:
+                user.token_version = (user.token_version or 0) + 1
+            principal_cache.mark_changed(db, user_id, user.token_version if revoke_tokens else None)
             return {
                 'name': user.name,
                 'lastname': user.lastname,
@@ -143,6 +161,8 @@ class UsersCRUD:
         """
         Удаление существующей записи о пользователе.
 
+        Ранее выданные токены пользователя становятся недействительными.
+
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
             user_id: int - целочисленный уникальный ключ записи о пользователе.
@@ -155,6 +175,7 @@ class UsersCRUD:
             if not user:
                 raise NoResultFound(f'Пользователь с id={user_id} не найден.')
             await db.delete(user)
+            principal_cache.mark_changed(db, user_id, (user.token_version or 0) + 1)
             return {
                 'message': f'Удаление записи с id={user_id} прошло успешно.'
             }
@@ -165,6 +186,26 @@ class UsersCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    async def get_token_version(db: AsyncSession, user_id: int) -> int | None:
+        """
+        Получение актуальной версии токенов пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ записи о пользователе.
+
+        Возвращает:
+            int | None - версия токенов или None, если пользователь не найден.
+        """
+        try:
+            data = await db.execute(select(Users.token_version).where(Users.id == user_id))
+            row = data.first()
+            return None if row is None else row.token_version or 0
+        except OperationalError:
+            raise
+        except Exception:
+            raise
 
     @staticmethod
     async def get_by_login(db: AsyncSession, user_login: str):
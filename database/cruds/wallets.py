@@ -1,6 +1,9 @@
+from decimal import Decimal
 from sqlalchemy.exc import IntegrityError, OperationalError, NoResultFound
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from cache import analytics_cache
+from database.cruds.projection import select_columns, fetch_all
 from database.models import Wallets
 
 
@@ -10,19 +13,20 @@ class WalletsCRUD:
     """
 
     @staticmethod
-    async def get_all(db: AsyncSession):
+    async def get_all(db: AsyncSession, columns=()):
         """
         Получение всех записей о кошельке.
 
         Параметры:
-            db: AsyncSession - асинхронная сессия БД.
+            db: AsyncSession - асинхронная сессия БД;
+            columns - колонки для выборки (пустой набор - запись целиком).
 
         Возвращает:
-            wallets - список записей о кошельках из БД.
+            wallets - список записей о кошельках из БД; строки (Row) с переданными колонками, если они заданы.
         """
         try:
-            data = await db.execute(select(Wallets))
-            wallets = data.scalars().all()
+            data = await db.execute(select_columns(Wallets, columns))
+            wallets = fetch_all(data, columns)
             return wallets
         except OperationalError:
             raise
@@ -50,6 +54,170 @@ class WalletsCRUD:
         except Exception:
             raise
 
+    @staticmethod
+    async def get_by_user(db: AsyncSession, user_id: int, columns=()):
+        """
+        Получение всех записей о кошельках пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            user_id: int - целочисленный уникальный ключ пользователя;
+            columns - колонки для выборки (пустой набор - запись целиком).
+
+        Возвращает:
+            wallets - список записей о кошельках пользователя из БД; строки (Row) с переданными колонками, если они заданы.
+        """
+        try:
+            data = await db.execute(select_columns(Wallets, columns).where(Wallets.user_id == user_id).order_by(Wallets.id))
+            wallets = fetch_all(data, columns)
+            return wallets
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def get_by_id_for_user(db: AsyncSession, wallet_id: int, user_id: int):
+        """
+        Получение записи о кошельке по уникальному ключу среди кошельков пользователя.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            wallet_id: int - целочисленный уникальный ключ записи о кошельке;
+            user_id: int - целочисленный уникальный ключ пользователя.
+
+        Возвращает:
+            wallet - запись о кошельке из БД или None, если кошелек не принадлежит пользователю.
+        """
+        try:
+            data = await db.execute(
+                select(Wallets).where(Wallets.id == wallet_id, Wallets.user_id == user_id)
+            )
+            wallet = data.scalars().first()
+            return wallet
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def exists_for_user(db: AsyncSession, wallet_id: int, user_id: int) -> bool:
+        """
+        Проверка принадлежности кошелька пользователю.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            wallet_id: int - целочисленный уникальный ключ записи о кошельке;
+            user_id: int - целочисленный уникальный ключ пользователя.
+
+        Возвращает:
+            True, если кошелек существует и принадлежит пользователю, иначе False.
+        """
+        try:
+            data = await db.execute(
+                select(Wallets.id).where(Wallets.id == wallet_id, Wallets.user_id == user_id)
+            )
+            return data.scalar_one_or_none() is not None
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def get_ids(db: AsyncSession, wallet_ids, user_id: int | None = None) -> set[int]:
+        """
+        Получение уникальных ключей существующих кошельков из переданного набора одним запросом.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            wallet_ids - набор уникальных ключей кошельков;
+            user_id: int | None - целочисленный уникальный ключ пользователя (None - без проверки владельца).
+
+        Возвращает:
+            ids: set[int] - ключи кошельков, которые существуют и принадлежат пользователю.
+        """
+        try:
+            stmt = select(Wallets.id).where(Wallets.id.in_(set(wallet_ids)))
+            if user_id is not None:
+                stmt = stmt.where(Wallets.user_id == user_id)
+            data = await db.execute(stmt)
+            ids = set(data.scalars().all())
+            return ids
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def change_amount(db: AsyncSession, wallet_id: int, delta: Decimal):
+        """
+        Атомарное изменение баланса кошелька одним запросом.
+
+        Баланс меняется на стороне БД (UPDATE ... SET amount = amount + :delta), списание выполняется
+        только при достаточном количестве средств, поэтому параллельные операции не теряют обновления.
+        Загруженные в сессию объекты кошелька не изменяются: актуальный баланс - возвращаемое значение.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            wallet_id: int - целочисленный уникальный ключ записи о кошельке;
+            delta: Decimal - изменение баланса (отрицательное значение - списание).
+
+        Возвращает:
+            amount - новый баланс кошелька или None, если кошелек не найден либо средств недостаточно.
+        """
+        try:
+            stmt = update(Wallets).where(Wallets.id == wallet_id)
+            if delta < 0:
+                stmt = stmt.where(Wallets.amount >= -delta)
+            stmt = (stmt.values(amount=Wallets.amount + delta).returning(Wallets.amount, Wallets.user_id)
+                    .execution_options(synchronize_session=False))
+            data = await db.execute(stmt)
+            wallet = data.first()
+            if wallet is None:
+                return None
+            analytics_cache.mark_dirty(db, wallet.user_id)
+            return wallet.amount
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
+    @staticmethod
+    async def transfer(db: AsyncSession, from_wallet_id: int, to_wallet_id: int, amount: Decimal):
+        """
+        Атомарный перевод средств между кошельками.
+
+        Строки кошельков изменяются в порядке возрастания уникального ключа, чтобы параллельные встречные
+        переводы блокировали строки в одном порядке и не приводили к взаимной блокировке.
+        Если средств недостаточно, уже выполненное зачисление отменяется.
+
+        Параметры:
+            db: AsyncSession - асинхронная сессия БД;
+            from_wallet_id: int - целочисленный уникальный ключ кошелька списания;
+            to_wallet_id: int - целочисленный уникальный ключ кошелька зачисления;
+            amount: Decimal - сумма перевода.
+
+        Возвращает:
+            (from_amount, to_amount) - новые балансы кошельков или None, если средств недостаточно.
+        """
+        try:
+            if from_wallet_id == to_wallet_id:
+                raise ValueError('Нельзя перевести средства на тот же кошелек.')
+            deltas = {from_wallet_id: -amount, to_wallet_id: amount}
+            balances = {}
+            for wallet_id in sorted(deltas):
+                balance = await WalletsCRUD.change_amount(db, wallet_id, deltas[wallet_id])
+                if balance is None:
+                    for applied_id in balances:
+                        await WalletsCRUD.change_amount(db, applied_id, -deltas[applied_id])
+                    return None
+                balances[wallet_id] = balance
+            return balances[from_wallet_id], balances[to_wallet_id]
+        except OperationalError:
+            raise
+        except Exception:
+            raise
+
     @staticmethod
     async def create(db: AsyncSession, wallet: Wallets):
         """
@@ -68,6 +236,7 @@ class WalletsCRUD:
         """
         try:
             db.add(wallet)
+            analytics_cache.mark_dirty(db, wallet.user_id)
             return {
                 'amount': wallet.amount,
                 'type_of_wallet': wallet.type_of_wallet,
@@ -85,6 +254,9 @@ class WalletsCRUD:
         """
         Обновление существующей записи о кошельке.
 
+        Суммы за месяц (RollupsCRUD) не пересчитываются: после смены владельца кошелька с транзакциями
+        нужно выполнить RollupsCRUD.rebuild.
+
         Параметры:
             db: AsyncSession - асинхронная сессия БД;
             wallet_id: int - целочисленный уникальный ключ записи о кошельке;
@@ -100,11 +272,15 @@ class WalletsCRUD:
         try:
             data = await db.execute(select(Wallets).where(Wallets.id == wallet_id))
             wallet = data.scalars().first()
+            if not wallet:
+                raise NoResultFound(f'Кошелек с id={wallet_id} не найден.')
+            old_user_id = wallet.user_id
             for field, value in changes.items():
                 if hasattr(wallet, field):
                     setattr(wallet, field, value)
                 else:
                     raise ValueError(f'Поле "{field}" не существует в модели.')
+            analytics_cache.mark_dirty(db, old_user_id, wallet.user_id)
             return {
                 'amount': wallet.amount,
                 'type_of_wallet': wallet.type_of_wallet,
@@ -133,6 +309,7 @@ class WalletsCRUD:
             wallet = data.scalars().first()
             if not wallet:
                 raise NoResultFound(f'Кошелек с id={wallet_id} не найден.')
+            analytics_cache.mark_dirty(db, wallet.user_id)
             await db.delete(wallet)
             return {
                 'message': f'Удаление записи с id={wallet_id} прошло успешно.'
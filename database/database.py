@@ -1,16 +1,131 @@
+from fastapi import Request, Response
+from sqlalchemy import make_url
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import config
 from config import DB_URL
+from database.pool import InstrumentedQueuePool, pool_stats
+from database.replicas import ReplicaSet
 
-async_engine = create_async_engine(url=DB_URL)
+DB_POOL_SIZE = getattr(config, 'DB_POOL_SIZE', 5)
+DB_MAX_OVERFLOW = getattr(config, 'DB_MAX_OVERFLOW', 10)
+DB_POOL_TIMEOUT = getattr(config, 'DB_POOL_TIMEOUT', 30)
+DB_POOL_PRE_PING = getattr(config, 'DB_POOL_PRE_PING', False)
+DB_POOL_RECYCLE = getattr(config, 'DB_POOL_RECYCLE', -1)
+DB_QUERY_CACHE_SIZE = getattr(config, 'DB_QUERY_CACHE_SIZE', 500)
+DB_STATEMENT_CACHE_SIZE = getattr(config, 'DB_STATEMENT_CACHE_SIZE', None)
+DB_PREPARED_STATEMENT_CACHE_SIZE = getattr(config, 'DB_PREPARED_STATEMENT_CACHE_SIZE', None)
+DB_REPLICA_URLS = getattr(config, 'DB_REPLICA_URLS', ())
+DB_REPLICA_STRATEGY = getattr(config, 'DB_REPLICA_STRATEGY', 'round_robin')
+DB_REPLICA_HEALTH_INTERVAL = getattr(config, 'DB_REPLICA_HEALTH_INTERVAL', 5.0)
+DB_REPLICA_HEALTH_TIMEOUT = getattr(config, 'DB_REPLICA_HEALTH_TIMEOUT', 1.0)
+DB_READ_YOUR_WRITES_TTL = getattr(config, 'DB_READ_YOUR_WRITES_TTL', 5)
+DB_READ_PRIMARY_COOKIE = 'db_read_primary'
+SNAPSHOT_ISOLATION_LEVELS = {'postgresql': 'REPEATABLE READ', 'sqlite': 'SERIALIZABLE'}
+DB_READ_MODE = getattr(config, 'DB_READ_MODE', 'autocommit')
+
+if isinstance(DB_REPLICA_URLS, str):
+    DB_REPLICA_URLS = [url.strip() for url in DB_REPLICA_URLS.split(',') if url.strip()]
+
+
+def engine_options(url: str) -> dict:
+    """
+    Параметры движка БД из модуля config.
+
+    Размер пула, переполнение и таймаут задаются только для серверных СУБД: для SQLite пул выбирает сам диалект.
+    Для asyncpg DB_STATEMENT_CACHE_SIZE и DB_PREPARED_STATEMENT_CACHE_SIZE задают кэш подготовленных запросов
+    драйвера и диалекта (0 отключает кэш, например, при работе через pgbouncer).
+    В режиме чтения autocommit при возврате соединения в пул не выполняется лишний ROLLBACK.
+
+    Параметры:
+        url: str - адрес БД.
+
+    Возвращает:
+        dict - именованные параметры для create_async_engine.
+    """
+    url = make_url(url)
+    options = {
+        'pool_pre_ping': DB_POOL_PRE_PING,
+        'pool_recycle': DB_POOL_RECYCLE,
+        'query_cache_size': DB_QUERY_CACHE_SIZE
+    }
+    if DB_READ_MODE == 'autocommit':
+        options['skip_autocommit_rollback'] = True
+    if url.get_backend_name() != 'sqlite':
+        options.update({
+            'poolclass': InstrumentedQueuePool,
+            'pool_size': DB_POOL_SIZE,
+            'max_overflow': DB_MAX_OVERFLOW,
+            'pool_timeout': DB_POOL_TIMEOUT
+        })
+    if url.get_driver_name() == 'asyncpg':
+        connect_args = {}
+        if DB_STATEMENT_CACHE_SIZE is not None:
+            connect_args['statement_cache_size'] = DB_STATEMENT_CACHE_SIZE
+        if DB_PREPARED_STATEMENT_CACHE_SIZE is not None:
+            connect_args['prepared_statement_cache_size'] = DB_PREPARED_STATEMENT_CACHE_SIZE
+        if connect_args:
+            options['connect_args'] = connect_args
+    return options
+
+
+def read_execution_options(url: str) -> dict:
+    """
+    Параметры выполнения запросов для сессий только для чтения (DB_READ_MODE из модуля config).
+
+    autocommit - запросы выполняются без BEGIN/COMMIT;
+    read_only - транзакция открывается как READ ONLY (только PostgreSQL, для остальных СУБД - обычная транзакция);
+    transaction - обычная транзакция.
+
+    Параметры:
+        url: str - адрес БД.
+
+    Возвращает:
+        dict - параметры для engine.execution_options.
+    """
+    if DB_READ_MODE == 'autocommit':
+        return {'isolation_level': 'AUTOCOMMIT'}
+    if DB_READ_MODE == 'read_only' and make_url(url).get_backend_name() == 'postgresql':
+        return {'postgresql_readonly': True}
+    return {}
+
+
+async_engine = create_async_engine(url=DB_URL, **engine_options(DB_URL))
 async_session = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+async_read_session = async_sessionmaker(
+    bind=async_engine.execution_options(**read_execution_options(DB_URL)), expire_on_commit=False
+)
+replicas = ReplicaSet(
+    [create_async_engine(url=url, **engine_options(url)).execution_options(**read_execution_options(url))
+     for url in DB_REPLICA_URLS],
+    strategy=DB_REPLICA_STRATEGY,
+    health_interval=DB_REPLICA_HEALTH_INTERVAL,
+    health_timeout=DB_REPLICA_HEALTH_TIMEOUT
+)
+
+
+def db_pool_stats() -> dict:
+    """
+    Метрики пулов соединений основной БД и реплик.
+
+    Возвращает:
+        dict - метрики пула основной БД (см. database.pool.pool_stats), метрики пулов реплик и выбора реплик.
+    """
+    stats = pool_stats(async_engine.pool)
+    if replicas.engines:
+        stats['replicas'] = [pool_stats(engine.pool) for engine in replicas.engines]
+        stats['routing'] = replicas.stats()
+    return stats
 
 
 class Base(DeclarativeBase):
     pass
 
 
-async def get_db():
+async def get_db(request: Request, response: Response):
+    if request.method not in ('GET', 'HEAD') and replicas.engines and DB_READ_YOUR_WRITES_TTL:
+        response.set_cookie(DB_READ_PRIMARY_COOKIE, '1', max_age=DB_READ_YOUR_WRITES_TTL, httponly=True)
     db = async_session()
     try:
         yield db
@@ -19,4 +134,50 @@ async def get_db():
         await db.rollback()
         raise
     finally:
-        await db.close()
\ No newline at end of file
+        await db.close()
+
+
+async def get_read_db(request: Request):
+    """
+    Сессия БД только для чтения.
+
+    Сессия открывается на одной из доступных реплик, а если реплик нет, все они недоступны
+    или клиент недавно изменял данные (cookie db_read_primary, выставляемая get_db), - на основной БД.
+    Транзакция открывается в режиме DB_READ_MODE (по умолчанию без BEGIN/COMMIT), изменения в сессии не фиксируются.
+    Реплика, упавшая с ошибкой соединения, исключается из выбора. Признак чтения с реплики сохраняется
+    в request.state.read_replica.
+    """
+    index = None
+    if not request.cookies.get(DB_READ_PRIMARY_COOKIE):
+        index = await replicas.choose()
+    db = async_read_session() if index is None else replicas.sessions[index]()
+    request.state.read_replica = index is not None
+    replicas.acquire(index)
+    try:
+        yield db
+    except OperationalError:
+        if index is not None:
+            replicas.mark_failed(index)
+        raise
+    finally:
+        replicas.release(index)
+        await db.close()
+
+
+async def begin_read_snapshot(db: AsyncSession):
+    """
+    Открытие транзакции в сессии только для чтения перед долгим потоковым чтением.
+
+    В режиме DB_READ_MODE=autocommit запросы выполняются вне транзакции, а серверные курсоры PostgreSQL
+    работают только внутри нее. Транзакция открывается с уровнем изоляции из SNAPSHOT_ISOLATION_LEVELS,
+    поэтому все пачки читаются из одного снимка данных. В остальных режимах и в уже открытой транзакции
+    сессия не меняется.
+
+    Параметры:
+        db: AsyncSession - сессия БД только для чтения.
+    """
+    if DB_READ_MODE != 'autocommit' or db.in_transaction():
+        return
+    isolation_level = SNAPSHOT_ISOLATION_LEVELS.get(db.get_bind().dialect.name)
+    if isolation_level is not None:
+        await db.connection(execution_options={'isolation_level': isolation_level})
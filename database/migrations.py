@@ -0,0 +1,153 @@
+import asyncio
+import time
+from alembic import op
+from sqlalchemy import func, select, update
+
+
+def id_ranges(first_id: int, last_id: int, batch_size: int):
+    """
+    Разбиение диапазона первичных ключей на полуоткрытые отрезки [start, end).
+
+    Параметры:
+        first_id: int - наименьший ключ;
+        last_id: int - наибольший ключ (входит в последний отрезок);
+        batch_size: int - длина отрезка.
+
+    Возвращает:
+        генератор пар (start, end).
+    """
+    for start in range(first_id, last_id + 1, batch_size):
+        yield start, min(start + batch_size, last_id + 1)
+
+
+def create_index_concurrently(index_name: str, table_name: str, columns: list, **kwargs):
+    """
+    Создание индекса в миграции без блокировки записи в таблицу.
+
+    В PostgreSQL индекс создается командой CREATE INDEX CONCURRENTLY вне транзакции миграции.
+    Если построение прервано, в БД остается невалидный индекс: его нужно удалить drop_index_concurrently
+    и повторить миграцию. Уже существующий индекс (например, созданный scripts.create_indexes) пропускается.
+
+    Параметры:
+        index_name: str - имя индекса;
+        table_name: str - имя таблицы;
+        columns: list - колонки индекса;
+        kwargs - прочие параметры op.create_index (например, postgresql_include).
+    """
+    if op.get_context().dialect.name != 'postgresql':
+        op.create_index(index_name, table_name, columns, if_not_exists=True, **kwargs)
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(index_name, table_name, columns, if_not_exists=True, postgresql_concurrently=True, **kwargs)
+
+
+def drop_index_concurrently(index_name: str, table_name: str):
+    """
+    Удаление индекса в миграции без блокировки таблицы (DROP INDEX CONCURRENTLY в PostgreSQL).
+
+    Параметры:
+        index_name: str - имя индекса;
+        table_name: str - имя таблицы.
+    """
+    if op.get_context().dialect.name != 'postgresql':
+        op.drop_index(index_name, table_name=table_name, if_exists=True)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(index_name, table_name=table_name, if_exists=True, postgresql_concurrently=True)
+
+
+def add_column_online(table_name: str, column, server_default=None):
+    """
+    Добавление колонки без перезаписи таблицы.
+
+    Колонка добавляется допускающей NULL и без значения по умолчанию: в PostgreSQL это изменение только каталога,
+    таблица не переписывается и блокируется на короткое время. Значение по умолчанию для новых записей
+    выставляется отдельной командой ALTER COLUMN ... SET DEFAULT, которая существующие записи не затрагивает;
+    они заполняются пачками через backfill_in_batches.
+
+    Параметры:
+        table_name: str - имя таблицы;
+        column: Column - новая колонка (nullable=True, без server_default);
+        server_default - значение по умолчанию для новых записей.
+    """
+    if not column.nullable or column.server_default is not None:
+        raise ValueError('Колонка должна допускать NULL и не иметь значения по умолчанию.')
+    op.add_column(table_name, column)
+    if server_default is not None:
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(column.name, server_default=server_default)
+
+
+def backfill_in_batches(table, values: dict, *where, batch_size: int = 10000, pause: float = 0.0) -> int:
+    """
+    Заполнение колонок в миграции пачками по диапазонам первичного ключа.
+
+    Каждая пачка - отдельный UPDATE по отрезку id, фиксируемый сразу (вне транзакции миграции),
+    поэтому блокировки строк держатся только на время одной пачки.
+    При выводе SQL без подключения к БД (alembic upgrade --sql) диапазон id неизвестен, выводится один UPDATE.
+
+    Параметры:
+        table - таблица (sa.table или Table) с колонкой id;
+        values: dict - новые значения колонок;
+        where - дополнительные условия отбора записей (например, table.c.created_at.is_(None));
+        batch_size: int - количество ключей в отрезке;
+        pause: float - пауза между пачками в секундах.
+
+    Возвращает:
+        count: int - количество обновленных записей.
+    """
+    if op.get_context().as_sql:
+        op.execute(update(table).where(*where).values(values))
+        return 0
+    connection = op.get_bind()
+    count = 0
+    with op.get_context().autocommit_block():
+        first_id, last_id = connection.execute(select(func.min(table.c.id), func.max(table.c.id))).one()
+        if first_id is None:
+            return count
+        for start, end in id_ranges(first_id, last_id, batch_size):
+            data = connection.execute(
+                update(table).where(table.c.id >= start, table.c.id < end, *where).values(values)
+            )
+            count += data.rowcount
+            if pause:
+                time.sleep(pause)
+    return count
+
+
+async def backfill_by_id_range(session_maker, model, values: dict, *where, batch_size: int = 10000,
+                               pause: float = 0.0) -> int:
+    """
+    Заполнение колонок работающей таблицы (например, Transactions) пачками по диапазонам первичного ключа.
+
+    Граница диапазона фиксируется в начале, каждая пачка обновляется и фиксируется в своей сессии,
+    между пачками выдерживается пауза, чтобы не вытеснять запросы приложения.
+    В отличие от выборки "первые N незаполненных", каждый UPDATE читает только свой отрезок индекса первичного ключа.
+
+    Параметры:
+        session_maker - фабрика асинхронных сессий БД;
+        model - ORM-модель с колонкой id;
+        values: dict - новые значения колонок;
+        where - дополнительные условия отбора записей (например, Transactions.created_at.is_(None));
+        batch_size: int - количество ключей в отрезке;
+        pause: float - пауза между пачками в секундах.
+
+    Возвращает:
+        count: int - количество обновленных записей.
+    """
+    async with session_maker() as db:
+        first_id, last_id = (await db.execute(select(func.min(model.id), func.max(model.id)))).one()
+    count = 0
+    if first_id is None:
+        return count
+    for start, end in id_ranges(first_id, last_id, batch_size):
+        async with session_maker() as db:
+            data = await db.execute(
+                update(model).where(model.id >= start, model.id < end, *where).values(values)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+        count += data.rowcount
+        if pause:
+            await asyncio.sleep(pause)
+    return count
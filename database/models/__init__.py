@@ -4,7 +4,9 @@ from .users import Users
 from .budgets import Budgets
 from .categories import Categories
 from .wallets import Wallets
+from .idempotency_keys import IdempotencyKeys
+from .monthly_rollups import MonthlyRollups
 
 
-__all__ = ["Users", "Budgets", "Categories", "Transactions", "Wallets", "Goals"]
+__all__ = ["Users", "Budgets", "Categories", "Transactions", "Wallets", "Goals", "IdempotencyKeys", "MonthlyRollups"]
 
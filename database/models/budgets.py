@@ -1,5 +1,5 @@
 from decimal import Decimal
-from sqlalchemy import Integer, String, Numeric, ForeignKey
+from sqlalchemy import Integer, String, Numeric, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.database import Base
 
@@ -15,11 +15,19 @@ class Budgets(Base):
         category_id: Integer - ссылка на таблицу категорий,
         user_id: Integer - ссылка на таблицу пользователей.
 
+    Индексы:
+        ix_budgets_user_id_id - бюджеты пользователя по порядку,
+        ix_budgets_category_id - бюджеты категории.
+
     Связи:
         user - одному пользователю может принадлежать много бюджетов (многие к одному),
         category - у одного категорий может быть много бюджетов (многие к одному).
     """
     __tablename__ = 'budgets'
+    __table_args__ = (
+        Index('ix_budgets_user_id_id', 'user_id', 'id'),
+        Index('ix_budgets_category_id', 'category_id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str | None] = mapped_column(String(250))
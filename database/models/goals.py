@@ -1,6 +1,6 @@
 from decimal import Decimal
 from datetime import date
-from sqlalchemy import Integer, String, Numeric, ForeignKey, Date
+from sqlalchemy import Integer, String, Numeric, ForeignKey, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.database import Base
 
@@ -17,10 +17,16 @@ class Goals(Base):
         actual_amount: Numeric(10, 2) - текущая сумма,
         user_id: Integer - ссылка на пользователя.
 
+    Индексы:
+        ix_goals_user_id_id - цели пользователя по порядку.
+
     Связи:
         user - у многих целей может быть один пользователь (многие к одному).
     """
     __tablename__ = 'goals'
+    __table_args__ = (
+        Index('ix_goals_user_id_id', 'user_id', 'id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str | None] = mapped_column(String(250))
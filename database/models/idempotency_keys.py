@@ -0,0 +1,26 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from database.database import Base
+
+
+class IdempotencyKeys(Base):
+    """
+    ORM-модель таблицы ключей идемпотентности денежных операций.
+
+    Поля:
+        user_id: Integer - ссылка на пользователя (часть составного первичного ключа),
+        key: String(255) - ключ идемпотентности из заголовка Idempotency-Key (часть составного первичного ключа),
+        request_hash: String(64) - хэш запроса (метод, путь, параметры и тело),
+        status_code: Integer - код ответа,
+        response: Text - тело ответа в формате JSON,
+        created_at: DateTime - время выполнения запроса.
+    """
+    __tablename__ = 'idempotency_keys'
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), primary_key=True)
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String(64))
+    status_code: Mapped[int] = mapped_column(Integer, default=200)
+    response: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now, index=True)
@@ -0,0 +1,25 @@
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import Integer, Numeric, Date, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+from database.database import Base
+
+
+class MonthlyRollups(Base):
+    """
+    ORM-модель таблицы с суммами транзакций пользователя по категориям за месяц.
+
+    Поля:
+        user_id: Integer - ссылка на пользователя (часть составного первичного ключа),
+        category_id: Integer - ссылка на категорию (часть составного первичного ключа),
+        month: Date - первый день месяца (часть составного первичного ключа),
+        amount: Numeric(14, 2) - сумма транзакций (доходы со знаком плюс, расходы со знаком минус),
+        count: Integer - количество транзакций.
+    """
+    __tablename__ = 'monthly_rollups'
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete='CASCADE'), primary_key=True)
+    category_id: Mapped[int] = mapped_column(ForeignKey("categories.id", ondelete='CASCADE'), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0)
+    count: Mapped[int] = mapped_column(Integer, default=0)
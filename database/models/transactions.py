@@ -1,5 +1,6 @@
+from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Integer, Numeric, ForeignKey
+from sqlalchemy import Integer, Numeric, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.database import Base
 
@@ -12,18 +13,31 @@ class Transactions(Base):
         id: Integer - уникальный ключ,
         amount: Numeric(10, 2) - сумма транзакции,
         wallet_id: Integer - ссылка на кошелек,
-        category_id: Integer - ссылка на категорию.
+        category_id: Integer - ссылка на категорию,
+        created_at: DateTime - время создания транзакции (у старых записей заполняется
+            миграцией 0002 или скриптом scripts.backfill_transactions_created_at).
+
+    Индексы:
+        ix_transactions_wallet_id_created_at - выборка транзакций кошелька за период,
+        ix_transactions_wallet_id_id - транзакции кошелька по порядку (в PostgreSQL покрывающий: INCLUDE amount, category_id),
+        ix_transactions_category_id - транзакции категории.
 
     Связи:
         wallet - у одного кошелька может быть много транзакций (один ко многим),
         category - у одной категории может быть много транзакций (один ко многим).
     """
     __tablename__ = 'transactions'
+    __table_args__ = (
+        Index('ix_transactions_wallet_id_created_at', 'wallet_id', 'created_at'),
+        Index('ix_transactions_wallet_id_id', 'wallet_id', 'id', postgresql_include=['amount', 'category_id']),
+        Index('ix_transactions_category_id', 'category_id'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(10, 2))
     wallet_id: Mapped[int] = mapped_column(ForeignKey("wallets.id"))
     category_id: Mapped[int] = mapped_column(ForeignKey("categories.id"))
+    created_at: Mapped[datetime | None] = mapped_column(DateTime, default=datetime.now, server_default=func.now())
 
     wallet: Mapped["Wallets"] = relationship('Wallets', back_populates='transactions')
     category: Mapped["Categories"] = relationship('Categories', back_populates='transactions')
\ No newline at end of file
@@ -16,7 +16,8 @@ class Users(Base):
         passport: String(11) - паспорт пользователя,
         login: String(255) - логин пользователя,
         password: String(255) - пароль пользователя,
-        is_admin: Boolean - является ли пользователь администратором.
+        is_admin: Boolean - является ли пользователь администратором,
+        token_version: Integer - версия выданных токенов (увеличивается для отзыва токенов).
 
     Связи:
         wallets - у одного пользователя может быть много кошельков (один ко многим),
@@ -33,6 +34,7 @@ class Users(Base):
     login: Mapped[str | None] = mapped_column(String(255), unique=True)
     password: Mapped[str | None] = mapped_column(String(255))
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default='0')
 
     wallets: Mapped[list["Wallets"]] = relationship('Wallets', back_populates='user')
     goals: Mapped[list["Goals"]] = relationship('Goals', back_populates='user')
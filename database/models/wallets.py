@@ -1,6 +1,6 @@
 import enum
 from decimal import Decimal
-from sqlalchemy import Integer, Numeric, ForeignKey
+from sqlalchemy import Integer, Numeric, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from database.database import Base
 
@@ -24,11 +24,18 @@ class Wallets(Base):
         user_id: Integer - ссылка на пользователя,
         amount: Numeric(10, 2) - сумма средств на кошельке.
 
+    Индексы:
+        ix_wallets_user_id_id - кошельки пользователя по порядку и проверка владельца кошелька
+            (в PostgreSQL покрывающий: INCLUDE type_of_wallet, amount).
+
     Связи:
         user - у многих кошельков может быть один пользователь (многие к одному),
         transactions - у одного кошелька может быть много транзакций (один ко многим).
     """
     __tablename__ = 'wallets'
+    __table_args__ = (
+        Index('ix_wallets_user_id_id', 'user_id', 'id', postgresql_include=['type_of_wallet', 'amount']),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     type_of_wallet: Mapped[TypesOfWallet] = mapped_column(default='Cash')
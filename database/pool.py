@@ -0,0 +1,70 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, считающий время ожидания свободного соединения.
+
+    Время ожидания - это время выдачи соединения из пула, включая установку нового соединения сверх размера пула.
+    Счетчики хранятся в самом пуле и сбрасываются при его пересоздании (engine.dispose()).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.checked_out_max = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - started
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+        self.checkouts += 1
+        self.checked_out_max = max(self.checked_out_max, self.checkedout())
+        return connection
+
+
+def pool_stats(pool) -> dict:
+    """
+    Метрики пула соединений.
+
+    Параметры:
+        pool - пул соединений движка (engine.pool).
+
+    Возвращает:
+        dict - размер пула, число выданных соединений, насыщенность (доля выданных от максимума)
+        и, для InstrumentedQueuePool, время ожидания соединения в миллисекундах.
+    """
+    if not isinstance(pool, QueuePool):
+        return {'pool': type(pool).__name__}
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    stats = {
+        'pool': type(pool).__name__,
+        'size': pool.size(),
+        'max_overflow': pool._max_overflow,
+        'timeout': pool.timeout(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': pool.overflow(),
+        'saturation': round(pool.checkedout() / capacity, 4) if capacity else 0.0
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update({
+            'checkouts': pool.checkouts,
+            'timeouts': pool.timeouts,
+            'checked_out_max': pool.checked_out_max,
+            'wait_avg_ms': round(pool.wait_total / pool.checkouts * 1000, 3) if pool.checkouts else 0.0,
+            'wait_max_ms': round(pool.wait_max * 1000, 3)
+        })
+    return stats
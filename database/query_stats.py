@@ -0,0 +1,85 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """
+    Счетчики SQL-запросов одного HTTP-запроса (или другого участка кода, см. track_queries).
+
+    Счетчики:
+        queries: int - количество выполненных запросов,
+        affected_rows: int - количество строк, измененных INSERT/UPDATE/DELETE (строки SELECT не считаются),
+        duration: float - суммарное время выполнения запросов в секундах,
+        statements: Counter - количество выполнений каждого текста запроса.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.affected_rows = 0
+        self.duration = 0.0
+        self.statements = Counter()
+
+    def repeated(self, threshold: int) -> dict:
+        """
+        Запросы, выполненные не меньше threshold раз (признак N+1: запрос в цикле вместо одного общего).
+
+        Параметры:
+            threshold: int - минимальное количество повторов.
+
+        Возвращает:
+            dict - текст запроса и количество его выполнений.
+        """
+        return {statement: count for statement, count in self.statements.items() if count >= threshold}
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar('query_stats', default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info['query_started'] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    stats.duration += time.perf_counter() - conn.info.pop('query_started', time.perf_counter())
+    stats.queries += 1
+    stats.statements[statement] += 1
+    # количество строк SELECT сообщают не все драйверы (sqlite - нет, rowcount = -1), поэтому считаются только
+    # строки, измененные запросами без результата или DML с RETURNING
+    if cursor.description is None or context.is_crud:
+        stats.affected_rows += max(context.rowcount, 0)
+
+
+def install_query_events():
+    """
+    Подписка на события выполнения запросов всех движков SQLAlchemy (основная БД, реплики, тестовые БД).
+
+    Запросы считаются, только если счетчик включен через track_queries в текущем контексте.
+    """
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+@contextmanager
+def track_queries():
+    """
+    Подсчет SQL-запросов, выполненных внутри блока with (включая вложенные задачи asyncio, созданные в нем).
+
+    Возвращает:
+        QueryStats - счетчики, заполняемые по мере выполнения запросов.
+    """
+    install_query_events()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+
+class ReplicaSet:
+    """
+    Набор реплик для чтения с проверкой доступности и выбором реплики для очередного запроса.
+
+    Реплика, не ответившая на проверку или упавшая с ошибкой соединения, исключается из выбора
+    до следующей успешной проверки. Если доступных реплик нет, чтение идет с основной БД.
+
+    Параметры:
+        engines: list[AsyncEngine] - движки реплик,
+        strategy: str - способ выбора реплики: round_robin (по очереди) или least_connections (с наименьшим числом сессий),
+        health_interval: float - период проверки доступности реплик в секундах,
+        health_timeout: float - время ожидания ответа реплики при проверке в секундах.
+    """
+
+    def __init__(self, engines: list[AsyncEngine], strategy: str = 'round_robin',
+                 health_interval: float = 5.0, health_timeout: float = 1.0):
+        if strategy not in ('round_robin', 'least_connections'):
+            raise ValueError(f'Неизвестный способ выбора реплики: {strategy}')
+        self.engines = list(engines)
+        self.sessions = [async_sessionmaker(bind=engine, expire_on_commit=False) for engine in self.engines]
+        self.strategy = strategy
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.healthy = set(range(len(self.engines)))
+        self.in_use = [0] * len(self.engines)
+        self.reads = [0] * len(self.engines)
+        self.primary_reads = 0
+        self.failures = 0
+        self._checked_at = time.monotonic()
+        self._next = 0
+
+    async def _ping(self, index: int) -> bool:
+        try:
+            async with asyncio.timeout(self.health_timeout):
+                async with self.engines[index].connect() as conn:
+                    await conn.execute(text('SELECT 1'))
+            return True
+        except Exception:
+            return False
+
+    async def check_health(self):
+        """
+        Проверка доступности всех реплик запросом SELECT 1.
+        """
+        self._checked_at = time.monotonic()
+        results = await asyncio.gather(*(self._ping(index) for index in range(len(self.engines))))
+        self.healthy = {index for index, alive in enumerate(results) if alive}
+
+    async def choose(self) -> int | None:
+        """
+        Выбор реплики для чтения.
+
+        Возвращает:
+            index: int | None - номер реплики или None, если доступных реплик нет.
+        """
+        if not self.engines:
+            return None
+        if time.monotonic() - self._checked_at >= self.health_interval:
+            await self.check_health()
+        candidates = sorted(self.healthy)
+        if not candidates:
+            return None
+        if self.strategy == 'least_connections':
+            return min(candidates, key=lambda index: self.in_use[index])
+        index = candidates[self._next % len(candidates)]
+        self._next += 1
+        return index
+
+    def mark_failed(self, index: int):
+        """
+        Исключение реплики из выбора до следующей проверки доступности.
+
+        Параметры:
+            index: int - номер реплики.
+        """
+        self.failures += 1
+        self.healthy.discard(index)
+
+    def acquire(self, index: int | None):
+        if index is None:
+            self.primary_reads += 1
+        else:
+            self.reads[index] += 1
+            self.in_use[index] += 1
+
+    def release(self, index: int | None):
+        if index is not None:
+            self.in_use[index] -= 1
+
+    def stats(self) -> dict:
+        return {
+            'replicas': len(self.engines),
+            'strategy': self.strategy,
+            'healthy': sorted(self.healthy),
+            'in_use': list(self.in_use),
+            'reads': list(self.reads),
+            'primary_reads': self.primary_reads,
+            'failures': self.failures
+        }
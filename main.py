@@ -1,7 +1,10 @@
+from contextlib import asynccontextmanager
 from authx.exceptions import MissingTokenError, JWTDecodeError
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, HTTPException
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import OperationalError, ProgrammingError
 
+from cache import principal_cache, analytics_cache, category_catalogue, check_shared_backends
 from api import (budget_router,
                  goal_router,
                  category_router,
@@ -9,11 +12,33 @@ from api import (budget_router,
                  user_router,
                  wallet_router,
                  sign_in_router, personal_cabinet_router, analytics_router, operation_router)
+from api.query_stats import QueryStatsMiddleware
+from api.sign_in_router import get_current_principal
+from database.cruds import CategoriesCRUD
+from database.database import async_session, db_pool_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Проверка общих хранилищ кэша для нескольких процессов и загрузка справочника категорий при запуске приложения.
+    Если БД недоступна или схема еще не создана, справочник загрузится при первом обращении.
+    """
+    check_shared_backends()
+    try:
+        async with async_session() as db:
+            await CategoriesCRUD.get_catalogue(db)
+    except (OperationalError, ProgrammingError):
+        pass
+    yield
+
 
 app = FastAPI(
     title="API для финансового трекера",
-    description="API для управления личными финансами и бюджетом"
+    description="API для управления личными финансами и бюджетом",
+    lifespan=lifespan
 )
+app.add_middleware(QueryStatsMiddleware)
 
 app.include_router(sign_in_router, tags=['Вход в систему'])
 app.include_router(personal_cabinet_router, tags=['Личный кабинет'])
@@ -59,6 +84,24 @@ def heath_check():
     return {'status': 'healthy'}
 
 
+@app.get('/metrics')
+async def metrics(current_user: dict = Depends(get_current_principal)):
+    """
+    Метрики кэшей и пулов соединений, доступны только администраторам.
+    """
+    if not current_user['is_admin']:
+        raise HTTPException(
+            status_code=403,
+            detail='Нет прав на данное действие.'
+        )
+    return {
+        'principal_cache': principal_cache.stats(),
+        'analytics_cache': analytics_cache.stats(),
+        'category_catalogue': category_catalogue.stats(),
+        'db_pool': db_pool_stats()
+    }
+
+
 if __name__ == '__main__':
     import uvicorn
 
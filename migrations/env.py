@@ -0,0 +1,66 @@
+import asyncio
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
+from database.database import Base, DB_URL
+import database.models  # noqa: F401 - регистрация таблиц в Base.metadata
+
+config = context.config
+if config.config_file_name is not None and config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def _database_url() -> str:
+    """
+    Адрес БД: sqlalchemy.url из настроек Alembic (например, в тестах) или DB_URL из модуля config.
+    """
+    return config.get_main_option('sqlalchemy.url') or DB_URL
+
+
+def _configure(**kwargs):
+    """
+    Общие настройки контекста миграций.
+
+    Для SQLite изменения колонок выполняются в режиме batch (пересоздание таблицы), так как ALTER COLUMN не поддерживается.
+    """
+    url = _database_url()
+    context.configure(
+        target_metadata=target_metadata,
+        render_as_batch=url.startswith('sqlite'),
+        compare_type=True,
+        **kwargs
+    )
+
+
+def run_migrations_offline():
+    """
+    Вывод SQL миграций без подключения к БД: alembic upgrade head --sql
+    """
+    _configure(url=_database_url(), literal_binds=True, dialect_opts={'paramstyle': 'named'})
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection):
+    _configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online():
+    """
+    Применение миграций через асинхронный движок приложения.
+    """
+    connectable = create_async_engine(_database_url(), poolclass=pool.NullPool)
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,41 @@
+"""Время создания транзакций: колонка, заполнение пачками и индекс (wallet_id, created_at)
+
+Колонка добавляется без перезаписи таблицы, существующие транзакции заполняются пачками по диапазонам id
+временем применения миграции, индекс строится без блокировки записи (CONCURRENTLY в PostgreSQL).
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 01:20:00.000000
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from database.migrations import add_column_online, backfill_in_batches, create_index_concurrently, \
+    drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, Sequence[str], None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+transactions = sa.table('transactions', sa.column('id', sa.Integer), sa.column('created_at', sa.DateTime))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    add_column_online('transactions', sa.Column('created_at', sa.DateTime(), nullable=True),
+                      server_default=sa.func.now())
+    backfill_in_batches(transactions, {'created_at': datetime.now()}, transactions.c.created_at.is_(None))
+    create_index_concurrently('ix_transactions_wallet_id_created_at', 'transactions', ['wallet_id', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently('ix_transactions_wallet_id_created_at', 'transactions')
+    with op.batch_alter_table('transactions') as batch_op:
+        batch_op.drop_column('created_at')
@@ -0,0 +1,42 @@
+"""Индексы по внешним ключам для выборок в пределах пользователя
+
+Индексы строятся без блокировки записи (CONCURRENTLY в PostgreSQL), уже созданные
+скриптом scripts.create_indexes пропускаются.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 01:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from database.migrations import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, Sequence[str], None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    create_index_concurrently('ix_transactions_wallet_id_id', 'transactions', ['wallet_id', 'id'],
+                              postgresql_include=['amount', 'category_id'])
+    create_index_concurrently('ix_transactions_category_id', 'transactions', ['category_id'])
+    create_index_concurrently('ix_wallets_user_id_id', 'wallets', ['user_id', 'id'],
+                              postgresql_include=['type_of_wallet', 'amount'])
+    create_index_concurrently('ix_budgets_user_id_id', 'budgets', ['user_id', 'id'])
+    create_index_concurrently('ix_budgets_category_id', 'budgets', ['category_id'])
+    create_index_concurrently('ix_goals_user_id_id', 'goals', ['user_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    drop_index_concurrently('ix_goals_user_id_id', 'goals')
+    drop_index_concurrently('ix_budgets_category_id', 'budgets')
+    drop_index_concurrently('ix_budgets_user_id_id', 'budgets')
+    drop_index_concurrently('ix_wallets_user_id_id', 'wallets')
+    drop_index_concurrently('ix_transactions_category_id', 'transactions')
+    drop_index_concurrently('ix_transactions_wallet_id_id', 'transactions')
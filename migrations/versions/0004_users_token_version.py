@@ -0,0 +1,39 @@
+"""Версия выданных токенов пользователя: колонка users.token_version
+
+Колонка добавляется без перезаписи таблицы, существующие пользователи заполняются пачками по диапазонам id
+версией 0, после чего колонка становится NOT NULL.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 01:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from database.migrations import add_column_online, backfill_in_batches
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, Sequence[str], None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+users = sa.table('users', sa.column('id', sa.Integer), sa.column('token_version', sa.Integer))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    add_column_online('users', sa.Column('token_version', sa.Integer(), nullable=True), server_default='0')
+    backfill_in_batches(users, {'token_version': 0}, users.c.token_version.is_(None))
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('token_version', existing_type=sa.Integer(), existing_server_default='0',
+                              nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.drop_column('token_version')
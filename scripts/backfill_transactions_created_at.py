@@ -0,0 +1,32 @@
+import argparse
+import asyncio
+from datetime import datetime
+from database.database import async_session
+from database.migrations import backfill_by_id_range
+from database.models import Transactions
+
+
+async def main(created_at: datetime, batch_size: int, pause: float):
+    """
+    Заполнение времени создания у существующих транзакций без него.
+
+    Колонка и индекс создаются миграцией 0002 (alembic upgrade head), которая и сама заполняет колонку;
+    скрипт нужен для повторного заполнения под нагрузкой: транзакции обходятся пачками по диапазонам id,
+    каждая пачка фиксируется отдельно, между пачками выдерживается пауза.
+
+    Запуск: python -m scripts.backfill_transactions_created_at [--created-at 2024-01-01T00:00:00] [--batch-size 10000]
+        [--pause 0.1]
+    """
+    total = await backfill_by_id_range(async_session, Transactions, {'created_at': created_at},
+                                       Transactions.created_at.is_(None), batch_size=batch_size, pause=pause)
+    print(f'Заполнено время создания у транзакций: {total}.')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Заполнение времени создания у существующих транзакций.')
+    parser.add_argument('--created-at', type=datetime.fromisoformat, default=datetime.now(),
+                        help='Время создания для транзакций без него (по умолчанию - текущее время).')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Количество id в пачке.')
+    parser.add_argument('--pause', type=float, default=0.1, help='Пауза между пачками в секундах.')
+    args = parser.parse_args()
+    asyncio.run(main(args.created_at, args.batch_size, args.pause))
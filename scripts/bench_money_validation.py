@@ -0,0 +1,55 @@
+import argparse
+import random
+import time
+from decimal import Decimal
+from typing import Annotated
+from pydantic import AfterValidator, Field, TypeAdapter
+from shchemas import Money
+
+
+def legacy_validate(amount: Decimal) -> Decimal:
+    """
+    Прежний валидатор схем: перевод суммы в строку и разбиение по точке.
+    """
+    str_value = str(amount)
+    if '.' in str_value:
+        integer_part, decimal_part = str_value.split('.')
+        if len(decimal_part) > 2:
+            raise ValueError('Количество знаков после запятой не может превышать 2.')
+        if len(integer_part) > 8:
+            raise ValueError('Слишком большая сумма.')
+    return amount
+
+
+def _measure(adapter: TypeAdapter, amounts: list) -> float:
+    started = time.perf_counter()
+    adapter.validate_python(amounts)
+    return time.perf_counter() - started
+
+
+def main(count: int, repeat: int):
+    """
+    Сравнение времени проверки денежных сумм прежним валидатором и типом Money.
+
+    Запуск: python -m scripts.bench_money_validation [--count 1000000] [--repeat 3]
+    """
+    generator = random.Random(0)
+    amounts = []
+    for _ in range(count):
+        scale = generator.choice((0, 1, 2))
+        amounts.append(Decimal(generator.randrange(0, 10 ** (8 + scale))).scaleb(-scale))
+    adapters = {
+        'legacy': TypeAdapter(list[Annotated[Decimal, Field(ge=0), AfterValidator(legacy_validate)]]),
+        'money': TypeAdapter(list[Money])
+    }
+    for name, adapter in adapters.items():
+        best = min(_measure(adapter, amounts) for _ in range(repeat))
+        print(f'{name:>6}: {best:.3f} s, {best / count * 1e9:.0f} ns на сумму')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    main(args.count, args.repeat)
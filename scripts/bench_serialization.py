@@ -0,0 +1,90 @@
+import argparse
+import asyncio
+import json
+import time
+from decimal import Decimal
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from database.database import Base
+from database.models import Transactions
+from shchemas import TransactionGetSchema
+
+transactions_adapter = TypeAdapter(List[TransactionGetSchema])
+TRANSACTION_COLUMNS = (Transactions.id, Transactions.amount, Transactions.wallet_id, Transactions.category_id,
+                       Transactions.created_at)
+
+
+async def json_response(db) -> bytes:
+    """
+    ORM-модели, копия __dict__ и кодирование через jsonable_encoder и json (JSONResponse без модели ответа).
+    """
+    transactions = (await db.execute(select(Transactions))).scalars().all()
+    result = [TransactionGetSchema.model_validate(transaction.__dict__) for transaction in transactions]
+    return json.dumps(jsonable_encoder(result)).encode()
+
+
+async def dict_copy(db) -> bytes:
+    """
+    Прежний способ: ORM-модели, копия __dict__ и сериализация в JSON средствами pydantic.
+    """
+    transactions = (await db.execute(select(Transactions))).scalars().all()
+    result = [TransactionGetSchema.model_validate(transaction.__dict__) for transaction in transactions]
+    return transactions_adapter.dump_json(result)
+
+
+async def from_attributes(db) -> bytes:
+    """
+    ORM-модели, чтение атрибутов (from_attributes) и сериализация в JSON средствами pydantic.
+    """
+    transactions = (await db.execute(select(Transactions))).scalars().all()
+    result = [TransactionGetSchema.model_validate(transaction) for transaction in transactions]
+    return transactions_adapter.dump_json(result)
+
+
+async def row_tuples(db) -> bytes:
+    """
+    Выборка колонок без ORM-моделей и карты идентичности, проверка строк одним вызовом TypeAdapter.
+    """
+    rows = (await db.execute(select(*TRANSACTION_COLUMNS))).all()
+    return transactions_adapter.dump_json(transactions_adapter.validate_python(rows, from_attributes=True))
+
+
+async def main(count: int, repeat: int):
+    """
+    Сравнение времени чтения и сериализации списка транзакций в JSON.
+
+    Запуск: python -m scripts.bench_serialization [--count 100000] [--repeat 3]
+    """
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Transactions), [
+            {'amount': Decimal(index % 100000).scaleb(-2), 'wallet_id': index % 100 + 1, 'category_id': index % 10 + 1}
+            for index in range(count)
+        ])
+    session_maker = async_sessionmaker(engine, expire_on_commit=False)
+
+    baseline = None
+    for serialize in (json_response, dict_copy, from_attributes, row_tuples):
+        timings = []
+        for _ in range(repeat):
+            async with session_maker() as db:
+                started = time.perf_counter()
+                body = await serialize(db)
+                timings.append(time.perf_counter() - started)
+        if baseline is None:
+            baseline = json.loads(body)
+        assert json.loads(body) == baseline
+        print(f'{serialize.__name__:>15}: {min(timings):.3f} s, {len(body)} байт')
+    await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.repeat))
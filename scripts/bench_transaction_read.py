@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from api.sign_in_router import config, security
+from database.database import Base, get_db, get_read_db
+from database.models import Users, Categories, Wallets, Transactions
+from main import app
+
+
+def _commit_session(session_maker):
+    """
+    Прежнее поведение: сессия в транзакции с фиксацией после обработчика.
+    """
+    async def dependency():
+        async with session_maker() as db:
+            yield db
+            await db.commit()
+
+    return dependency
+
+
+def _read_session(session_maker):
+    """
+    Сессия только для чтения: запросы без BEGIN/COMMIT, без фиксации и отката.
+    """
+    async def dependency():
+        async with session_maker() as db:
+            yield db
+
+    return dependency
+
+
+async def _fill(session_maker) -> tuple[int, int]:
+    async with session_maker() as db:
+        user = Users(name='bench', passport='1234 567890', login='bench', password='bench', is_admin=True)
+        category = Categories(name='bench', is_public=True, type='Expense')
+        db.add_all([user, category])
+        await db.flush()
+        wallet = Wallets(amount=1000, type_of_wallet='Card', user_id=user.id)
+        db.add(wallet)
+        await db.flush()
+        transaction = Transactions(amount=10, category_id=category.id, wallet_id=wallet.id)
+        db.add(transaction)
+        await db.commit()
+        return user.id, transaction.id
+
+
+async def _measure(client: AsyncClient, url: str, requests: int) -> list[float]:
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(url)
+        timings.append((time.perf_counter() - started) * 1000)
+        response.raise_for_status()
+    return timings
+
+
+async def main(requests: int, warmup: int):
+    """
+    Сравнение задержки GET /transactions/{id} с фиксацией транзакции после чтения и в режиме только для чтения.
+
+    Запуск: python -m scripts.bench_transaction_read [--requests 2000] [--warmup 200]
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite+aiosqlite:///{Path(directory) / 'bench.db'}"
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_maker = async_sessionmaker(engine, expire_on_commit=False)
+        read_session_maker = async_sessionmaker(
+            engine.execution_options(isolation_level='AUTOCOMMIT'), expire_on_commit=False
+        )
+        user_id, transaction_id = await _fill(session_maker)
+        token = security.create_access_token(uid=str(user_id), data={'login': 'bench', 'is_admin': True, 'ver': 0})
+
+        modes = {
+            'commit': _commit_session(session_maker),
+            'read_only': _read_session(read_session_maker)
+        }
+        app.dependency_overrides[get_db] = _commit_session(session_maker)
+        try:
+            async with AsyncClient(transport=ASGITransport(app=app), base_url='http://bench') as client:
+                client.cookies.set(config.JWT_ACCESS_COOKIE_NAME, token)
+                for mode, dependency in modes.items():
+                    app.dependency_overrides[get_read_db] = dependency
+                    await _measure(client, f'/transactions/{transaction_id}', warmup)
+                    timings = sorted(await _measure(client, f'/transactions/{transaction_id}', requests))
+                    print(f'{mode:>10}: mean {statistics.mean(timings):.3f} ms, '
+                          f'p50 {timings[len(timings) // 2]:.3f} ms, '
+                          f'p95 {timings[int(len(timings) * 0.95)]:.3f} ms')
+        finally:
+            app.dependency_overrides.clear()
+            await engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--warmup', type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.warmup))
@@ -0,0 +1,47 @@
+import asyncio
+from sqlalchemy import inspect
+from database.database import Base, async_engine
+import database.models  # noqa: F401 - регистрация таблиц в Base.metadata
+
+
+def _missing_indexes(connection) -> list:
+    """
+    Объявленные в моделях индексы, которых еще нет в БД.
+    """
+    inspector = inspect(connection)
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        missing.extend(index for index in sorted(table.indexes, key=lambda index: index.name)
+                       if index.name not in existing)
+    return missing
+
+
+async def main():
+    """
+    Создание объявленных в моделях индексов, которых еще нет в БД.
+
+    В PostgreSQL индексы создаются командой CREATE INDEX CONCURRENTLY вне транзакции, без блокировки записи в таблицу.
+
+    Запуск: python -m scripts.create_indexes
+    """
+    async with async_engine.connect() as connection:
+        missing = await connection.run_sync(_missing_indexes)
+    if not missing:
+        print('Все индексы уже созданы.')
+        return
+
+    concurrently = async_engine.dialect.name == 'postgresql'
+    autocommit_engine = async_engine.execution_options(isolation_level='AUTOCOMMIT')
+    for index in missing:
+        if concurrently:
+            index.dialect_options['postgresql']['concurrently'] = True
+        async with autocommit_engine.connect() as connection:
+            await connection.run_sync(index.create, checkfirst=True)
+        print(f'Создан индекс {index.name} ({index.table.name}).')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,377 @@
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+import httpx
+from scripts.seed_dataset import USER_LOGIN, USER_PASSWORD, ADMIN_LOGIN, ADMIN_PASSWORD
+
+
+def percentile(values: list, q: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга.
+
+    Параметры:
+        values: list - отсортированные значения;
+        q: float - уровень от 0 до 1.
+
+    Возвращает:
+        float - значение перцентиля (0, если значений нет).
+    """
+    if not values:
+        return 0.0
+    return values[max(math.ceil(q * len(values)) - 1, 0)]
+
+
+class LoadStats:
+    """
+    Время ответа и коды статусов по маршрутам (метод и шаблон пути, например GET /wallets/{wallet_id}).
+    """
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, route: str, status_code: int, elapsed: float):
+        self.latencies[route].append(elapsed)
+        if status_code >= 400:
+            self.errors[route] += 1
+
+    def report(self) -> dict:
+        """
+        Сводка по маршрутам.
+
+        Возвращает:
+            dict - для каждого маршрута и для всех запросов (ключ total): количество запросов, ошибок (статус >= 400),
+                пропускная способность в запросах в секунду и перцентили p50/p95/p99 времени ответа в миллисекундах.
+        """
+        duration = (self.finished or time.perf_counter()) - self.started
+        routes = dict(sorted(self.latencies.items()))
+        routes['total'] = [latency for latencies in self.latencies.values() for latency in latencies]
+        report = {}
+        for route, latencies in routes.items():
+            latencies = sorted(latencies)
+            report[route] = {
+                'count': len(latencies),
+                'errors': sum(self.errors.values()) if route == 'total' else self.errors[route],
+                'rps': round(len(latencies) / duration, 1) if duration else 0.0,
+                'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+                'p95_ms': round(percentile(latencies, 0.95) * 1000, 2),
+                'p99_ms': round(percentile(latencies, 0.99) * 1000, 2)
+            }
+        return report
+
+
+class VirtualUser:
+    """
+    Клиент нагрузочного теста от имени одного пользователя: своя сессия (cookie с токеном) и свои объекты.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, stats: LoadStats, login: str, password: str,
+                 generator: random.Random, categories: list):
+        self.client = client
+        self.stats = stats
+        self.login = login
+        self.password = password
+        self.generator = generator
+        self.categories = categories
+        self.user_id = None
+        self.wallets = []
+        self.budgets = []
+        self.goals = []
+        self.transaction_ids = []
+
+    async def request(self, method: str, route: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Запрос к API с замером времени ответа.
+
+        Параметры:
+            method: str - HTTP-метод;
+            route: str - шаблон пути для группировки в отчете;
+            url: str - путь запроса;
+            kwargs - параметры httpx.AsyncClient.request.
+        """
+        started = time.perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.stats.record(f'{method} {route}', response.status_code, time.perf_counter() - started)
+        return response
+
+    async def sign_in(self):
+        """
+        Вход в систему и загрузка объектов пользователя, по которым строятся запросы сценариев.
+        """
+        response = await self.request('POST', '/sign_in/authorization', '/sign_in/authorization',
+                                      json={'login': self.login, 'password': self.password})
+        response.raise_for_status()
+        self.user_id = (await self.request('GET', '/sign_in/current_user', '/sign_in/current_user')).json()['user_id']
+        self.wallets = (await self.request('GET', '/wallets/all', '/wallets/all')).json()
+        self.budgets = (await self.request('GET', '/budgets/all', '/budgets/all')).json()
+        self.goals = (await self.request('GET', '/goals/all', '/goals/all')).json()
+        transactions = (await self.request('GET', '/transactions/all', '/transactions/all',
+                                           params={'limit': 100})).json()
+        self.transaction_ids = [transaction['id'] for transaction in transactions]
+
+    def _transaction(self, category_type: str | None = None, wallets: list | None = None) -> dict:
+        categories = [category for category in self.categories
+                      if category_type is None or category['type'] == category_type] or self.categories
+        wallet = self.generator.choice(wallets or self.wallets)
+        return {
+            'amount': f'{self.generator.randint(1, 10000) / 100:.2f}',
+            'wallet_id': wallet['id'],
+            'category_id': self.generator.choice(categories)['id']
+        }
+
+    def _headers(self) -> dict:
+        return {'Idempotency-Key': str(uuid.uuid4())}
+
+    async def personal_cabinet(self):
+        await self.request('GET', '/personal_cabinet/my_data', '/personal_cabinet/my_data')
+
+    async def goal_progress(self):
+        await self.request('GET', '/analytics/goal_progress', '/analytics/goal_progress')
+
+    async def money_movement(self):
+        created_from = datetime.now() - timedelta(days=self.generator.choice((7, 30, 90, 365)))
+        await self.request('GET', '/analytics/money_movement', '/analytics/money_movement',
+                           params={'from': created_from.isoformat(timespec='seconds')})
+
+    async def money_movement_rollup(self):
+        await self.request('GET', '/analytics/money_movement?source=rollup', '/analytics/money_movement',
+                           params={'source': 'rollup'})
+
+    async def budgets_state(self):
+        await self.request('GET', '/analytics/budgets_state', '/analytics/budgets_state')
+
+    async def transactions_page(self):
+        response = await self.request('GET', '/transactions/all', '/transactions/all', params={'limit': 50})
+        if response.status_code == 200 and self.transaction_ids:
+            after_id = self.generator.choice(self.transaction_ids)
+            await self.request('GET', '/transactions/all?after_id', '/transactions/all',
+                               params={'limit': 50, 'after_id': after_id})
+
+    async def wallet_transactions(self):
+        await self.request('GET', '/transactions/all?wallet_id', '/transactions/all',
+                           params={'limit': 50, 'wallet_id': self.generator.choice(self.wallets)['id']})
+
+    async def transaction_by_id(self):
+        if self.transaction_ids:
+            transaction_id = self.generator.choice(self.transaction_ids)
+            await self.request('GET', '/transactions/{transaction_id}', f'/transactions/{transaction_id}')
+
+    async def wallets_list(self):
+        await self.request('GET', '/wallets/all', '/wallets/all')
+
+    async def wallet_by_id(self):
+        await self.request('GET', '/wallets/{wallet_id}', f'/wallets/{self.generator.choice(self.wallets)["id"]}')
+
+    async def budgets_list(self):
+        await self.request('GET', '/budgets/all', '/budgets/all')
+
+    async def budget_by_id(self):
+        if self.budgets:
+            await self.request('GET', '/budgets/{budget_id}', f'/budgets/{self.generator.choice(self.budgets)["id"]}')
+
+    async def goals_list(self):
+        await self.request('GET', '/goals/all', '/goals/all')
+
+    async def goal_by_id(self):
+        if self.goals:
+            await self.request('GET', '/goals/{goal_id}', f'/goals/{self.generator.choice(self.goals)["id"]}')
+
+    async def categories_list(self):
+        await self.request('GET', '/categories/all', '/categories/all')
+
+    async def category_by_id(self):
+        category_id = self.generator.choice(self.categories)['id']
+        await self.request('GET', '/categories/{category_id}', f'/categories/{category_id}')
+
+    async def create_transaction(self):
+        await self.request('POST', '/transactions/create', '/transactions/create',
+                           json=self._transaction(), headers=self._headers())
+
+    async def buy_something(self):
+        await self.request('POST', '/operation/buy_something', '/operation/buy_something',
+                           json=self._transaction('Expense'), headers=self._headers())
+
+    async def transfer_between_my_wallets(self):
+        wallets = [wallet for wallet in self.wallets if wallet['type_of_wallet'] != 'Cash']
+        if len(wallets) < 2:
+            return
+        start_wallet, target_wallet = self.generator.sample(wallets, 2)
+        await self.request('POST', '/operation/transfer_between_my_wallets', '/operation/transfer_between_my_wallets',
+                           params={'target_wallet_id': target_wallet['id']},
+                           json=self._transaction('Expense', [start_wallet]), headers=self._headers())
+
+    async def transfer_money_to_user(self):
+        wallets = [wallet for wallet in self.wallets if wallet['type_of_wallet'] != 'Cash']
+        target_user_id = self.user_id + 1 if self.generator.random() < 0.5 else max(self.user_id - 1, 2)
+        if not wallets or target_user_id == self.user_id:
+            return
+        await self.request('POST', '/operation/transfer_money_to_user', '/operation/transfer_money_to_user',
+                           params={'target_user_id': target_user_id},
+                           json=self._transaction('Expense', wallets), headers=self._headers())
+
+    async def update_budget(self):
+        if self.budgets:
+            budget = self.generator.choice(self.budgets)
+            await self.request('PATCH', '/budgets/update/{budget_id}', f'/budgets/update/{budget["id"]}',
+                               json={'amount': f'{self.generator.randint(100, 1000000) / 100:.2f}'})
+
+    async def update_goal(self):
+        if self.goals:
+            goal = self.generator.choice(self.goals)
+            await self.request('PATCH', '/goals/update/{goal_id}', f'/goals/update/{goal["id"]}',
+                               json={'name': f'Цель {self.generator.randint(1, 1000)}'})
+
+    async def users_list(self):
+        await self.request('GET', '/users/all', '/users/all')
+
+    async def user_by_id(self):
+        await self.request('GET', '/users/{user_id}', f'/users/{self.generator.randint(2, 100)}')
+
+
+USER_MIX = {
+    VirtualUser.personal_cabinet: 6,
+    VirtualUser.goal_progress: 3,
+    VirtualUser.money_movement: 5,
+    VirtualUser.money_movement_rollup: 3,
+    VirtualUser.budgets_state: 3,
+    VirtualUser.transactions_page: 12,
+    VirtualUser.wallet_transactions: 6,
+    VirtualUser.transaction_by_id: 5,
+    VirtualUser.wallets_list: 5,
+    VirtualUser.wallet_by_id: 3,
+    VirtualUser.budgets_list: 3,
+    VirtualUser.budget_by_id: 2,
+    VirtualUser.goals_list: 3,
+    VirtualUser.goal_by_id: 2,
+    VirtualUser.create_transaction: 8,
+    VirtualUser.buy_something: 5,
+    VirtualUser.transfer_between_my_wallets: 3,
+    VirtualUser.transfer_money_to_user: 1,
+    VirtualUser.update_budget: 1,
+    VirtualUser.update_goal: 1
+}
+ADMIN_MIX = {
+    VirtualUser.users_list: 1,
+    VirtualUser.user_by_id: 4,
+    VirtualUser.transactions_page: 3,
+    VirtualUser.categories_list: 2,
+    VirtualUser.category_by_id: 2
+}
+
+
+async def _run_worker(user: VirtualUser, mix: dict, deadline: float, budget: list):
+    scenarios, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline and budget[0] > 0:
+        budget[0] -= 1
+        scenario = user.generator.choices(scenarios, weights)[0]
+        await scenario(user)
+
+
+async def run(client_factory, users: int, concurrency: int, duration: float, requests: int | None,
+              admins: int = 1, random_seed: int = 0) -> LoadStats:
+    """
+    Нагрузочный тест: concurrency виртуальных пользователей одновременно выполняют сценарии USER_MIX
+    (чтение и запись через все роутеры), admins из них - сценарии администратора ADMIN_MIX.
+    Справочник категорий доступен только администратору, поэтому загружается один раз до начала теста.
+
+    Параметры:
+        client_factory - функция без аргументов, возвращающая httpx.AsyncClient;
+        users: int - количество засеянных пользователей (scripts.seed_dataset), из которых выбираются учетные записи;
+        concurrency: int - количество одновременно работающих виртуальных пользователей;
+        duration: float - продолжительность теста в секундах;
+        requests: int | None - ограничение количества сценариев (вместе по всем виртуальным пользователям);
+        admins: int - количество виртуальных администраторов;
+        random_seed: int - начальное значение генератора случайных чисел.
+
+    Возвращает:
+        LoadStats - собранная статистика.
+    """
+    stats = LoadStats()
+    generator = random.Random(random_seed)
+    async with client_factory() as client:
+        catalogue = VirtualUser(client, stats, ADMIN_LOGIN, ADMIN_PASSWORD, generator, [])
+        await catalogue.sign_in()
+        categories = (await catalogue.request('GET', '/categories/all', '/categories/all')).json()
+
+    clients = [client_factory() for _ in range(concurrency)]
+    virtual_users = []
+    for index, client in enumerate(clients):
+        if index < admins:
+            login, password = ADMIN_LOGIN, ADMIN_PASSWORD
+        else:
+            number = generator.randint(1, users)
+            login, password = USER_LOGIN.format(number), USER_PASSWORD.format(number)
+        virtual_users.append(
+            VirtualUser(client, stats, login, password, random.Random(generator.random()), categories)
+        )
+    try:
+        await asyncio.gather(*(user.sign_in() for user in virtual_users))
+        stats.started = time.perf_counter()
+        budget = [requests if requests is not None else math.inf]
+        deadline = stats.started + duration
+        await asyncio.gather(*(
+            _run_worker(user, ADMIN_MIX if index < admins else USER_MIX, deadline, budget)
+            for index, user in enumerate(virtual_users)
+        ))
+        stats.finished = time.perf_counter()
+    finally:
+        await asyncio.gather(*(client.aclose() for client in clients))
+    return stats
+
+
+def print_report(report: dict):
+    print(f'{"маршрут":<56} {"запросов":>9} {"ошибок":>7} {"rps":>8} {"p50, ms":>9} {"p95, ms":>9} {"p99, ms":>9}')
+    for route, row in report.items():
+        print(f'{route:<56} {row["count"]:>9} {row["errors"]:>7} {row["rps"]:>8} '
+              f'{row["p50_ms"]:>9} {row["p95_ms"]:>9} {row["p99_ms"]:>9}')
+
+
+async def main(args):
+    """
+    Нагрузочный тест API на данных scripts.seed_dataset.
+
+    По умолчанию запросы выполняются в том же процессе через httpx.ASGITransport (без сети, с БД из config.DB_URL),
+    с --base-url - к запущенному серверу (например, uvicorn main:app --workers 4).
+
+    Запуск: python -m scripts.load_test [--users 1000] [--concurrency 50] [--duration 30] [--base-url http://localhost:8000]
+        [--json report.json]
+    """
+    if args.base_url:
+        def client_factory():
+            return httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+    else:
+        from main import app
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+        def client_factory():
+            return httpx.AsyncClient(transport=transport, base_url='http://loadtest', timeout=args.timeout)
+
+    stats = await run(client_factory, args.users, args.concurrency, args.duration, args.requests, args.admins,
+                      args.seed)
+    report = stats.report()
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Нагрузочный тест API.')
+    parser.add_argument('--users', type=int, default=1000, help='Количество засеянных пользователей.')
+    parser.add_argument('--concurrency', type=int, default=50, help='Количество одновременных виртуальных пользователей.')
+    parser.add_argument('--admins', type=int, default=1, help='Количество виртуальных администраторов.')
+    parser.add_argument('--duration', type=float, default=30, help='Продолжительность теста в секундах.')
+    parser.add_argument('--requests', type=int, default=None, help='Ограничение общего количества сценариев.')
+    parser.add_argument('--base-url', default=None, help='Адрес запущенного сервера (по умолчанию - ASGITransport).')
+    parser.add_argument('--timeout', type=float, default=30, help='Таймаут запроса в секундах.')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора случайных чисел.')
+    parser.add_argument('--json', default=None, help='Файл для сохранения отчета в формате JSON.')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,21 @@
+import asyncio
+from datetime import datetime
+from api.idempotency import IDEMPOTENCY_KEY_TTL
+from database.cruds import IdempotencyKeysCRUD
+from database.database import async_session
+
+
+async def main():
+    """
+    Удаление ключей идемпотентности, срок хранения которых истек.
+
+    Запускается периодически: python -m scripts.purge_idempotency_keys
+    """
+    async with async_session() as db:
+        count = await IdempotencyKeysCRUD.purge_expired(db, datetime.now() - IDEMPOTENCY_KEY_TTL)
+        await db.commit()
+    print(f'Удалено ключей идемпотентности: {count}.')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
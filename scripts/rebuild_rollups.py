@@ -0,0 +1,19 @@
+import asyncio
+from database.cruds import RollupsCRUD
+from database.database import async_session
+
+
+async def main():
+    """
+    Пересчет помесячных итогов по категориям по всем транзакциям.
+
+    Запуск: python -m scripts.rebuild_rollups
+    """
+    async with async_session() as db:
+        count = await RollupsCRUD.rebuild(db)
+        await db.commit()
+    print(f'Пересчитано помесячных итогов: {count}.')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
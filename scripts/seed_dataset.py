@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.cruds import RollupsCRUD
+from database.database import Base, async_engine
+from database.models import Users, Categories, Wallets, Transactions, Budgets, Goals
+
+USER_LOGIN = 'user{}'
+USER_PASSWORD = 'password{}'
+ADMIN_LOGIN = 'admin1'
+ADMIN_PASSWORD = 'password1'
+WALLET_BALANCE = Decimal('1000000.00')
+TRANSACTIONS_PERIOD = timedelta(days=365)
+
+
+def _amount(generator: random.Random, limit: int = 100000) -> Decimal:
+    """
+    Случайная сумма от 0.01 до limit / 100 с двумя знаками после запятой.
+    """
+    return Decimal(generator.randint(1, limit)).scaleb(-2)
+
+
+async def _insert_returning_ids(engine, model, rows: list, batch_size: int) -> list[int]:
+    """
+    Вставка записей пачками с возвратом ключей в порядке переданных записей.
+    """
+    ids = []
+    for start in range(0, len(rows), batch_size):
+        async with engine.begin() as conn:
+            data = await conn.execute(
+                insert(model).returning(model.id, sort_by_parameter_order=True), rows[start:start + batch_size]
+            )
+            ids.extend(data.scalars().all())
+    return ids
+
+
+async def seed(engine, users: int, wallets_per_user: int, categories: int, budgets_per_user: int,
+               goals_per_user: int, transactions: int, batch_size: int = 10000, random_seed: int = 0) -> dict:
+    """
+    Заполнение БД синтетическими данными пачками INSERT (executemany), каждая пачка - отдельная транзакция БД.
+
+    Пользователи получают логины user1, user2, ... и пароли password1, password2, ..., дополнительно создается
+    администратор admin1 / password1. Первые два кошелька каждого пользователя - безналичные (для переводов),
+    балансы кошельков достаточны для операций нагрузочного теста. Транзакции распределяются по кошелькам
+    и категориям случайно, время создания - равномерно за последний год.
+
+    Параметры:
+        engine: AsyncEngine - асинхронный движок БД;
+        users: int - количество пользователей;
+        wallets_per_user: int - количество кошельков у пользователя;
+        categories: int - количество общих категорий (поровну доходов и расходов);
+        budgets_per_user: int - количество бюджетов у пользователя;
+        goals_per_user: int - количество целей у пользователя;
+        transactions: int - общее количество транзакций;
+        batch_size: int - количество записей в одной команде INSERT;
+        random_seed: int - начальное значение генератора случайных чисел.
+
+    Возвращает:
+        dict - количество созданных записей по таблицам.
+    """
+    generator = random.Random(random_seed)
+    user_ids = await _insert_returning_ids(engine, Users, [
+        {'name': 'Admin', 'lastname': 'Load', 'date_of_birth': date(1990, 1, 1), 'passport': '0000 000000',
+         'login': ADMIN_LOGIN, 'password': ADMIN_PASSWORD, 'is_admin': True}
+    ] + [
+        {'name': 'User', 'lastname': 'Load', 'date_of_birth': date(1990, 1, 1),
+         'passport': f'{number // 1000000 + 1:04d} {number % 1000000:06d}',
+         'login': USER_LOGIN.format(number), 'password': USER_PASSWORD.format(number), 'is_admin': False}
+        for number in range(1, users + 1)
+    ], batch_size)
+    user_ids = user_ids[1:]
+
+    category_rows = [{'name': f'Категория {number}', 'is_public': True,
+                      'type': 'Income' if number % 2 else 'Expense'} for number in range(1, categories + 1)]
+    category_ids = await _insert_returning_ids(engine, Categories, category_rows, batch_size)
+    expense_ids = [category_id for category_id, row in zip(category_ids, category_rows) if row['type'] == 'Expense']
+
+    wallet_ids = await _insert_returning_ids(engine, Wallets, [
+        {'user_id': user_id, 'amount': WALLET_BALANCE,
+         'type_of_wallet': ('Card', 'Bank')[number] if number < 2 else generator.choice(('Cash', 'Card', 'Bank'))}
+        for user_id in user_ids for number in range(wallets_per_user)
+    ], batch_size)
+
+    async with engine.begin() as conn:
+        if budgets_per_user and expense_ids:
+            await conn.execute(insert(Budgets), [
+                {'name': f'Бюджет {number + 1}', 'amount': _amount(generator, 10000000),
+                 'category_id': generator.choice(expense_ids), 'user_id': user_id}
+                for user_id in user_ids for number in range(budgets_per_user)
+            ])
+        if goals_per_user:
+            await conn.execute(insert(Goals), [
+                {'name': f'Цель {number + 1}', 'cost': _amount(generator, 100000000), 'actual_amount': Decimal(0),
+                 'deadline': date.today() + timedelta(days=generator.randint(30, 730)), 'user_id': user_id}
+                for user_id in user_ids for number in range(goals_per_user)
+            ])
+
+    now = datetime.now()
+    period = int(TRANSACTIONS_PERIOD.total_seconds())
+    for start in range(0, transactions, batch_size):
+        async with engine.begin() as conn:
+            await conn.execute(insert(Transactions), [
+                {'amount': _amount(generator), 'wallet_id': generator.choice(wallet_ids),
+                 'category_id': generator.choice(category_ids),
+                 'created_at': now - timedelta(seconds=generator.randrange(period))}
+                for _ in range(min(batch_size, transactions - start))
+            ])
+
+    async with AsyncSession(engine) as db:
+        rollups = await RollupsCRUD.rebuild(db)
+        await db.commit()
+
+    return {
+        'users': len(user_ids) + 1,
+        'categories': len(category_ids),
+        'wallets': len(wallet_ids),
+        'budgets': len(user_ids) * budgets_per_user if expense_ids else 0,
+        'goals': len(user_ids) * goals_per_user,
+        'transactions': transactions,
+        'monthly_rollups': rollups
+    }
+
+
+async def main(args):
+    """
+    Генерация синтетического набора данных для нагрузочного тестирования (см. scripts.load_test).
+
+    Данные добавляются в БД из config.DB_URL, схема должна быть создана (alembic upgrade head)
+    или пересоздается флагом --recreate. Логины и категории уникальны, поэтому скрипт рассчитан на пустую БД.
+
+    Запуск: python -m scripts.seed_dataset [--users 1000] [--transactions 1000000] [--recreate]
+    """
+    if args.recreate:
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+    started = time.perf_counter()
+    counts = await seed(async_engine, args.users, args.wallets_per_user, args.categories, args.budgets_per_user,
+                        args.goals_per_user, args.transactions, args.batch_size, args.seed)
+    elapsed = time.perf_counter() - started
+    for table, count in counts.items():
+        print(f'{table:>16}: {count}')
+    print(f'Данные созданы за {elapsed:.1f} s ({counts["transactions"] / elapsed:.0f} транзакций в секунду).')
+    await async_engine.dispose()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Генерация синтетического набора данных.')
+    parser.add_argument('--users', type=int, default=1000, help='Количество пользователей.')
+    parser.add_argument('--wallets-per-user', type=int, default=3, help='Количество кошельков у пользователя (от 2).')
+    parser.add_argument('--categories', type=int, default=20, help='Количество категорий.')
+    parser.add_argument('--budgets-per-user', type=int, default=2, help='Количество бюджетов у пользователя.')
+    parser.add_argument('--goals-per-user', type=int, default=2, help='Количество целей у пользователя.')
+    parser.add_argument('--transactions', type=int, default=1_000_000, help='Общее количество транзакций.')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Количество записей в одной команде INSERT.')
+    parser.add_argument('--seed', type=int, default=0, help='Начальное значение генератора случайных чисел.')
+    parser.add_argument('--recreate', action='store_true', help='Удалить и заново создать все таблицы.')
+    asyncio.run(main(parser.parse_args()))
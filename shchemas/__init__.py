@@ -1,16 +1,20 @@
+from .money import Money, MoneyMinorUnits, to_minor_units, from_minor_units
 from .budgets import BudgetSchema, BudgetGetSchema, BudgetPostSchema
 from .users import UserSchema, UserPostSchema, UserGetSchema, UserLoginSchema
 from .goals import GoalSchema, GoalPostSchema, GoalGetSchema
 from .wallets import WalletSchema, WalletPostSchema, WalletGetSchema
-from .transactions import TransactionSchema, TransactionGetSchema, TransactionPostSchema
+from .transactions import (TransactionSchema, TransactionGetSchema, TransactionPostSchema, TransactionBulkResultSchema,
+                           StatementImportSchema)
 from .categories import CategorySchema, CategoryPostSchema, CategoryGetSchema
 
 
 __all__ = [
+    'Money', 'MoneyMinorUnits', 'to_minor_units', 'from_minor_units',
     'BudgetSchema', 'BudgetPostSchema', 'BudgetGetSchema',
     'UserSchema', 'UserPostSchema', 'UserGetSchema', 'UserLoginSchema',
     'GoalSchema', 'GoalGetSchema', 'GoalPostSchema',
     'WalletSchema', 'WalletGetSchema', 'WalletPostSchema',
-    'TransactionSchema', 'TransactionPostSchema', 'TransactionGetSchema',
+    'TransactionSchema', 'TransactionPostSchema', 'TransactionGetSchema', 'TransactionBulkResultSchema',
+    'StatementImportSchema',
     'CategorySchema', 'CategoryGetSchema', 'CategoryPostSchema'
 ]
\ No newline at end of file
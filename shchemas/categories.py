@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from database.models.categories import CatTypes
 
 
@@ -11,6 +11,8 @@ class CategorySchema(BaseModel):
         is_public: bool | None - флаг, указывающий на пользовательскую категорию,
         type: CatTypes | None - тип категории.
     """
+    model_config = ConfigDict(from_attributes=True)
+
     name: str | None = Field(max_length=250, default=None, description='Название категории.')
     is_public: bool | None = Field(default=False,
                                              description='Флаг, указывающий на пользовательскую категорию.')
@@ -1,7 +1,7 @@
 import datetime
 from datetime import date
-from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from shchemas.money import Money
 
 
 class GoalSchema(BaseModel):
@@ -10,37 +10,22 @@ class GoalSchema(BaseModel):
 
     Поля:
         name: str | None - название цели,
-        cost: Decimal | None - необходимая сумма для цели,
+        cost: Money | None - необходимая сумма для цели,
         deadline: date | None - срок выполнения цели,
-        actual_amount: Decimal | None - текущий баланс цели,
+        actual_amount: Money | None - текущий баланс цели,
         user_id: int | None - уникальный идентификатор пользователя.
 
     Кастомные валидаторы:
-        decimal_validate - проверка корректности ввода денежных сумм,
         validate_amounts - проверка корректности введенных значений для текущего баланса и цели.
     """
+    model_config = ConfigDict(from_attributes=True)
+
     name: str | None = Field(max_length=250, default=None, description='Название цели.')
-    cost: Decimal | None = Field(ge=0, default=None, description='Необходимая сумма для цели.')
+    cost: Money | None = Field(default=None, description='Необходимая сумма для цели.')
     deadline: date | None = Field(default=None, description='Срок выполнения цели.')
-    actual_amount: Decimal | None = Field(ge=0, default=None, description='Текущий баланс цели.')
+    actual_amount: Money | None = Field(default=None, description='Текущий баланс цели.')
     user_id: int | None = Field(gt=0, default=None, description='Уникальный идентификатор пользователя.')
 
-    @field_validator('cost', 'actual_amount')
-    @classmethod
-    def decimal_validate(cls, value: Decimal | None) -> Decimal | None:
-        """
-        Проверка точности и величины Decimal (не более 2 знаков после запятой и не более 8 в целом.
-        """
-        if value is not None:
-            str_value = str(value)
-            if '.' in str_value:
-                integer_part, decimal_part = str_value.split('.')
-                if len(decimal_part) > 2:
-                    raise ValueError('Количество знаков после запятой не может превышать 2.')
-                if len(integer_part) > 8:
-                    raise ValueError('Слишком большая сумма.')
-        return value
-
     @model_validator(mode='after')
     def validate_amounts(self) -> 'GoalSchema':
         """
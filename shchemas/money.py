@@ -0,0 +1,69 @@
+from decimal import Decimal, InvalidOperation
+from typing import Annotated
+from pydantic import AfterValidator, BeforeValidator, Field
+
+MONEY_SCALE = 2
+MONEY_INTEGER_DIGITS = 8
+MINOR_UNIT = Decimal(1).scaleb(-MONEY_SCALE)
+MONEY_LIMIT = Decimal(10) ** MONEY_INTEGER_DIGITS
+
+
+def check_money(value: Decimal) -> Decimal:
+    """
+    Проверка точности и величины неотрицательной денежной суммы
+    (не более 2 знаков после запятой и не более 8 цифр в целой части).
+
+    Величина сравнивается с 10^8, точность - с суммой, округленной до копеек (Decimal.quantize),
+    без преобразования в строку. Незначащие нули после запятой допускаются.
+
+    Параметры:
+        value: Decimal - денежная сумма.
+
+    Возвращает:
+        value: Decimal - проверенная сумма.
+    """
+    if value >= MONEY_LIMIT:
+        raise ValueError('Слишком большая сумма.')
+    if value.quantize(MINOR_UNIT) != value:
+        raise ValueError('Количество знаков после запятой не может превышать 2.')
+    return value
+
+
+def to_minor_units(value) -> int:
+    """
+    Перевод денежной суммы в целое число минимальных единиц (копеек).
+
+    Параметры:
+        value - сумма в рублях (Decimal, int, float или строка).
+
+    Возвращает:
+        int - сумма в копейках; для нечисловых и бесконечных значений - ValueError.
+    """
+    if isinstance(value, float):
+        value = str(value)
+    try:
+        value = Decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        raise ValueError('Сумма должна быть числом.')
+    if not value.is_finite():
+        raise ValueError('Сумма должна быть конечным числом.')
+    check_money(abs(value))
+    return int(value.scaleb(MONEY_SCALE))
+
+
+def from_minor_units(units: int) -> Decimal:
+    """
+    Перевод целого числа минимальных единиц (копеек) в денежную сумму.
+
+    Параметры:
+        units: int - сумма в копейках.
+
+    Возвращает:
+        Decimal - сумма в рублях с 2 знаками после запятой.
+    """
+    return Decimal(units).scaleb(-MONEY_SCALE)
+
+
+# Неотрицательная денежная сумма в рублях и сумма, хранимая целым числом копеек.
+Money = Annotated[Decimal, Field(ge=0), AfterValidator(check_money)]
+MoneyMinorUnits = Annotated[int, BeforeValidator(to_minor_units)]
@@ -1,5 +1,7 @@
-from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+from typing import Literal
+from pydantic import BaseModel, ConfigDict, Field
+from shchemas.money import Money
 
 
 class TransactionSchema(BaseModel):
@@ -7,33 +9,16 @@ class TransactionSchema(BaseModel):
     Pydantic-схема транзакций для валидации.
 
     Поля:
-        amount: Decimal | None - сумма транзакции,
+        amount: Money | None - сумма транзакции (не более 8 цифр в целой части и не более 2 знаков после запятой),
         wallet_id: int | None - уникальный ключ кошелька,
         category_id: int | None - уникальный ключ категории.
-
-    Кастомные валидаторы:
-        decimal_validate - проверка точности и величины суммы транзакции.
     """
-    amount: Decimal | None = Field(ge=0, default=None, description='Сумма транзакции.')
+    model_config = ConfigDict(from_attributes=True)
+
+    amount: Money | None = Field(default=None, description='Сумма транзакции.')
     wallet_id: int | None = Field(gt=0, default=None, description='Уникальный ключ кошелька.')
     category_id: int | None = Field(gt=0, default=None, description='Уникальный ключ категории.')
 
-    @field_validator('amount')
-    @classmethod
-    def decimal_validate(cls, amount: Decimal | None) -> Decimal | None:
-        """
-        Проверка точности и величины суммы транзакции (не более 2 знаков после запятой и не более 8 в целом.
-        """
-        if amount is not None:
-            str_value = str(amount)
-            if '.' in str_value:
-                integer_part, decimal_part = str_value.split('.')
-                if len(decimal_part) > 2:
-                    raise ValueError('Количество знаков после запятой не может превышать 2.')
-                if len(integer_part) > 8:
-                    raise ValueError('Слишком большая сумма.')
-        return amount
-
 
 class TransactionPostSchema(TransactionSchema):
     """
@@ -42,11 +27,11 @@ class TransactionPostSchema(TransactionSchema):
     Наследует все поля от TransactionSchema.
 
     Дополнительные поля:
-        amount: Decimal - сумма транзакции,
+        amount: Money - сумма транзакции,
         wallet_id: int - уникальный ключ кошелька,
         category_id: int - уникальный ключ категории.
     """
-    amount: Decimal = Field(ge=0, description='Сумма транзакции.')
+    amount: Money = Field(description='Сумма транзакции.')
     wallet_id: int = Field(gt=0, description='Уникальный ключ кошелька.')
     category_id: int = Field(gt=0, description='Уникальный ключ категории.')
 
@@ -58,6 +43,44 @@ class TransactionGetSchema(TransactionPostSchema):
     Наследует все поля от TransactionPostSchema.
 
     Дополнительные поля:
-        id: int - уникальный ключ транзакции.
+        id: int - уникальный ключ транзакции,
+        created_at: datetime | None - время создания транзакции.
     """
     id: int = Field(gt=0, description='Уникальный ключ транзакции.')
+    created_at: datetime | None = Field(default=None, description='Время создания транзакции.')
+
+
+class TransactionBulkResultSchema(BaseModel):
+    """
+    Pydantic-схема результата обработки одной транзакции из пачки.
+
+    Поля:
+        index: int - порядковый номер транзакции в пачке,
+        status: str - результат обработки (created - транзакция создана, rejected - отклонена),
+        id: int | None - уникальный ключ созданной транзакции,
+        detail: str | None - причина отклонения.
+    """
+    index: int = Field(ge=0, description='Порядковый номер транзакции в пачке.')
+    status: Literal['created', 'rejected'] = Field(description='Результат обработки.')
+    id: int | None = Field(gt=0, default=None, description='Уникальный ключ созданной транзакции.')
+    detail: str | None = Field(default=None, description='Причина отклонения.')
+
+
+class StatementImportSchema(BaseModel):
+    """
+    Pydantic-схема состояния загрузки выписки.
+
+    Поля:
+        import_id: str - идентификатор загрузки,
+        status: str - состояние загрузки (running - выполняется, completed - завершена, failed - прервана),
+        offset: int - количество обработанных строк выписки (с этой строки загрузку можно продолжить),
+        created: int - количество созданных транзакций,
+        rejected: int - количество отклоненных строк,
+        errors: list[dict] - первые ошибки в формате {'index': номер строки, 'detail': причина}.
+    """
+    import_id: str = Field(description='Идентификатор загрузки.')
+    status: Literal['running', 'completed', 'failed'] = Field(description='Состояние загрузки.')
+    offset: int = Field(ge=0, description='Количество обработанных строк выписки.')
+    created: int = Field(ge=0, description='Количество созданных транзакций.')
+    rejected: int = Field(ge=0, description='Количество отклоненных строк.')
+    errors: list[dict] = Field(default_factory=list, description='Первые ошибки загрузки.')
@@ -1,6 +1,6 @@
 import re
 from datetime import date
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class SignInValidation:
@@ -65,6 +65,8 @@ class UserSchema(BaseModel, SignInValidation):
         passport_validate - проверка корректности введенных паспортных данных,
         login_and_password_validate - проверка корректности введенного логина и пароля на содержание недопустимых символов.
     """
+    model_config = ConfigDict(from_attributes=True)
+
     name: str | None = Field(max_length=50, default=None, description='Имя пользователя.')
     lastname: str | None = Field(max_length=50, default=None, description='Фамилия пользователя.')
     date_of_birth: date | None = Field(default=None, description='Дата рождения пользователя.')
@@ -1,5 +1,5 @@
-from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
+from shchemas.money import Money
 
 from database.models.wallets import TypesOfWallet
 
@@ -11,32 +11,13 @@ class WalletSchema(BaseModel):
     Поля:
         type_of_wallet: TypesOfWallet | None - тип кошелька,
         user_id: int | None - уникальный ключ пользователя,
-        amount: Decimal | None - сумма на кошельке.
-
-    Кастомные валидаторы:
-        decimal_validate - проверка точности и величины суммы кошелька.
+        amount: Money | None - сумма на кошельке (не более 8 цифр в целой части и не более 2 знаков после запятой).
     """
+    model_config = ConfigDict(from_attributes=True)
+
     type_of_wallet: TypesOfWallet | None = Field(default=None, description='Тип кошелька.')
     user_id: int | None = Field(gt=0, default=None, description='Уникальный ключ пользователя.')
-    amount: Decimal | None = Field(ge=0, default=None, description='Сумма кошелька.')
-
-
-    @field_validator('amount')
-    @classmethod
-    def decimal_validate(cls, amount: Decimal | None) -> Decimal | None:
-        """
-        Проверка точности и величины суммы кошелька (не более 2 знаков после запятой и не более 8 в целом.
-        """
-        if amount is not None:
-            str_value = str(amount)
-            if '.' in str_value:
-                integer_part, decimal_part = str_value.split('.')
-                if len(decimal_part) > 2:
-                    raise ValueError('Количество знаков после запятой не может превышать 2.')
-                if len(integer_part) > 8:
-                    raise ValueError('Слишком большая сумма.')
-        return amount
-
+    amount: Money | None = Field(default=None, description='Сумма кошелька.')
 
 
 class WalletPostSchema(WalletSchema):
@@ -0,0 +1,139 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.schema import CreateTable
+from database.database import Base
+from database.models import Transactions
+from scripts.seed_dataset import seed
+
+BENCH_SIZES = [int(size) for size in os.getenv('BENCH_SIZES', '1000,100000,1000000').split(',') if size.strip()]
+BENCH_DATA_DIR = Path(os.getenv('BENCH_DATA_DIR', Path(tempfile.gettempdir()) / 'finance_tracker_bench'))
+BASELINES_DIR = Path(__file__).parent / 'baselines'
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    pytest_benchmark = None
+
+
+def pytest_configure(config):
+    """
+    Результаты сохраняются (--benchmark-save, --benchmark-autosave) и сравниваются (--benchmark-compare)
+    в tests/bench/baselines, если каталог не задан явно через --benchmark-storage.
+    """
+    if pytest_benchmark is not None and config.getoption('benchmark_storage', None) == 'file://./.benchmarks':
+        config.option.benchmark_storage = BASELINES_DIR.as_uri()
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Замеры выполняются только при запуске с --benchmark-only (и установленном pytest-benchmark),
+    в обычном прогоне тестов они пропускаются.
+    """
+    if pytest_benchmark is None:
+        reason = 'Не установлен pytest-benchmark.'
+    elif not config.getoption('benchmark_only', False):
+        reason = 'Замеры запускаются с флагом --benchmark-only.'
+    else:
+        return
+    bench_dir = Path(__file__).parent
+    for item in items:
+        if bench_dir in Path(item.fspath).parents:
+            item.add_marker(pytest.mark.skip(reason=reason))
+
+
+def _schema_fingerprint() -> str:
+    """
+    Отпечаток схемы БД: при изменении моделей засеянные файлы БД создаются заново.
+    """
+    ddl = ''.join(str(CreateTable(table)) for table in Base.metadata.sorted_tables)
+    return hashlib.sha1(ddl.encode()).hexdigest()[:8]
+
+
+async def _open_seeded(size: int):
+    """
+    Файл SQLite с size транзакциями: создается scripts.seed_dataset при первом запуске и переиспользуется.
+
+    На каждую 1000 транзакций приходится один пользователь (не меньше 10), у пользователя 3 кошелька,
+    2 бюджета и 2 цели.
+    """
+    BENCH_DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = BENCH_DATA_DIR / f'bench_{size}_{_schema_fingerprint()}.db'
+    engine = create_async_engine(f'sqlite+aiosqlite:///{path}')
+    if path.exists():
+        async with engine.connect() as conn:
+            if (await conn.execute(select(func.count()).select_from(Transactions))).scalar() == size:
+                return engine
+        await engine.dispose()
+        path.unlink()
+        engine = create_async_engine(f'sqlite+aiosqlite:///{path}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await seed(engine, users=max(size // 1000, 10), wallets_per_user=3, categories=20, budgets_per_user=2,
+               goals_per_user=2, transactions=size, batch_size=50000)
+    return engine
+
+
+@pytest.fixture(scope='session')
+def run(event_loop):
+    """
+    Выполнение корутины в цикле событий тестов (замеры pytest-benchmark синхронные).
+    """
+    return event_loop.run_until_complete
+
+
+@pytest.fixture(scope='session', params=BENCH_SIZES, ids=lambda size: f'{size}tx')
+def bench_engine(request, run):
+    """
+    Движок БД с засеянными данными, размер набора - из переменной окружения BENCH_SIZES.
+    """
+    engine = run(_open_seeded(request.param))
+    yield engine
+    run(engine.dispose())
+
+
+@pytest.fixture(scope='session')
+def bench_session(bench_engine):
+    """
+    Фабрика сессий засеянной БД.
+    """
+    return async_sessionmaker(bench_engine, expire_on_commit=False)
+
+
+@pytest.fixture(scope='session')
+def bench_user(bench_session, run):
+    """
+    Пользователь из середины набора данных и его кошельки (без наличных - для переводов).
+    """
+    from database.models import Users, Wallets
+
+    async def load():
+        async with bench_session() as db:
+            count = (await db.execute(select(func.count()).select_from(Users))).scalar()
+            user = (await db.execute(select(Users).where(Users.id == count // 2 + 1))).scalar_one()
+            wallets = (await db.execute(
+                select(Wallets.id).where(Wallets.user_id == user.id, Wallets.type_of_wallet != 'Cash')
+                .order_by(Wallets.id)
+            )).scalars().all()
+            transaction_id = (await db.execute(
+                select(func.max(Transactions.id)).where(Transactions.wallet_id.in_(wallets))
+            )).scalar()
+            return {'id': user.id, 'login': user.login, 'password': user.password, 'wallets': wallets,
+                    'transaction_id': transaction_id}
+
+    return run(load())
+
+
+@pytest.fixture
+def measure(benchmark, run):
+    """
+    Замер асинхронной операции: factory - функция без аргументов, возвращающая новую корутину.
+    """
+    def _measure(factory):
+        return benchmark(lambda: run(factory()))
+
+    return _measure
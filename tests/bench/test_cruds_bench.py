@@ -0,0 +1,161 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from database.cruds import (UsersCRUD, WalletsCRUD, TransactionsCRUD, BudgetsCRUD, GoalsCRUD, CategoriesCRUD,
+                            AnalyticsCRUD, RollupsCRUD)
+from database.models import Transactions, Wallets
+
+
+def test_users_get_by_id(measure, bench_session, bench_user):
+    """
+    Замер получения пользователя по ключу.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await UsersCRUD.get_by_id(db, bench_user['id'])
+
+    assert measure(target).id == bench_user['id']
+
+
+def test_users_get_by_login(measure, bench_session, bench_user):
+    """
+    Замер получения пользователя по логину (вход в систему).
+    """
+    async def target():
+        async with bench_session() as db:
+            return await UsersCRUD.get_by_login(db, bench_user['login'])
+
+    assert measure(target).id == bench_user['id']
+
+
+def test_wallets_get_by_user(measure, bench_session, bench_user):
+    """
+    Замер получения кошельков пользователя.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await WalletsCRUD.get_by_user(db, bench_user['id'], columns=(Wallets.id, Wallets.amount))
+
+    assert len(measure(target)) == 3
+
+
+def test_wallets_transfer(measure, bench_session, bench_user):
+    """
+    Замер перевода между кошельками (изменения откатываются).
+    """
+    from_wallet_id, to_wallet_id = bench_user['wallets'][:2]
+
+    async def target():
+        async with bench_session() as db:
+            balances = await WalletsCRUD.transfer(db, from_wallet_id, to_wallet_id, Decimal('1.00'))
+            await db.rollback()
+            return balances
+
+    assert measure(target)
+
+
+def test_transactions_get_page(measure, bench_session, bench_user):
+    """
+    Замер первой страницы транзакций пользователя.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await TransactionsCRUD.get_page(db, user_id=bench_user['id'], limit=50)
+
+    assert measure(target)
+
+
+def test_transactions_get_page_by_wallet_and_period(measure, bench_session, bench_user):
+    """
+    Замер страницы транзакций кошелька за последний месяц.
+    """
+    created_from = datetime.now() - timedelta(days=30)
+
+    async def target():
+        async with bench_session() as db:
+            return await TransactionsCRUD.get_page(db, user_id=bench_user['id'], wallet_id=bench_user['wallets'][0],
+                                                   created_from=created_from, limit=50)
+
+    assert measure(target) is not None
+
+
+def test_transactions_get_by_id_for_user(measure, bench_session, bench_user):
+    """
+    Замер получения транзакции пользователя по ключу.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await TransactionsCRUD.get_by_id_for_user(db, bench_user['transaction_id'], bench_user['id'])
+
+    assert measure(target).id == bench_user['transaction_id']
+
+
+def test_transactions_create(measure, bench_session, bench_user):
+    """
+    Замер создания транзакции вместе с обновлением суммы за месяц (изменения откатываются).
+    """
+    async def target():
+        async with bench_session() as db:
+            transaction = await TransactionsCRUD.create(
+                db, Transactions(amount=Decimal('10.00'), wallet_id=bench_user['wallets'][0], category_id=2)
+            )
+            await db.rollback()
+            return transaction
+
+    assert measure(target)
+
+
+def test_budgets_get_by_user(measure, bench_session, bench_user):
+    """
+    Замер получения бюджетов пользователя.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await BudgetsCRUD.get_by_user(db, bench_user['id'])
+
+    assert len(measure(target)) == 2
+
+
+def test_goals_get_by_user(measure, bench_session, bench_user):
+    """
+    Замер получения целей пользователя.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await GoalsCRUD.get_by_user(db, bench_user['id'])
+
+    assert len(measure(target)) == 2
+
+
+def test_categories_get_all(measure, bench_session):
+    """
+    Замер получения всех категорий.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await CategoriesCRUD.get_all(db)
+
+    assert len(measure(target)) == 20
+
+
+def test_analytics_crud_money_movement(measure, bench_session, bench_user):
+    """
+    Замер сумм по категориям за год по транзакциям.
+    """
+    created_from = datetime.now() - timedelta(days=365)
+
+    async def target():
+        async with bench_session() as db:
+            return await AnalyticsCRUD.money_movement(db, bench_user['id'], created_from=created_from)
+
+    assert measure(target)
+
+
+def test_rollups_get_by_user(measure, bench_session, bench_user):
+    """
+    Замер сумм по категориям за все время по помесячным итогам.
+    """
+    async def target():
+        async with bench_session() as db:
+            return await RollupsCRUD.get_by_user(db, bench_user['id'])
+
+    assert measure(target)
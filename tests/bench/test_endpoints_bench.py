@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+import pytest
+from httpx import AsyncClient, ASGITransport
+from cache import principal_cache, token_versions, analytics_cache, category_catalogue
+from database.database import get_db, get_read_db
+from main import app
+
+
+@pytest.fixture
+def api_client(bench_session, bench_user, run):
+    """
+    Клиент API, вошедший от имени bench_user; сессии БД записи откатываются после запроса,
+    чтобы замеры операций не меняли засеянные данные.
+    """
+    async def override_get_db():
+        async with bench_session() as db:
+            try:
+                yield db
+            finally:
+                await db.rollback()
+
+    async def override_get_read_db():
+        async with bench_session() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_read_db
+    run(principal_cache.clear())
+    run(token_versions.clear())
+    analytics_cache.clear()
+    category_catalogue.clear()
+
+    client = AsyncClient(transport=ASGITransport(app=app), base_url='http://bench')
+    response = run(client.post('/sign_in/authorization',
+                               json={'login': bench_user['login'], 'password': bench_user['password']}))
+    assert response.status_code == 200
+    client.cookies.set('my_access_token', response.json()['access_token'], domain='bench', path='/')
+    yield client
+
+    run(client.aclose())
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def measure_request(benchmark, run, api_client):
+    """
+    Замер запроса к API: ответ проверяется на код 200.
+
+    При cached=False кэш аналитики очищается перед каждым запросом (вне замера).
+    """
+    def _measure(method: str, url: str, cached: bool = False, **kwargs):
+        def target():
+            response = run(api_client.request(method, url, **kwargs))
+            assert response.status_code == 200, response.text
+            return response
+
+        if cached:
+            return benchmark(target)
+        return benchmark.pedantic(target, setup=analytics_cache.clear, rounds=50, warmup_rounds=1)
+
+    return _measure
+
+
+def test_analytics_goal_progress(measure_request):
+    """
+    Замер прогресса по целям.
+    """
+    measure_request('GET', '/analytics/goal_progress')
+
+
+def test_analytics_budgets_state(measure_request):
+    """
+    Замер состояния бюджетов.
+    """
+    measure_request('GET', '/analytics/budgets_state')
+
+
+def test_analytics_money_movement(measure_request):
+    """
+    Замер движения денег за год по транзакциям.
+    """
+    created_from = (datetime.now() - timedelta(days=365)).isoformat(timespec='seconds')
+    measure_request('GET', '/analytics/money_movement', params={'from': created_from})
+
+
+def test_analytics_money_movement_rollup(measure_request):
+    """
+    Замер движения денег за все время по помесячным итогам.
+    """
+    measure_request('GET', '/analytics/money_movement', params={'source': 'rollup'})
+
+
+def test_analytics_money_movement_cached(measure_request):
+    """
+    Замер движения денег при попадании в кэш аналитики.
+    """
+    measure_request('GET', '/analytics/money_movement', cached=True)
+
+
+def test_operations_buy_something(measure_request, bench_user):
+    """
+    Замер покупки: списание с кошелька и создание транзакции.
+    """
+    measure_request('POST', '/operation/buy_something',
+                    json={'amount': '10.00', 'wallet_id': bench_user['wallets'][0], 'category_id': 2})
+
+
+def test_operations_transfer_between_my_wallets(measure_request, bench_user):
+    """
+    Замер перевода между своими кошельками.
+    """
+    from_wallet_id, to_wallet_id = bench_user['wallets'][:2]
+    measure_request('POST', '/operation/transfer_between_my_wallets', params={'target_wallet_id': to_wallet_id},
+                    json={'amount': '10.00', 'wallet_id': from_wallet_id, 'category_id': 2})
@@ -12,7 +12,8 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from database.database import get_db
+from cache import principal_cache, token_versions, analytics_cache, category_catalogue
+from database.database import get_db, get_read_db
 from database.models import Users, Budgets, Goals, Transactions, Wallets, Categories
 from main import app
 
@@ -46,6 +47,7 @@ async def db_session():
         class_=AsyncSession,
         expire_on_commit=False
     )
+    category_catalogue.clear()
 
     async with async_session() as session:
         try:
@@ -69,6 +71,10 @@ async def override_get_db(db_session: AsyncSession):
 @pytest_asyncio.fixture(scope='function')
 async def async_client(override_get_db):
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    await principal_cache.clear()
+    await token_versions.clear()
+    analytics_cache.clear()
 
     async with AsyncClient(
             transport=ASGITransport(app=app),
@@ -0,0 +1,71 @@
+from decimal import Decimal
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_money_movement_cache(auth_client: AsyncClient, test_transaction, test_wallet,
+                                                  test_category, db_session):
+    response = await auth_client.get('/analytics/money_movement')
+    assert response.status_code == 200
+    assert Decimal(response.json()[test_category.name]) == -Decimal(test_transaction.amount)
+    etag = response.headers['ETag']
+
+    response = await auth_client.get('/analytics/money_movement', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.headers['ETag'] == etag
+
+    response = await auth_client.get('/analytics/money_movement', params={'source': 'rollup'})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+    data = {'amount': 50, 'wallet_id': test_wallet.id, 'category_id': test_category.id}
+    response = await auth_client.post('/transactions/create', json=data)
+    assert response.status_code == 200
+    await db_session.commit()
+
+    response = await auth_client.get('/analytics/money_movement', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert Decimal(response.json()[test_category.name]) == -Decimal(test_transaction.amount) - 50
+
+    response = await auth_client.get('/metrics')
+    stats = response.json()['analytics_cache']
+    assert (stats['hits'], stats['misses'], stats['not_modified']) == (0, 3, 1)
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_budgets_state(auth_client: AsyncClient, test_budget, test_category):
+    first = await auth_client.get('/analytics/budgets_state')
+    second = await auth_client.get('/analytics/budgets_state')
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert test_budget.name in first.json()[test_category.name]
+
+
+@pytest.mark.asyncio
+async def test_analytics_api_replica_after_write(auth_client: AsyncClient, test_transaction, test_user, db_session):
+    from fastapi import Request
+    from cache import analytics_cache
+    from database.database import get_read_db
+    from main import app
+
+    async def replica_db(request: Request):
+        request.state.read_replica = True
+        yield db_session
+
+    app.dependency_overrides[get_read_db] = replica_db
+    analytics_cache.bump(test_user.id)
+
+    first = await auth_client.get('/analytics/money_movement')
+    second = await auth_client.get('/analytics/money_movement')
+    assert first.status_code == second.status_code == 200
+    assert 'ETag' not in first.headers
+    assert analytics_cache.stats()['misses'] == 2
+
+    analytics_cache.clear()
+    first = await auth_client.get('/analytics/money_movement')
+    second = await auth_client.get('/analytics/money_movement')
+    assert 'ETag' in first.headers
+    assert analytics_cache.stats()['hits'] == 1
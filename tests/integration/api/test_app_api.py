@@ -0,0 +1,31 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.exc import ProgrammingError
+from database.models import Users
+
+
+@pytest.mark.asyncio
+async def test_app_api_metrics_admin_only(async_client: AsyncClient, db_session):
+    response = await async_client.get('/metrics')
+    assert response.status_code == 401
+
+    db_session.add(Users(name='user', passport='3333 333333', login='user1', password='password1', is_admin=False))
+    await db_session.commit()
+    response = await async_client.post('/sign_in/authorization', json={'login': 'user1', 'password': 'password1'})
+    async_client.cookies.set('my_access_token', response.json()['access_token'], domain='test', path='/')
+
+    response = await async_client.get('/metrics')
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_app_lifespan_without_schema(monkeypatch):
+    from database.cruds import CategoriesCRUD
+    from main import app, lifespan
+
+    async def missing_table(db):
+        raise ProgrammingError('SELECT categories', {}, Exception('relation "categories" does not exist'))
+
+    monkeypatch.setattr(CategoriesCRUD, 'get_catalogue', missing_table)
+    async with lifespan(app):
+        pass
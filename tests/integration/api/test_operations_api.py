@@ -0,0 +1,45 @@
+from decimal import Decimal
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+
+@pytest.mark.asyncio
+async def test_operations_api_buy_something(auth_client: AsyncClient, test_wallet, test_category, db_session):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, 'before_cursor_execute', capture)
+    try:
+        response = await auth_client.post('/operation/buy_something', json={
+            'amount': '150.50', 'wallet_id': test_wallet.id, 'category_id': test_category.id
+        })
+        await db_session.flush()
+    finally:
+        event.remove(engine, 'before_cursor_execute', capture)
+
+    assert response.status_code == 200
+    assert Decimal(response.json()['amount']) == Decimal('4849.50')
+    assert response.json()['id'] == test_wallet.id
+    assert len([statement for statement in statements if statement.startswith('UPDATE wallets')]) == 1
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal('4849.50')
+
+
+@pytest.mark.asyncio
+async def test_operations_api_buy_something_unknown_category(auth_client: AsyncClient, test_wallet, test_category):
+    from cache import category_catalogue
+
+    data = {'amount': '10', 'wallet_id': test_wallet.id, 'category_id': 999}
+    response = await auth_client.post('/operation/buy_something', json=data)
+    assert response.status_code == 404
+    assert response.json() == {'detail': 'Такая категория не найдена.'}
+
+    loads = category_catalogue.loads
+    response = await auth_client.post('/operation/buy_something', json=data)
+    assert response.status_code == 404
+    assert category_catalogue.loads == loads
@@ -0,0 +1,54 @@
+import pytest
+from httpx import AsyncClient
+from api.query_stats import QueryBudgetExceeded, query_budgets
+
+
+@pytest.mark.asyncio
+async def test_query_stats_server_timing(auth_client: AsyncClient, test_wallet):
+    response = await auth_client.get('/wallets/all')
+
+    assert response.status_code == 200
+    timing = response.headers['server-timing']
+    assert timing.startswith('db;dur=')
+    assert 'queries=' in timing
+    assert 'queries=0' not in timing
+    assert 'affected_rows=0' in timing
+
+
+@pytest.mark.asyncio
+async def test_query_stats_budget_warning(auth_client: AsyncClient, test_wallet, monkeypatch, caplog):
+    monkeypatch.setitem(query_budgets.routes, 'GET /wallets/all', 0)
+
+    with caplog.at_level('WARNING', logger='api.query_stats'):
+        response = await auth_client.get('/wallets/all')
+
+    assert response.status_code == 200
+    assert 'GET /wallets/all' in caplog.text
+    assert 'при бюджете 0' in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_query_stats_budget_strict(auth_client: AsyncClient, test_wallet, monkeypatch):
+    monkeypatch.setitem(query_budgets.routes, 'GET /wallets/{wallet_id}', 0)
+    monkeypatch.setattr(query_budgets, 'strict', True)
+
+    with pytest.raises(QueryBudgetExceeded, match='GET /wallets/{wallet_id}'):
+        await auth_client.get(f'/wallets/{test_wallet.id}')
+
+    response = await auth_client.get('/wallets/all')
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_query_stats_streaming_response(auth_client: AsyncClient, test_transaction, monkeypatch, caplog):
+    monkeypatch.setitem(query_budgets.routes, 'GET /transactions/export', 0)
+
+    with caplog.at_level('INFO', logger='api.query_stats'):
+        response = await auth_client.get('/transactions/export', params={'chunk_size': 1})
+
+    assert response.status_code == 200
+    assert 'queries=0' in response.headers['server-timing']
+    final = [record.getMessage() for record in caplog.records if record.levelname == 'INFO']
+    assert any(message.startswith('GET /transactions/export: ') and ' 0 SQL-запросов' not in message
+               for message in final)
+    assert 'при бюджете 0' in caplog.text
@@ -0,0 +1,64 @@
+import pytest
+from httpx import AsyncClient
+from database.cruds import user
+
+
+@pytest.mark.asyncio
+async def test_sign_in_api_token_claims(async_client: AsyncClient, test_user):
+    response = await async_client.post('/sign_in/authorization',
+                                       json={'login': test_user.login, 'password': test_user.password})
+    assert response.status_code == 200
+
+    token = response.json()['access_token']
+    from api.sign_in_router import security
+
+    payload = security._decode_token(token)
+
+    assert payload.sub == str(test_user.id)
+    assert payload.login == test_user.login
+    assert payload.is_admin == test_user.is_admin
+    assert payload.ver == 0
+
+
+@pytest.mark.asyncio
+async def test_sign_in_api_token_revoked(auth_client: AsyncClient, test_user, db_session):
+    response = await auth_client.get('/transactions/all')
+    assert response.status_code != 401
+
+    await user.update(db_session, test_user.id, {'is_admin': False})
+    await db_session.commit()
+
+    response = await auth_client.get('/transactions/all')
+    assert response.status_code == 401
+    assert response.json() == {'detail': 'Токен отозван. Авторизируйтесь повторно.'}
+
+    response = await auth_client.get('/sign_in/current_user')
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_sign_in_api_token_revoked_registry_miss(auth_client: AsyncClient, test_user, db_session):
+    from sqlalchemy import update
+    from cache import token_versions
+    from database.models import Users
+
+    await db_session.execute(update(Users).where(Users.id == test_user.id).values(token_version=1))
+    await db_session.commit()
+    await token_versions.clear()
+
+    response = await auth_client.get('/transactions/all')
+    assert response.status_code == 401
+    assert response.json() == {'detail': 'Токен отозван. Авторизируйтесь повторно.'}
+    assert await token_versions.get(test_user.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_sign_in_api_token_deleted_user(auth_client: AsyncClient, test_user, db_session):
+    from cache import token_versions
+
+    await db_session.delete(test_user)
+    await db_session.commit()
+    await token_versions.clear()
+
+    response = await auth_client.get('/transactions/all')
+    assert response.status_code == 401
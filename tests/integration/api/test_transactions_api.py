@@ -18,6 +18,38 @@ async def test_transactions_api_get_all(auth_client: AsyncClient, test_transacti
         assert 'category_id' in res.keys()
 
 
+@pytest.mark.asyncio
+async def test_transactions_api_get_all_pages(auth_client: AsyncClient, test_transaction, test_wallet, test_category,
+                                              db_session):
+    from database.models import Transactions
+    db_session.add_all([Transactions(amount=amount, wallet_id=test_wallet.id, category_id=test_category.id)
+                        for amount in (100, 200, 300)])
+    await db_session.commit()
+
+    response = await auth_client.get('/transactions/all', params={'limit': 2})
+    assert response.status_code == 200
+    assert [res['id'] for res in response.json()] == [1, 2]
+    assert response.headers['X-Next-Cursor'] == '2'
+
+    response = await auth_client.get('/transactions/all', params={'limit': 2, 'after_id': 2})
+    assert response.status_code == 200
+    assert [res['id'] for res in response.json()] == [3, 4]
+    assert 'X-Next-Cursor' not in response.headers
+
+    response = await auth_client.get('/transactions/all', params={'min_amount': 150, 'max_amount': 300})
+    assert response.status_code == 200
+    assert [Decimal(res['amount']) for res in response.json()] == [200, 300]
+
+    response = await auth_client.get('/transactions/all', params={'from': '2000-01-01T00:00:00', 'to': '2000-02-01'})
+    assert response.status_code == 200
+    assert response.json() == []
+    assert 'X-Next-Cursor' not in response.headers
+
+    response = await auth_client.get('/transactions/all', params={'after_id': 4})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
 @pytest.mark.asyncio
 async def test_transactions_api_get_by_id(auth_client: AsyncClient, test_transaction, test_wallet, test_category):
     response = await auth_client.get('/transactions/1')
@@ -127,3 +159,152 @@ async def test_transactions_api_delete_fail(auth_client: AsyncClient, test_walle
     else:
         assert result == {'detail': f'Ошибка сервера: 404: Транзакция с id=2 не найдена.'}
 
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_export(auth_client: AsyncClient, test_transaction, test_wallet, test_category):
+    response = await auth_client.get('/transactions/export', params={'format': 'ndjson', 'chunk_size': 1})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+
+    import json
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == [{
+        'id': test_transaction.id,
+        'amount': '350.00',
+        'wallet_id': test_wallet.id,
+        'category_id': test_category.id
+    }]
+
+    response = await auth_client.get('/transactions/export', params={'format': 'csv'})
+    assert response.status_code == 200
+    assert response.text.splitlines() == ['id,amount,wallet_id,category_id',
+                                          f'{test_transaction.id},350.00,{test_wallet.id},{test_category.id}']
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_create_idempotent(auth_client: AsyncClient, test_wallet, test_category, db_session):
+    data = {
+        'amount': 500,
+        'wallet_id': test_wallet.id,
+        'category_id': test_category.id
+    }
+    headers = {'Idempotency-Key': 'create-1'}
+
+    first = await auth_client.post('/transactions/create', json=data, headers=headers)
+    second = await auth_client.post('/transactions/create', json=data, headers=headers)
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json() == first.json()
+
+    from sqlalchemy import func, select
+    from database.models import Transactions
+    count = await db_session.scalar(select(func.count()).select_from(Transactions))
+    assert count == 1
+
+    response = await auth_client.post('/transactions/create', json={**data, 'amount': 600}, headers=headers)
+    assert response.status_code == 422
+    assert response.json() == {'detail': 'Ключ идемпотентности уже использован для другого запроса.'}
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_bulk(auth_client: AsyncClient, test_wallet, test_category, db_session):
+    from database.models import Categories
+    income_category = Categories(name='test_income', is_public=True, type='Income')
+    db_session.add(income_category)
+    await db_session.commit()
+
+    data = [
+        {'amount': 100, 'wallet_id': test_wallet.id, 'category_id': test_category.id},
+        {'amount': 1000, 'wallet_id': test_wallet.id, 'category_id': income_category.id},
+        {'amount': 5, 'wallet_id': test_wallet.id + 1, 'category_id': test_category.id},
+        {'amount': 5, 'wallet_id': test_wallet.id, 'category_id': income_category.id + 1},
+    ]
+    response = await auth_client.post('/transactions/bulk', json=data)
+    assert response.status_code == 200
+
+    result = response.json()
+    assert [res['status'] for res in result] == ['created', 'created', 'rejected', 'rejected']
+    assert [res['index'] for res in result] == [0, 1, 2, 3]
+    assert result[0]['id'] is not None and result[1]['id'] is not None
+    assert result[2]['detail'] == 'Такой кошелек не найден у пользователя.'
+    assert result[3]['detail'] == 'Такая категория не найдена.'
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal(5900)
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_bulk_insufficient_funds(auth_client: AsyncClient, test_wallet, test_category,
+                                                        db_session):
+    data = [{'amount': 3000, 'wallet_id': test_wallet.id, 'category_id': test_category.id}] * 2
+    response = await auth_client.post('/transactions/bulk', json=data)
+    assert response.status_code == 200
+    assert [res['detail'] for res in response.json()] == ['Баланс не может быть отрицательным.'] * 2
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal(5000)
+
+    response = await auth_client.post('/transactions/bulk', json=[])
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_import_csv(auth_client: AsyncClient, test_wallet, test_category, db_session):
+    content = 'amount,category\n100,test_category\n50,unknown\n-25,\n10,test_category\n'
+    params = {'import_id': 'statement-1', 'chunk_size': 2, 'wallet_id': test_wallet.id,
+              'expense_category_id': test_category.id}
+
+    response = await auth_client.post('/transactions/import', params=params, content=content)
+    assert response.status_code == 200
+    result = response.json()
+    assert result['status'] == 'completed'
+    assert (result['offset'], result['created'], result['rejected']) == (4, 3, 1)
+    assert result['errors'] == [{'index': 1, 'detail': 'Такая категория не найдена.'}]
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal(4865)
+
+    response = await auth_client.get('/transactions/import/statement-1')
+    assert response.status_code == 200
+    assert response.json() == result
+
+    response = await auth_client.post('/transactions/import', params={**params, 'offset': 3}, content=content)
+    assert response.status_code == 200
+    assert (response.json()['offset'], response.json()['created']) == (4, 4)
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal(4855)
+
+    response = await auth_client.get('/transactions/import/statement-2')
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_import_not_finite_amount(auth_client: AsyncClient, test_wallet, test_category,
+                                                         db_session):
+    content = 'amount\nNaN\nsNaN\n-Infinity\n-10\n'
+    params = {'import_id': 'statement-nan', 'wallet_id': test_wallet.id, 'expense_category_id': test_category.id}
+
+    response = await auth_client.post('/transactions/import', params=params, content=content)
+    assert response.status_code == 200
+    result = response.json()
+    assert result['status'] == 'completed'
+    assert (result['offset'], result['created'], result['rejected']) == (4, 1, 3)
+    assert result['errors'] == [{'index': index, 'detail': 'Некорректная сумма.'} for index in range(3)]
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal(4990)
+
+
+@pytest.mark.asyncio
+async def test_transactions_api_import_ofx(auth_client: AsyncClient, test_wallet, test_category, db_session):
+    content = '<OFX><STMTTRN><TRNAMT>-100.00</STMTTRN><STMTTRN><TRNAMT>-20.50</STMTTRN></OFX>'
+    params = {'format': 'ofx', 'wallet_id': test_wallet.id, 'expense_category_id': test_category.id}
+
+    response = await auth_client.post('/transactions/import', params=params, content=content)
+    assert response.status_code == 200
+    assert response.json()['created'] == 2
+
+    await db_session.refresh(test_wallet)
+    assert test_wallet.amount == Decimal('4879.50')
@@ -1,6 +1,7 @@
 from decimal import Decimal
 import pytest
 from httpx import AsyncClient
+from database.models import Users, Wallets
 
 
 @pytest.mark.asyncio
@@ -48,6 +49,29 @@ async def test_wallets_api_get_by_id_fail(auth_client: AsyncClient, test_wallet,
     assert result == {'detail': f'Ошибка сервера: 404: Кошелек с id=2 не был найден.'}
 
 
+@pytest.mark.asyncio
+async def test_wallets_api_get_by_id_other_user(async_client: AsyncClient, db_session):
+    owner = Users(name='owner', passport='1111 111111', login='owner1', password='password1', is_admin=False)
+    other = Users(name='other', passport='2222 222222', login='other2', password='password2', is_admin=False)
+    db_session.add_all([owner, other])
+    await db_session.commit()
+    owner_wallet = Wallets(amount='100', type_of_wallet='Card', user_id=owner.id)
+    other_wallet = Wallets(amount='200', type_of_wallet='Bank', user_id=other.id)
+    db_session.add_all([owner_wallet, other_wallet])
+    await db_session.commit()
+
+    response = await async_client.post('/sign_in/authorization', json={'login': 'owner1', 'password': 'password1'})
+    async_client.cookies.set('my_access_token', response.json()['access_token'], domain='test', path='/')
+
+    response = await async_client.get(f'/wallets/{other_wallet.id}')
+    assert response.status_code == 500
+    assert response.json() == {'detail': f'Ошибка сервера: 404: Кошелек с id={other_wallet.id} не был найден.'}
+
+    response = await async_client.get(f'/wallets/{owner_wallet.id}')
+    assert response.status_code == 200
+    assert response.json()['user_id'] == owner.id
+
+
 @pytest.mark.asyncio
 async def test_wallets_api_create(auth_client: AsyncClient, test_wallet, test_user):
     data = {
@@ -0,0 +1,52 @@
+from decimal import Decimal
+import pytest
+from database.cruds import analytics
+from database.models import Transactions, Categories
+
+
+@pytest.mark.asyncio
+async def test_money_movement(test_transaction, test_wallet, test_category, test_user, db_session):
+    """
+    Тест для получения сумм транзакций пользователя по категориям.
+    """
+    income_category = Categories(name='test_income', is_public=True, type='Income')
+    empty_category = Categories(name='test_empty', is_public=True, type='Expense')
+    db_session.add_all([income_category, empty_category])
+    await db_session.flush()
+    db_session.add(Transactions(amount='1000', category_id=income_category.id, wallet_id=test_wallet.id))
+    await db_session.commit()
+
+    analytics_crud = analytics()
+    result = dict(await analytics_crud.money_movement(db_session, test_user.id))
+
+    assert Decimal(result[test_category.name]) == -Decimal(test_transaction.amount)
+    assert Decimal(result[income_category.name]) == Decimal(1000)
+    assert Decimal(result[empty_category.name]) == 0
+
+
+@pytest.mark.asyncio
+async def test_money_movement_other_user(test_transaction, test_wallet, test_category, test_user, db_session):
+    """
+    Тест того, что транзакции чужих кошельков не попадают в аналитику пользователя.
+    """
+    analytics_crud = analytics()
+    result = dict(await analytics_crud.money_movement(db_session, test_user.id + 1))
+
+    assert Decimal(result[test_category.name]) == 0
+
+
+@pytest.mark.asyncio
+async def test_money_movement_by_period(test_transaction, test_wallet, test_category, test_user, db_session):
+    """
+    Тест для получения сумм транзакций пользователя за период.
+    """
+    from datetime import datetime
+    db_session.add(Transactions(amount='100', category_id=test_category.id, wallet_id=test_wallet.id,
+                                created_at=datetime(2024, 1, 15)))
+    await db_session.commit()
+
+    analytics_crud = analytics()
+    result = dict(await analytics_crud.money_movement(db_session, test_user.id,
+                                                      datetime(2024, 1, 1), datetime(2024, 2, 1)))
+
+    assert Decimal(result[test_category.name]) == Decimal(-100)
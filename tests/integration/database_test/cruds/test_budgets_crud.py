@@ -29,6 +29,19 @@ async def test_get_budget_by_id(test_budget, test_user, test_category, db_sessio
     assert test_budget.id == result.id
 
 
+@pytest.mark.asyncio
+async def test_get_budgets_by_user(test_budget, test_user, test_category, db_session):
+    """
+    Тест для получения бюджетов пользователя.
+    """
+    budget_crud = budget()
+    result = await budget_crud.get_by_user(db_session, test_user.id)
+    assert [budget.id for budget in result] == [test_budget.id]
+
+    result = await budget_crud.get_by_user(db_session, test_user.id + 1)
+    assert result == []
+
+
 @pytest.mark.asyncio
 async def test_add_budget(test_budget, test_user, test_category, db_session):
     """
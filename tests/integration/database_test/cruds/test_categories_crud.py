@@ -29,6 +29,32 @@ async def test_get_category_by_id(test_category, db_session):
     assert test_category.id == result.id
 
 
+@pytest.mark.asyncio
+async def test_get_category_catalogue(test_category, db_session):
+    """
+    Тест для получения справочника категорий из памяти процесса и его сброса после изменения категорий.
+    """
+    from cache import category_catalogue
+    category_crud = category()
+    catalogue = await category_crud.get_catalogue(db_session)
+
+    assert catalogue.by_id[test_category.id].name == test_category.name
+    assert catalogue.by_name[test_category.name].type == 'Expense'
+    assert await category_crud.get_cached(db_session, test_category.id) == catalogue.by_id[test_category.id]
+    assert await category_crud.get_types(db_session, [test_category.id]) == {test_category.id: 'Expense'}
+    assert category_catalogue.loads == 1
+
+    new_category = Categories(name='test_income', is_public=True, type='Income')
+    await category_crud.create(db_session, new_category)
+    await db_session.flush()
+    assert await category_crud.get_catalogue(db_session) is catalogue
+
+    await db_session.commit()
+    catalogue = await category_crud.get_catalogue(db_session)
+    assert catalogue.by_name['test_income'].id == new_category.id
+    assert category_catalogue.loads == 2
+
+
 @pytest.mark.asyncio
 async def test_add_category(test_category, db_session):
     """
@@ -31,6 +31,19 @@ async def test_get_goal_by_id(test_goal, test_user, db_session):
     assert test_goal.id == result.id
 
 
+@pytest.mark.asyncio
+async def test_get_goals_by_user(test_goal, test_user, db_session):
+    """
+    Тест для получения целей пользователя.
+    """
+    goal_crud = goal()
+    result = await goal_crud.get_by_user(db_session, test_user.id)
+    assert [goals.id for goals in result] == [test_goal.id]
+
+    result = await goal_crud.get_by_user(db_session, test_user.id + 1)
+    assert result == []
+
+
 @pytest.mark.asyncio
 async def test_add_goal(test_goal, test_user, db_session):
     """
@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy.exc import IntegrityError
+from database.cruds import idempotency_key
+from database.models import IdempotencyKeys
+
+
+@pytest.mark.asyncio
+async def test_create_and_get_idempotency_key(test_user, db_session):
+    """
+    Тест для сохранения и получения записи по ключу идемпотентности.
+    """
+    idempotency_key_crud = idempotency_key()
+    result = await idempotency_key_crud.create(db_session, IdempotencyKeys(
+        user_id=test_user.id, key='key-1', request_hash='hash', status_code=200, response='{}'
+    ))
+    assert result == {'key': 'key-1', 'user_id': test_user.id, 'status_code': 200}
+
+    record = await idempotency_key_crud.get(db_session, test_user.id, 'key-1')
+    assert record.request_hash == 'hash'
+    assert record.response == '{}'
+    assert await idempotency_key_crud.get(db_session, test_user.id, 'key-2') is None
+
+
+@pytest.mark.asyncio
+async def test_create_duplicate_idempotency_key(test_user, db_session):
+    """
+    Тест того, что повторное сохранение того же ключа завершается ошибкой целостности.
+    """
+    idempotency_key_crud = idempotency_key()
+    await idempotency_key_crud.create(db_session, IdempotencyKeys(
+        user_id=test_user.id, key='key-1', request_hash='hash', response='{}'
+    ))
+    with pytest.raises(IntegrityError):
+        await idempotency_key_crud.create(db_session, IdempotencyKeys(
+            user_id=test_user.id, key='key-1', request_hash='hash', response='{}'
+        ))
+
+
+@pytest.mark.asyncio
+async def test_purge_expired_idempotency_keys(test_user, db_session):
+    """
+    Тест для удаления устаревших записей.
+    """
+    idempotency_key_crud = idempotency_key()
+    db_session.add_all([
+        IdempotencyKeys(user_id=test_user.id, key='old', request_hash='hash', response='{}',
+                        created_at=datetime.now() - timedelta(days=2)),
+        IdempotencyKeys(user_id=test_user.id, key='new', request_hash='hash', response='{}')
+    ])
+    await db_session.commit()
+
+    count = await idempotency_key_crud.purge_expired(db_session, datetime.now() - timedelta(days=1))
+
+    assert count == 1
+    assert await idempotency_key_crud.get(db_session, test_user.id, 'new') is not None
@@ -0,0 +1,75 @@
+from datetime import date, datetime
+from decimal import Decimal
+import pytest
+from database.cruds import rollup, transaction, analytics
+from database.models import Transactions, Categories
+
+
+async def _rollups(db_session, user_id):
+    rollup_crud = rollup()
+    return {(item.category_id, item.month): (Decimal(item.amount), item.count)
+            for item in await rollup_crud.get_by_user(db_session, user_id)}
+
+
+@pytest.mark.asyncio
+async def test_rollups_follow_transactions(test_wallet, test_category, test_user, db_session):
+    """
+    Тест изменения помесячных итогов при добавлении, изменении и удалении транзакций.
+    """
+    transaction_crud = transaction()
+    income_category = Categories(name='test_income', is_public=True, type='Income')
+    db_session.add(income_category)
+    await db_session.commit()
+
+    january = Transactions(amount=100, wallet_id=test_wallet.id, category_id=test_category.id,
+                           created_at=datetime(2024, 1, 10))
+    await transaction_crud.create(db_session, january)
+    await transaction_crud.create_many(db_session, [
+        {'amount': 50, 'wallet_id': test_wallet.id, 'category_id': test_category.id, 'created_at': datetime(2024, 1, 20)},
+        {'amount': 300, 'wallet_id': test_wallet.id, 'category_id': income_category.id,
+         'created_at': datetime(2024, 2, 1)}
+    ])
+    await db_session.commit()
+
+    assert await _rollups(db_session, test_user.id) == {
+        (test_category.id, date(2024, 1, 1)): (Decimal(-150), 2),
+        (income_category.id, date(2024, 2, 1)): (Decimal(300), 1)
+    }
+
+    await transaction_crud.update(db_session, january.id, {'amount': Decimal(70), 'category_id': income_category.id})
+    await db_session.commit()
+    assert await _rollups(db_session, test_user.id) == {
+        (test_category.id, date(2024, 1, 1)): (Decimal(-50), 1),
+        (income_category.id, date(2024, 1, 1)): (Decimal(70), 1),
+        (income_category.id, date(2024, 2, 1)): (Decimal(300), 1)
+    }
+
+    await transaction_crud.delete(db_session, january.id)
+    await db_session.commit()
+    assert await _rollups(db_session, test_user.id) == {
+        (test_category.id, date(2024, 1, 1)): (Decimal(-50), 1),
+        (income_category.id, date(2024, 1, 1)): (Decimal(0), 0),
+        (income_category.id, date(2024, 2, 1)): (Decimal(300), 1)
+    }
+
+    analytics_crud = analytics()
+    result = dict(await analytics_crud.money_movement_rollup(db_session, test_user.id, date(2024, 1, 1), date(2024, 2, 1)))
+    assert Decimal(result[test_category.name]) == Decimal(-50)
+    assert Decimal(result[income_category.name]) == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_rollups(test_transaction, test_wallet, test_category, test_user, db_session):
+    """
+    Тест пересчета помесячных итогов по таблице транзакций (тестовая транзакция добавлена в обход CRUD).
+    """
+    rollup_crud = rollup()
+    assert await _rollups(db_session, test_user.id) == {}
+
+    count = await rollup_crud.rebuild(db_session)
+    await db_session.commit()
+
+    assert count == 1
+    assert await _rollups(db_session, test_user.id) == {
+        (test_category.id, rollup_crud.month_of(test_transaction.created_at)): (-Decimal(test_transaction.amount), 1)
+    }
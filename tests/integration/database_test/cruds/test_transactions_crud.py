@@ -29,6 +29,93 @@ async def test_get_transaction_by_id(test_transaction, test_wallet, test_categor
     assert test_transaction.id == result.id
 
 
+@pytest.mark.asyncio
+async def test_get_transactions_by_user(test_transaction, test_wallet, test_user, db_session):
+    """
+    Тест для получения транзакций пользователя.
+    """
+    transaction_crud = transaction()
+    result = await transaction_crud.get_by_user(db_session, test_user.id)
+    assert [transactions.id for transactions in result] == [test_transaction.id]
+
+    result = await transaction_crud.get_by_user(db_session, test_user.id + 1)
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_get_transaction_by_id_for_user(test_transaction, test_wallet, test_user, db_session):
+    """
+    Тест для получения транзакции по id среди транзакций пользователя.
+    """
+    transaction_crud = transaction()
+    result = await transaction_crud.get_by_id_for_user(db_session, test_transaction.id, test_user.id)
+    assert result is not None
+    assert result.id == test_transaction.id
+
+    result = await transaction_crud.get_by_id_for_user(db_session, test_transaction.id, test_user.id + 1)
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_transactions_page(test_transaction, test_wallet, test_category, test_user, db_session):
+    """
+    Тест для получения страницы транзакций.
+    """
+    db_session.add_all([Transactions(amount=amount, wallet_id=test_wallet.id, category_id=test_category.id)
+                        for amount in (100, 200)])
+    await db_session.commit()
+
+    transaction_crud = transaction()
+    result = await transaction_crud.get_page(db_session, user_id=test_user.id, limit=2)
+    assert [transactions.id for transactions in result] == [test_transaction.id, test_transaction.id + 1]
+
+    result = await transaction_crud.get_page(db_session, user_id=test_user.id, after_id=result[-1].id)
+    assert [transactions.id for transactions in result] == [test_transaction.id + 2]
+
+    result = await transaction_crud.get_page(db_session, user_id=test_user.id + 1)
+    assert result == []
+
+    result = await transaction_crud.get_page(db_session, wallet_id=test_wallet.id, max_amount=150)
+    assert [transactions.amount for transactions in result] == [100]
+
+
+@pytest.mark.asyncio
+async def test_add_many_transactions(test_transaction, test_wallet, test_category, db_session):
+    """
+    Тест для добавления пачки транзакций одним запросом.
+    """
+    transaction_crud = transaction()
+    rows = [{'amount': amount, 'wallet_id': test_wallet.id, 'category_id': test_category.id} for amount in (10, 20, 30)]
+
+    ids = await transaction_crud.create_many(db_session, rows)
+
+    assert len(ids) == 3
+    for transaction_id, row in zip(ids, rows):
+        created = await transaction_crud.get_by_id(db_session, transaction_id)
+        assert created.amount == row['amount']
+    assert await transaction_crud.create_many(db_session, []) == []
+
+
+@pytest.mark.asyncio
+async def test_get_transactions_page_by_period(test_transaction, test_wallet, test_category, test_user, db_session):
+    """
+    Тест для получения транзакций пользователя за период.
+    """
+    from datetime import datetime
+    transaction_crud = transaction()
+    db_session.add_all([
+        Transactions(amount=amount, wallet_id=test_wallet.id, category_id=test_category.id, created_at=created_at)
+        for amount, created_at in ((10, datetime(2024, 1, 31)), (20, datetime(2024, 2, 1)), (30, datetime(2024, 3, 1)))
+    ])
+    await db_session.commit()
+
+    result = await transaction_crud.get_page(db_session, user_id=test_user.id,
+                                             created_from=datetime(2024, 2, 1), created_to=datetime(2024, 3, 1))
+
+    assert [item.amount for item in result] == [20]
+    assert test_transaction.created_at is not None
+
+
 @pytest.mark.asyncio
 async def test_add_transaction(test_transaction, test_wallet, test_category, db_session):
     """
@@ -87,6 +174,17 @@ async def test_update_transaction(test_transaction, db_session, changes):
     assert updated_transaction.id == test_transaction.id
 
 
+@pytest.mark.asyncio
+async def test_update_transaction_not_found(db_session):
+    """
+    Тест для обновления несуществующей транзакции.
+    """
+    from sqlalchemy.exc import NoResultFound
+
+    with pytest.raises(NoResultFound):
+        await transaction().update(db_session, 999, {'amount': 100})
+
+
 @pytest.mark.asyncio
 async def test_delete_transaction(test_transaction, db_session):
     """
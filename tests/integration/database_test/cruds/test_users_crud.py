@@ -18,6 +18,22 @@ async def test_get_all_users(test_user, db_session):
     assert test_user.id in users_ids
 
 
+@pytest.mark.asyncio
+async def test_get_users_columns(test_user, db_session):
+    """
+    Тест для получения только переданных колонок пользователей.
+    """
+    user_crud = user()
+    result = await user_crud.get_all(db_session, columns=(Users.id, Users.login))
+
+    assert [tuple(users) for users in result] == [(test_user.id, test_user.login)]
+    assert 'password' not in result[0]._fields
+
+    result = await user_crud.get_by_id(db_session, test_user.id, columns=(Users.name,))
+    assert result.name == test_user.name
+    assert await user_crud.get_by_id(db_session, test_user.id + 1, columns=(Users.name,)) is None
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_id(test_user, db_session):
     """
@@ -126,3 +142,44 @@ async def test_delete_user(test_user, db_session):
     deleted_user = (await db_session.execute(query)).scalar_one_or_none()
 
     assert deleted_user is None
+
+
+@pytest.mark.asyncio
+async def test_update_user_invalidates_principal_cache(test_user, db_session):
+    """
+    Тест сброса кэша авторизованного пользователя при обновлении записи.
+    """
+    from cache import principal_cache
+
+    await principal_cache.set(test_user.id, {'user_id': test_user.id, 'is_admin': True})
+    await user().update(db_session, test_user.id, {'is_admin': False})
+    assert await principal_cache.get(test_user.id) is not None
+
+    await db_session.commit()
+    assert await principal_cache.get(test_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_update_user_rollback_keeps_token_version(test_user, db_session):
+    """
+    Тест отката изменения прав: версия токенов в реестре не меняется.
+    """
+    from cache import token_versions
+
+    user_id = test_user.id
+    await token_versions.clear()
+    await user().update(db_session, user_id, {'is_admin': False})
+    await db_session.rollback()
+
+    assert await token_versions.get(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_update_user_not_found(db_session):
+    """
+    Тест обновления несуществующего пользователя.
+    """
+    from sqlalchemy.exc import NoResultFound
+
+    with pytest.raises(NoResultFound):
+        await user().update(db_session, 999, {'is_admin': False})
@@ -29,6 +29,44 @@ async def test_get_wallet_by_id(test_wallet, test_user, db_session):
     assert test_wallet.id == result.id
 
 
+@pytest.mark.asyncio
+async def test_get_wallets_by_user(test_wallet, test_user, db_session):
+    """
+    Тест для получения кошельков пользователя.
+    """
+    wallet_crud = wallet()
+    result = await wallet_crud.get_by_user(db_session, test_user.id)
+    assert [wallets.id for wallets in result] == [test_wallet.id]
+
+    result = await wallet_crud.get_by_user(db_session, test_user.id, columns=(Wallets.id, Wallets.amount))
+    assert [tuple(wallets) for wallets in result] == [(test_wallet.id, test_wallet.amount)]
+
+    result = await wallet_crud.get_by_user(db_session, test_user.id + 1)
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_wallet_exists_for_user(test_wallet, test_user, db_session):
+    """
+    Тест для проверки принадлежности кошелька пользователю.
+    """
+    wallet_crud = wallet()
+    assert await wallet_crud.exists_for_user(db_session, test_wallet.id, test_user.id) is True
+    assert await wallet_crud.exists_for_user(db_session, test_wallet.id, test_user.id + 1) is False
+    assert await wallet_crud.get_by_id_for_user(db_session, test_wallet.id, test_user.id + 1) is None
+
+
+@pytest.mark.asyncio
+async def test_get_wallet_ids(test_wallet, test_user, db_session):
+    """
+    Тест для получения ключей существующих кошельков пользователя из набора.
+    """
+    wallet_crud = wallet()
+    assert await wallet_crud.get_ids(db_session, [test_wallet.id, test_wallet.id + 1], test_user.id) == {test_wallet.id}
+    assert await wallet_crud.get_ids(db_session, [test_wallet.id], test_user.id + 1) == set()
+    assert await wallet_crud.get_ids(db_session, [test_wallet.id]) == {test_wallet.id}
+
+
 @pytest.mark.asyncio
 async def test_add_wallet(test_wallet, test_user, db_session):
     """
@@ -106,3 +144,14 @@ async def test_delete_wallet(test_wallet, db_session):
     deleted_wallet = (await db_session.execute(query)).scalar_one_or_none()
 
     assert deleted_wallet is None
+
+
+@pytest.mark.asyncio
+async def test_update_wallet_not_found(db_session):
+    """
+    Тест для обновления несуществующего кошелька.
+    """
+    from sqlalchemy.exc import NoResultFound
+
+    with pytest.raises(NoResultFound):
+        await wallet().update(db_session, 999, {'amount': 100})
@@ -0,0 +1,113 @@
+import os
+import re
+from datetime import date
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from database.cruds import TransactionsCRUD, WalletsCRUD, BudgetsCRUD, GoalsCRUD
+from database.models import Users, Categories, Wallets, Transactions, Budgets, Goals
+
+DATABASE_URLS = ['sqlite']
+if os.getenv('TEST_POSTGRES_URL'):
+    DATABASE_URLS.append(os.getenv('TEST_POSTGRES_URL'))
+
+USERS = 200
+WALLETS_PER_USER = 5
+TRANSACTIONS = 20000
+USER_SCOPED_TABLES = 'transactions|wallets|budgets|goals'
+
+
+@pytest.fixture(params=DATABASE_URLS)
+async def seeded_engine(request, tmp_path):
+    """
+    Отдельная БД с данными нескольких сотен пользователей и собранной статистикой для планировщика.
+
+    По умолчанию используется файл SQLite, адрес PostgreSQL задается переменной окружения TEST_POSTGRES_URL.
+    """
+    from database.database import Base
+
+    if request.param == 'sqlite':
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'indexes.db'}")
+    else:
+        engine = create_async_engine(request.param)
+
+    wallets = USERS * WALLETS_PER_USER
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Users), [
+            {'id': user_id, 'name': 'name', 'passport': f'1234 {user_id:06d}', 'login': f'login{user_id}',
+             'password': 'password1'}
+            for user_id in range(1, USERS + 1)
+        ])
+        await conn.execute(insert(Categories), [
+            {'id': category_id, 'name': f'category{category_id}', 'is_public': True, 'type': 'Expense'}
+            for category_id in range(1, 11)
+        ])
+        await conn.execute(insert(Wallets), [
+            {'id': wallet_id, 'user_id': (wallet_id - 1) // WALLETS_PER_USER + 1, 'amount': 100, 'type_of_wallet': 'Card'}
+            for wallet_id in range(1, wallets + 1)
+        ])
+        await conn.execute(insert(Transactions), [
+            {'amount': 1, 'wallet_id': index % wallets + 1, 'category_id': index % 10 + 1}
+            for index in range(TRANSACTIONS)
+        ])
+        await conn.execute(insert(Budgets), [
+            {'name': 'budget', 'amount': 1, 'category_id': index % 10 + 1, 'user_id': index % USERS + 1}
+            for index in range(USERS * 5)
+        ])
+        await conn.execute(insert(Goals), [
+            {'name': 'goal', 'cost': 1, 'actual_amount': 0, 'deadline': date(2030, 1, 1), 'user_id': index % USERS + 1}
+            for index in range(USERS * 5)
+        ])
+        await conn.execute(text('ANALYZE'))
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+async def _explain(engine, statement: str, parameters) -> list[str]:
+    async with engine.connect() as conn:
+        if engine.dialect.name == 'sqlite':
+            rows = (await conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)).all()
+            return [row[-1] for row in rows]
+        rows = (await conn.exec_driver_sql('EXPLAIN ' + statement, parameters)).all()
+        return [row[0] for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_user_scoped_queries_use_indexes(seeded_engine):
+    """
+    Тест планов запросов, ограниченных пользователем: ни одна из таблиц пользователя не читается целиком.
+    """
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    user_id = 7
+    wallet_id = (user_id - 1) * WALLETS_PER_USER + 1
+    event.listen(seeded_engine.sync_engine, 'before_cursor_execute', capture)
+    try:
+        async with async_sessionmaker(seeded_engine)() as db:
+            await TransactionsCRUD.get_page(db, user_id=user_id)
+            await TransactionsCRUD.get_page(db, user_id=user_id, wallet_id=wallet_id)
+            await TransactionsCRUD.get_by_id_for_user(db, 5, user_id)
+            await WalletsCRUD.get_by_user(db, user_id)
+            await WalletsCRUD.exists_for_user(db, wallet_id, user_id)
+            await BudgetsCRUD.get_by_user(db, user_id)
+            await GoalsCRUD.get_by_user(db, user_id)
+    finally:
+        event.remove(seeded_engine.sync_engine, 'before_cursor_execute', capture)
+
+    assert len(statements) == 7
+    if seeded_engine.dialect.name == 'sqlite':
+        full_scan = re.compile(rf'^SCAN ({USER_SCOPED_TABLES})$')
+    else:
+        full_scan = re.compile(rf'Seq Scan on ({USER_SCOPED_TABLES})\b')
+    for statement, parameters in statements:
+        plan = await _explain(seeded_engine, statement, parameters)
+        assert not [line for line in plan if full_scan.search(line.strip())], (statement, plan)
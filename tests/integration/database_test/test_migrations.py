@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import insert, inspect, select, text, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from database.migrations import backfill_by_id_range, id_ranges
+from database.models import Users, Categories, Wallets, Transactions
+
+ALEMBIC_INI = Path(__file__).parents[3] / 'alembic.ini'
+
+
+def _alembic_config(url: str) -> Config:
+    alembic_config = Config(ALEMBIC_INI)
+    alembic_config.set_main_option('sqlalchemy.url', url)
+    alembic_config.attributes['configure_logger'] = False
+    return alembic_config
+
+
+def test_id_ranges():
+    """
+    Тест для разбиения диапазона id на пачки.
+    """
+    assert list(id_ranges(1, 5, 2)) == [(1, 3), (3, 5), (5, 6)]
+    assert list(id_ranges(3, 3, 10)) == [(3, 4)]
+
+
+@pytest.mark.asyncio
+async def test_backfill_by_id_range(tmp_path):
+    """
+    Тест для заполнения колонки пачками по диапазонам id: заполняются только отобранные записи.
+    """
+    from database.database import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'backfill.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Users), [{'id': 1, 'name': 'name', 'passport': '1234 567890', 'login': 'login',
+                                            'password': 'password1'}])
+        await conn.execute(insert(Categories), [{'id': 1, 'name': 'category', 'is_public': True, 'type': 'Expense'}])
+        await conn.execute(insert(Wallets), [{'id': 1, 'user_id': 1, 'amount': 100, 'type_of_wallet': 'Card'}])
+        await conn.execute(insert(Transactions), [{'amount': 1, 'wallet_id': 1, 'category_id': 1} for _ in range(7)])
+        await conn.execute(update(Transactions).where(Transactions.id != 4).values(created_at=None))
+
+    session_maker = async_sessionmaker(engine)
+    created_at = datetime(2024, 1, 1)
+    try:
+        count = await backfill_by_id_range(session_maker, Transactions, {'created_at': created_at},
+                                           Transactions.created_at.is_(None), batch_size=3)
+        async with session_maker() as db:
+            missing = (await db.execute(select(Transactions.id).where(Transactions.created_at.is_(None)))).all()
+            filled = (await db.execute(select(Transactions.id).where(Transactions.created_at == created_at))).all()
+    finally:
+        await engine.dispose()
+
+    assert count == 6
+    assert missing == []
+    assert len(filled) == 6
+
+
+def test_migrations_upgrade_existing_data(tmp_path):
+    """
+    Тест для применения миграций к БД с исходной схемой и данными: время создания транзакций
+    и версия токенов пользователей заполняются, итоговая схема совпадает с моделями, откат удаляет все таблицы.
+    """
+    path = tmp_path / 'migrations.db'
+    alembic_config = _alembic_config(f'sqlite+aiosqlite:///{path}')
+
+    command.upgrade(alembic_config, '0001')
+
+    async def seed():
+        engine = create_async_engine(f'sqlite+aiosqlite:///{path}')
+        async with engine.begin() as conn:
+            await conn.execute(text("INSERT INTO users (id, name, passport, is_admin) VALUES (1, 'name', '1234 567890', 0)"))
+            await conn.execute(text("INSERT INTO categories (id, name, is_public, type) VALUES (1, 'category', 1, 'Expense')"))
+            await conn.execute(text("INSERT INTO wallets (id, type_of_wallet, user_id, amount) VALUES (1, 'Card', 1, 0)"))
+            for _ in range(5):
+                await conn.execute(text('INSERT INTO transactions (amount, wallet_id, category_id) VALUES (1, 1, 1)'))
+        await engine.dispose()
+
+    async def fetch(callback):
+        engine = create_async_engine(f'sqlite+aiosqlite:///{path}')
+        async with engine.connect() as conn:
+            result = await conn.run_sync(callback)
+        await engine.dispose()
+        return result
+
+    asyncio.run(seed())
+    command.upgrade(alembic_config, 'head')
+    command.check(alembic_config)
+    missing = asyncio.run(fetch(
+        lambda conn: conn.execute(text('SELECT count(*) FROM transactions WHERE created_at IS NULL')).scalar()
+    ))
+    assert missing == 0
+    token_versions = asyncio.run(fetch(lambda conn: conn.execute(text('SELECT token_version FROM users')).all()))
+    assert token_versions == [(0,)]
+
+    command.downgrade(alembic_config, 'base')
+    assert asyncio.run(fetch(lambda conn: inspect(conn).get_table_names())) == ['alembic_version']
@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.requests import Request
+from database import database
+from database.replicas import ReplicaSet
+
+
+@pytest.fixture
+async def replica_engines(tmp_path):
+    """
+    Заглушки основной БД и двух реплик на файлах SQLite, каждая знает свое имя.
+    """
+    engines = []
+    for name in ('primary', 'first', 'second'):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE replica (name TEXT)"))
+            await conn.execute(text("INSERT INTO replica VALUES (:name)"), {'name': name})
+        engines.append(engine)
+    try:
+        yield engines
+    finally:
+        for engine in engines:
+            await engine.dispose()
+
+
+def _request(cookie: str = '') -> Request:
+    headers = [(b'cookie', cookie.encode())] if cookie else []
+    return Request({'type': 'http', 'method': 'GET', 'path': '/', 'headers': headers})
+
+
+async def _read_name(request: Request):
+    dependency = database.get_read_db(request)
+    db = await anext(dependency)
+    try:
+        return (await db.execute(text("SELECT name FROM replica"))).scalar()
+    finally:
+        await dependency.aclose()
+
+
+@pytest.mark.asyncio
+async def test_round_robin(replica_engines):
+    """
+    Тест выбора реплик по очереди.
+    """
+    replicas = ReplicaSet(replica_engines[1:])
+
+    assert [await replicas.choose() for _ in range(3)] == [0, 1, 0]
+
+
+@pytest.mark.asyncio
+async def test_least_connections(replica_engines):
+    """
+    Тест выбора реплики с наименьшим числом открытых сессий.
+    """
+    replicas = ReplicaSet(replica_engines[1:], strategy='least_connections')
+
+    replicas.acquire(0)
+    assert await replicas.choose() == 1
+    replicas.acquire(1)
+    replicas.acquire(1)
+    assert await replicas.choose() == 0
+    replicas.release(1)
+    replicas.release(1)
+    replicas.release(0)
+    assert replicas.in_use == [0, 0]
+
+
+@pytest.mark.asyncio
+async def test_health_check(replica_engines, tmp_path):
+    """
+    Тест исключения недоступной реплики и чтения с основной БД, если доступных реплик нет.
+    """
+    broken = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replicas = ReplicaSet([replica_engines[1], broken], health_interval=0)
+
+    assert [await replicas.choose() for _ in range(2)] == [0, 0]
+    assert replicas.healthy == {0}
+
+    replicas.mark_failed(0)
+    replicas.health_interval = 60
+    assert await replicas.choose() is None
+    await broken.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_read_db(replica_engines, monkeypatch):
+    """
+    Тест чтения через get_read_db: чередование реплик и чтение с основной БД после изменения данных.
+    """
+    primary, *replica_engines = replica_engines
+    monkeypatch.setattr(database, 'async_read_session', async_sessionmaker(primary))
+    monkeypatch.setattr(database, 'replicas', ReplicaSet(replica_engines))
+
+    assert [await _read_name(_request()) for _ in range(2)] == ['first', 'second']
+    assert await _read_name(_request(f'{database.DB_READ_PRIMARY_COOKIE}=1')) == 'primary'
+    assert database.replicas.stats()['reads'] == [1, 1]
+    assert database.replicas.stats()['primary_reads'] == 1
+    assert database.replicas.in_use == [0, 0]
@@ -0,0 +1,115 @@
+import asyncio
+import os
+from decimal import Decimal
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from database.cruds import wallet
+from database.models import Users, Wallets
+
+DATABASE_URLS = ['sqlite']
+if os.getenv('TEST_POSTGRES_URL'):
+    DATABASE_URLS.append(os.getenv('TEST_POSTGRES_URL'))
+
+
+@pytest.fixture(params=DATABASE_URLS)
+async def concurrent_engine(request, tmp_path):
+    """
+    Отдельная БД, к которой параллельно подключается несколько сессий.
+
+    По умолчанию используется файл SQLite, адрес PostgreSQL задается переменной окружения TEST_POSTGRES_URL.
+    """
+    from database.database import Base
+
+    if request.param == 'sqlite':
+        url = f"sqlite+aiosqlite:///{tmp_path / 'concurrency.db'}"
+        engine = create_async_engine(url, connect_args={'timeout': 30})
+    else:
+        engine = create_async_engine(request.param, pool_size=20)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield engine
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+async def _create_wallets(session_maker, *amounts):
+    async with session_maker() as session:
+        user = Users(name='nametest', passport='1234 567890', login='string1', password='string1')
+        session.add(user)
+        await session.flush()
+        wallets = [Wallets(amount=amount, type_of_wallet='Card', user_id=user.id) for amount in amounts]
+        session.add_all(wallets)
+        await session.commit()
+        return [wallets.id for wallets in wallets]
+
+
+async def _balances(session_maker, wallet_ids):
+    async with session_maker() as session:
+        data = await session.execute(select(Wallets.amount).where(Wallets.id.in_(wallet_ids)).order_by(Wallets.id))
+        return data.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_parallel_withdrawals(concurrent_engine):
+    """
+    Тест параллельных списаний: баланс не уходит в минус и ни одно списание не теряется.
+    """
+    session_maker = async_sessionmaker(concurrent_engine, expire_on_commit=False)
+    wallet_id, = await _create_wallets(session_maker, 1000)
+
+    async def withdraw():
+        async with session_maker() as session:
+            balance = await wallet.change_amount(session, wallet_id, Decimal(-30))
+            await session.commit()
+            return balance is not None
+
+    results = await asyncio.gather(*(withdraw() for _ in range(50)))
+
+    assert sum(results) == 33
+    assert await _balances(session_maker, [wallet_id]) == [Decimal(10)]
+
+
+@pytest.mark.asyncio
+async def test_parallel_transfers(concurrent_engine):
+    """
+    Тест параллельных встречных переводов: общая сумма средств сохраняется.
+    """
+    session_maker = async_sessionmaker(concurrent_engine, expire_on_commit=False)
+    first_id, second_id = await _create_wallets(session_maker, 100, 50)
+
+    async def transfer(from_id, to_id, amount):
+        async with session_maker() as session:
+            balances = await wallet.transfer(session, from_id, to_id, Decimal(amount))
+            await session.commit()
+            return balances
+
+    tasks = []
+    for _ in range(20):
+        tasks.append(transfer(first_id, second_id, 15))
+        tasks.append(transfer(second_id, first_id, 10))
+    await asyncio.gather(*tasks)
+
+    balances = await _balances(session_maker, [first_id, second_id])
+    assert sum(balances) == 150
+    assert all(balance >= 0 for balance in balances)
+
+
+@pytest.mark.asyncio
+async def test_transfer_insufficient_funds(concurrent_engine):
+    """
+    Тест перевода при недостатке средств: зачисление отменяется, балансы не меняются.
+    """
+    session_maker = async_sessionmaker(concurrent_engine, expire_on_commit=False)
+    first_id, second_id = await _create_wallets(session_maker, 100, 50)
+
+    async with session_maker() as session:
+        assert await wallet.transfer(session, second_id, first_id, Decimal(60)) is None
+        await session.commit()
+
+    assert await _balances(session_maker, [first_id, second_id]) == [Decimal(100), Decimal(50)]
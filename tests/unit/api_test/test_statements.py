@@ -0,0 +1,79 @@
+from decimal import Decimal
+import pytest
+
+from api.ingest import StatementMapping
+from api.statements import iter_csv_rows, iter_ofx_rows
+
+
+async def _chunks(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def _collect(rows):
+    return [row async for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_rows():
+    """
+    Тест чтения CSV, разбитого на части посреди строк и многобайтовых символов.
+    """
+    data = '﻿amount;category\r\n100.50;"Еда; кафе"\r\n\r\n-20;1\r\n'.encode()
+
+    rows = await _collect(iter_csv_rows(_chunks(data), delimiter=';'))
+
+    assert rows == [{'amount': '100.50', 'category': 'Еда; кафе'}, {'amount': '-20', 'category': '1'}]
+
+
+@pytest.mark.asyncio
+async def test_iter_csv_rows_multiline_values():
+    """
+    Тест чтения CSV со значениями в кавычках, содержащими переводы строк и кавычки.
+    """
+    data = 'amount,category\r\n100,"Еда\r\nи ""кафе"""\r\n-20,1\r\n'.encode()
+
+    rows = await _collect(iter_csv_rows(_chunks(data, size=3)))
+
+    assert rows == [{'amount': '100', 'category': 'Еда\nи "кафе"'}, {'amount': '-20', 'category': '1'}]
+
+
+@pytest.mark.asyncio
+async def test_iter_ofx_rows():
+    """
+    Тест чтения операций OFX с закрывающими тегами и без них.
+    """
+    data = b'''OFXHEADER:100
+<OFX><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<TRNAMT>-12.50<NAME>Shop</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT</TRNTYPE>
+<TRNAMT>1000.00</TRNAMT>
+</STMTTRN>
+</BANKTRANLIST></OFX>'''
+
+    rows = await _collect(iter_ofx_rows(_chunks(data)))
+
+    assert rows == [{'trntype': 'DEBIT', 'trnamt': '-12.50', 'name': 'Shop'}, {'trntype': 'CREDIT', 'trnamt': '1000.00'}]
+
+
+def test_statement_mapping():
+    """
+    Тест сопоставления строк выписки с полями транзакций.
+    """
+    mapping = StatementMapping(wallet_id=1, income_category_id=2, expense_category_id=3, category_ids={'Еда': 4})
+
+    transaction = mapping.to_transaction({'amount': '-1 200,50'})
+    assert (transaction.amount, transaction.wallet_id, transaction.category_id) == (Decimal('1200.50'), 1, 3)
+
+    transaction = mapping.to_transaction({'amount': '10', 'wallet_id': '5', 'category': 'Еда'})
+    assert (transaction.amount, transaction.wallet_id, transaction.category_id) == (Decimal(10), 5, 4)
+
+    with pytest.raises(ValueError, match='Некорректная сумма.'):
+        mapping.to_transaction({'amount': 'abc'})
+    with pytest.raises(ValueError, match='Такая категория не найдена.'):
+        mapping.to_transaction({'amount': '10', 'category': 'Транспорт'})
+    with pytest.raises(ValueError, match='Количество знаков после запятой не может превышать 2.'):
+        mapping.to_transaction({'amount': '10.001'})
+    with pytest.raises(ValueError, match='Не указана категория.'):
+        StatementMapping(wallet_id=1).to_transaction({'amount': '10'})
@@ -0,0 +1,70 @@
+from sqlalchemy.orm import Session
+from cache import AnalyticsCache, GLOBAL_SCOPE, analytics_cache
+
+
+def test_analytics_cache_versions():
+    """
+    Тест смены ключа результата при смене версии данных пользователя или общих данных.
+    """
+    cache = AnalyticsCache(maxsize=10, ttl=60)
+    key = cache.key(1, '/analytics/money_movement?')
+
+    assert cache.key(1, '/analytics/money_movement?') == key
+    assert cache.key(2, '/analytics/money_movement?') != key
+
+    cache.bump(1)
+    assert cache.key(1, '/analytics/money_movement?') != key
+
+    key = cache.key(1, '/analytics/money_movement?')
+    cache.bump(GLOBAL_SCOPE)
+    assert cache.key(1, '/analytics/money_movement?') != key
+
+
+def test_analytics_cache_changed_within():
+    """
+    Тест времени последней смены версии: создание версии при первом обращении сменой не считается.
+    """
+    cache = AnalyticsCache(maxsize=10, ttl=60)
+    cache.key(1, '/analytics/money_movement?')
+    assert not cache.changed_within(1, 60)
+
+    cache.bump(1)
+    assert cache.changed_within(1, 60)
+    assert not cache.changed_within(1, 0)
+    assert not cache.changed_within(2, 60)
+
+    cache.bump(GLOBAL_SCOPE)
+    assert cache.changed_within(2, 60)
+
+
+def test_analytics_cache_stats():
+    """
+    Тест счетчиков попаданий и промахов.
+    """
+    cache = AnalyticsCache(maxsize=10, ttl=60)
+    key = cache.key(1, '/analytics/budgets_state?')
+
+    assert cache.get(key) is None
+    cache.set(key, {'food': {}})
+    assert cache.get(key) == {'food': {}}
+
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'not_modified': 0, 'hit_rate': 0.5, 'size': 1}
+
+
+def test_analytics_cache_bump_after_commit():
+    """
+    Тест смены версии только после фиксации транзакции БД.
+    """
+    analytics_cache.clear()
+    key = analytics_cache.key(1, '/analytics/goal_progress?')
+
+    session = Session()
+    analytics_cache.mark_dirty(session, 1)
+    assert analytics_cache.key(1, '/analytics/goal_progress?') == key
+    session.rollback()
+    assert analytics_cache.key(1, '/analytics/goal_progress?') == key
+
+    analytics_cache.mark_dirty(session, 1)
+    session.commit()
+    assert analytics_cache.key(1, '/analytics/goal_progress?') != key
+    session.close()
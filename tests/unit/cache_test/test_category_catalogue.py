@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+import pytest
+from cache import CategoryCatalogue, CategoryIndex, MemoryBackend
+
+categories = [
+    SimpleNamespace(id=2, name='food', is_public=True, type='Expense'),
+    SimpleNamespace(id=1, name='salary', is_public=True, type='Income'),
+]
+
+
+def test_category_index():
+    """
+    Тест поиска по неизменяемому снимку справочника.
+    """
+    index = CategoryIndex(categories)
+
+    assert [entry.id for entry in index.categories] == [1, 2]
+    assert index.by_name['food'].id == 2
+    assert index.by_id[1].type == 'Income'
+    assert 3 not in index
+    with pytest.raises(TypeError):
+        index.by_id[3] = index.by_id[1]
+
+
+@pytest.mark.asyncio
+async def test_category_catalogue_stale():
+    """
+    Тест условий перезагрузки справочника.
+    """
+    catalogue = CategoryCatalogue(ttl=60)
+    assert await catalogue.is_stale()
+
+    catalogue.replace(categories)
+    assert not await catalogue.is_stale([1, 2], ['food'])
+    assert not await catalogue.is_stale([3])
+    catalogue.check_interval = 0
+    assert await catalogue.is_stale([3])
+    assert await catalogue.is_stale(names=['transport'])
+
+    calls = []
+    catalogue.add_hook(lambda: calls.append(True))
+    catalogue.invalidate()
+    assert catalogue.index is None
+    assert calls == [True]
+
+
+@pytest.mark.asyncio
+async def test_category_catalogue_shared_version():
+    """
+    Тест перезагрузки справочника после смены общей версии другим процессом.
+    """
+    backend = MemoryBackend()
+    first, second = CategoryCatalogue(ttl=60, check_interval=0), CategoryCatalogue(ttl=60, check_interval=0)
+    first.use_backend(backend)
+    second.use_backend(backend)
+    first.replace(categories)
+    second.replace(categories)
+
+    await first.publish()
+
+    assert not await first.is_stale()
+    assert await second.is_stale()
+    second.replace(categories)
+    assert not await second.is_stale()
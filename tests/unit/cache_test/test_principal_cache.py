@@ -0,0 +1,110 @@
+import pytest
+from cache import TTLCache, MemoryBackend, RedisBackend, PrincipalCache, TokenVersionRegistry, check_shared_backends
+
+
+class FakeRedis:
+    """
+    Заглушка клиента Redis, хранящая значения в словаре.
+    """
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+
+principal = {'user_id': 1, 'login': 'string1', 'name': 'nametest', 'passport': '1234 567890', 'is_admin': True}
+
+
+def test_ttl_cache_lru():
+    """
+    Тест вытеснения давно не используемых записей.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_ttl_cache_expired():
+    """
+    Тест истечения времени жизни записи.
+    """
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1, ttl=-1)
+
+    assert cache.get('a') is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_hits_and_invalidation():
+    """
+    Тест счетчиков попаданий/промахов и инвалидации кэша.
+    """
+    cache = PrincipalCache(MemoryBackend())
+
+    assert await cache.get('1') is None
+    await cache.set('1', principal)
+    assert await cache.get(1) == principal
+    await cache.invalidate(1)
+    assert await cache.get('1') is None
+
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'hit_rate': 0.3333}
+
+
+@pytest.mark.asyncio
+async def test_principal_cache_redis_backend():
+    """
+    Тест общего хранилища с протоколом Redis.
+    """
+    client = FakeRedis()
+    cache = PrincipalCache(MemoryBackend())
+    cache.use_backend(RedisBackend(client, prefix='principal'))
+
+    await cache.set('1', principal)
+    assert 'principal:1' in client.data
+    assert await cache.get('1') == principal
+
+    await cache.invalidate('1')
+    assert client.data == {}
+
+
+@pytest.mark.asyncio
+async def test_token_versions_load_on_miss():
+    """
+    Тест проверки отзыва при промахе реестра: версия загружается из БД, пользователь без версии считается удаленным.
+    """
+    registry = TokenVersionRegistry(MemoryBackend())
+
+    async def load():
+        return 2
+
+    async def missing():
+        return None
+
+    assert await registry.is_revoked('1', 1, load=load)
+    assert await registry.get('1') == 2
+    assert not await registry.is_revoked('1', 2)
+    assert await registry.is_revoked('2', 0, load=missing)
+
+
+def test_check_shared_backends():
+    """
+    Тест запуска нескольких процессов без общего хранилища.
+    """
+    check_shared_backends(1)
+    with pytest.raises(RuntimeError):
+        check_shared_backends(2)
@@ -0,0 +1,50 @@
+from decimal import Decimal
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from shchemas import Money, MoneyMinorUnits, to_minor_units, from_minor_units
+
+money = TypeAdapter(Money)
+minor_units = TypeAdapter(MoneyMinorUnits)
+
+
+def test_money():
+    """
+    Тест проверки точности и величины денежной суммы.
+    """
+    assert money.validate_python('99999999.99') == Decimal('99999999.99')
+    assert money.validate_python(100) == Decimal(100)
+    assert money.validate_python('10.500') == Decimal('10.5')
+    assert money.validate_python('0.00') == 0
+
+    with pytest.raises(ValidationError, match='Количество знаков после запятой не может превышать 2.'):
+        money.validate_python('10.501')
+    with pytest.raises(ValidationError, match='Слишком большая сумма.'):
+        money.validate_python('100000000')
+    with pytest.raises(ValidationError, match='Слишком большая сумма.'):
+        money.validate_python('100000000.12')
+    with pytest.raises(ValidationError):
+        money.validate_python('-1')
+    with pytest.raises(ValidationError):
+        money.validate_python('NaN')
+
+
+def test_minor_units():
+    """
+    Тест перевода сумм в копейки и обратно.
+    """
+    assert to_minor_units(Decimal('12.34')) == 1234
+    assert to_minor_units(5) == 500
+    assert to_minor_units(0.1) == 10
+    assert to_minor_units('-7.5') == -750
+    assert from_minor_units(1234) == Decimal('12.34')
+    assert minor_units.validate_python('99.9') == 9990
+
+    with pytest.raises(ValidationError):
+        minor_units.validate_python('0.001')
+    for value in ('abc', None, [1]):
+        with pytest.raises(ValidationError, match='Сумма должна быть числом.'):
+            minor_units.validate_python(value)
+    for value in ('nan', 'inf', '-Infinity', float('inf'), Decimal('sNaN')):
+        with pytest.raises(ValidationError, match='Сумма должна быть конечным числом.'):
+            minor_units.validate_python(value)
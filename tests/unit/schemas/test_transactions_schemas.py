@@ -36,3 +36,14 @@ def test_transaction_post_schema():
     """
     with pytest.raises(ValidationError):
         TransactionPostSchema()
+
+
+def test_transaction_get_schema_from_attributes():
+    """
+    Тест получения схемы из атрибутов ORM-модели без копирования __dict__.
+    """
+    from database.models import Transactions
+
+    transaction = TransactionGetSchema.model_validate(Transactions(**data))
+    assert transaction.id == 1
+    assert transaction.amount == 500